@@ -1,33 +1,296 @@
 """UI analysis module for extracting page structure and elements."""
 
+import asyncio
+import functools
+import hashlib
+import html as html_lib
+import io
 import json
+import os
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+try:
+    # Optional fast path for link discovery (pip install frontend-tester[speedups])
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 from frontend_tester.ai.client import LLMClient
 from frontend_tester.ai.prompts.ui_analysis import (
     ANALYZE_UI_SYSTEM_PROMPT,
-    ANALYZE_UI_USER_PROMPT,
     EXTRACT_ELEMENTS_SYSTEM_PROMPT,
     EXTRACT_ELEMENTS_USER_PROMPT,
+    SHARED_LAYOUT_CONTENT_MARKER,
+    render_analyze_ui_batch_page,
+    render_analyze_ui_batch_user_prompt,
+    render_analyze_ui_shared_layout_system_prompt,
+    render_analyze_ui_user_prompt,
 )
+from frontend_tester.core import json_utils
+
+# Input types rendered as buttons rather than data entry fields
+_BUTTON_INPUT_TYPES = ("button", "submit", "reset")
+
+# Navigation timeouts: the page load itself, then a short best-effort wait for
+# the network to settle (pages with analytics beacons never reach networkidle)
+_NAVIGATION_TIMEOUT_MS = 15000
+_SETTLE_TIMEOUT_MS = 3000
+
+# How long a partially filled batch of page analyses waits for more pages before it is sent
+_BATCH_WINDOW_SECONDS = 0.25
+
+# Pages each crawl worker may leave waiting for their LLM analysis while it moves on
+_PENDING_ANALYSES_PER_WORKER = 4
+
+# Shorter common prefixes/suffixes between pages aren't worth moving into the system prompt
+_MIN_SHARED_LAYOUT_LENGTH = 1000
+
+# Elements offered as selector candidates by extract_elements_for_selector
+_INTERACTIVE_TAGS = frozenset({"button", "a", "input", "select", "textarea"})
+
+
+@dataclass(slots=True)
+class ElementInfo:
+    """Attributes of an element found on a page."""
+
+    tag: str
+    id: str
+    name: str
+    class_: list[str]
+    type: str
+    text: str
+    placeholder: str
+    aria_label: str
+    data_testid: str
+    href: str
+    value: str
+    options: list[dict[str, str]] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to the dict form stored in analysis JSON files.
+
+        Returns:
+            Dict with element information ("options" only for selects)
+        """
+        info = {
+            "tag": self.tag,
+            "id": self.id,
+            "name": self.name,
+            "class": self.class_,
+            "type": self.type,
+            "text": self.text,
+            "placeholder": self.placeholder,
+            "aria_label": self.aria_label,
+            "data_testid": self.data_testid,
+            "href": self.href,
+            "value": self.value,
+        }
+        if self.options is not None:
+            info["options"] = self.options
+        return info
+
+
+def json_default(obj: Any) -> Any:
+    """
+    Serialize analysis objects that json can't handle natively.
+
+    Pass as ``default`` to json.dumps or json_utils.dumps when writing analysis results.
+
+    Args:
+        obj: Object being serialized
+
+    Returns:
+        JSON-serializable representation
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, ElementInfo):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _element_text(element: lxml.html.HtmlElement) -> str:
+    """Join the stripped text fragments of an element, like bs4's get_text(strip=True)."""
+    return "".join(fragment.strip() for fragment in element.itertext())
+
+
+@functools.lru_cache(maxsize=8192)
+def _url_origin(url: str) -> str:
+    """Return the origin of a URL; cached because crawls test the same links repeatedly."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc.lower()}"
+
+
+def _shared_layout(first_html: str, second_html: str) -> tuple[str, str]:
+    """
+    Find the markup two pages share before and after their content.
+
+    Args:
+        first_html: Simplified HTML of one page
+        second_html: Simplified HTML of another page
+
+    Returns:
+        (prefix, suffix) tuple, trimmed so neither ends in the middle of a tag
+    """
+    prefix = os.path.commonprefix([first_html, second_html])
+    prefix = prefix[: prefix.rfind(">") + 1]
+
+    # The suffix may not overlap the prefix in the shorter page
+    limit = min(len(first_html), len(second_html)) - len(prefix)
+    suffix = os.path.commonprefix([first_html[::-1], second_html[::-1]])[:limit][::-1]
+    start = suffix.find("<")
+    suffix = suffix[start:] if start != -1 else ""
+
+    return prefix, suffix
+
+
+def _start_tag(element: lxml.html.HtmlElement) -> str:
+    """Serialize the start tag of an element the way lxml.html.tostring writes it."""
+    if "" not in element.attrib.values():
+        markup = lxml.html.tostring(
+            element.makeelement(element.tag, element.attrib), encoding="unicode"
+        )
+    else:
+        # A copied empty value would lose its minimized form (<details open>), so
+        # serialize the element itself with its content briefly detached instead
+        children = list(element)
+        text = element.text
+        element.text = None
+        for child in children:
+            element.remove(child)
+        try:
+            markup = lxml.html.tostring(element, encoding="unicode", with_tail=False)
+        finally:
+            element.text = text
+            element.extend(children)
+
+    end_tag = f"</{element.tag}>"
+    # Void elements (input, br, ...) are written without an end tag
+    return markup[:-len(end_tag)] if markup.endswith(end_tag) else markup
+
+
+def _serialize_bounded(root: lxml.html.HtmlElement, max_length: int) -> str:
+    """
+    Serialize an lxml tree, stopping soon after max_length characters are written.
+
+    The output is a prefix of lxml.html.tostring(root), so slicing it to max_length
+    gives the same result without serializing the rest of a large page.
+
+    Args:
+        root: Parsed page HTML
+        max_length: Number of characters after which serialization stops
+
+    Returns:
+        Serialized HTML, longer than max_length only if the page is
+    """
+    buffer = io.StringIO()
+
+    for event, element in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            if len(element):
+                buffer.write(_start_tag(element))
+                if element.text:
+                    buffer.write(html_lib.escape(element.text, quote=False))
+            continue
+
+        if event == "end" and len(element):
+            buffer.write(f"</{element.tag}>")
+        else:
+            # Leaves, comments and processing instructions are written by lxml itself
+            buffer.write(lxml.html.tostring(element, encoding="unicode", with_tail=False))
+        if element.tail and element is not root:
+            buffer.write(html_lib.escape(element.tail, quote=False))
+
+        if buffer.tell() > max_length:
+            break
+
+    return buffer.getvalue()
+
+
+def _extract_hrefs(html: str) -> list[str]:
+    """
+    Extract href values of all links in an HTML document.
+
+    Uses selectolax's lexbor parser when installed, falling back to lxml.
+
+    Args:
+        html: Page HTML content
+
+    Returns:
+        List of href attribute values in document order
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        return [node.attributes.get("href") or "" for node in tree.css("a[href]")]
+
+    return lxml.html.document_fromstring(html).xpath("//a/@href")
+
+
+def _write_analyses_entry(f: BinaryIO, index: int, url: str, analysis: dict[str, Any]) -> None:
+    """
+    Write one page of a JSON object keyed by URL (blocking).
+
+    Args:
+        f: File opened for binary writing, positioned after the previous entry
+        index: Position of the page in the object
+        url: Page URL
+        analysis: Analysis results
+    """
+    f.write(b",\n  " if index else b"\n  ")
+    f.write(json_utils.dumps(url))
+    f.write(b": ")
+    encoded = json_utils.dumps(analysis, indent=True, default=json_default)
+    # Nest the page one level deep; JSON strings never hold raw newlines
+    f.write(encoded.replace(b"\n", b"\n  "))
 
 
 class UIAnalyzer:
     """Analyze web page UI and extract testable elements."""
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        cache_dir: Path | None = None,
+        min_elements: int = 1,
+    ):
         """
         Initialize UI analyzer.
 
         Args:
             llm_client: LLM client for AI-powered analysis
+            cache_dir: Directory persisting AI analyses between runs (None to disable)
+            min_elements: Pages with fewer basic elements skip the AI analysis
         """
         self.llm_client = llm_client
+        self.cache_dir = cache_dir
+        self.min_elements = min_elements
+        # AI analyses keyed by simplified HTML digest; crawled pages often share templates
+        self._analysis_cache: dict[str, dict[str, Any]] = {}
+        # Per origin: first page seen, and the (prefix, suffix, system prompt) layout
+        # shared with later pages (None when the pages have too little in common)
+        self._layout_reference: dict[str, str] = {}
+        self._layout_by_origin: dict[str, tuple[str, str, str] | None] = {}
+        # Tag -> categorizer used by _extract_basic_elements
+        self._element_handlers = {
+            "input": self._add_input,
+            "a": self._add_link,
+            "button": self._add_button,
+            "select": self._add_select,
+            "textarea": self._add_textarea,
+            "form": self._add_form,
+        }
 
     async def analyze_page(self, page: Page) -> dict[str, Any]:
         """
@@ -44,11 +307,62 @@ class UIAnalyzer:
         title = await page.title()
         html = await page.content()
 
-        # Extract basic elements with BeautifulSoup
-        basic_elements = self._extract_basic_elements(html)
+        return await self._analyze_from_tree(url, title, lxml.html.document_fromstring(html))
+
+    async def _analyze_from_tree(
+        self,
+        url: str,
+        title: str,
+        root: lxml.html.HtmlElement,
+        batcher: "_AnalysisBatcher | None" = None,
+    ) -> dict[str, Any]:
+        """
+        Analyze an already parsed page.
 
-        # Use LLM for advanced analysis
-        analysis = await self._llm_analyze(url, title, html)
+        Args:
+            url: Page URL
+            title: Page title
+            root: Parsed page HTML (shared between extraction and simplification)
+            batcher: Optional batcher that combines LLM requests of several pages
+
+        Returns:
+            Analysis results dict with elements, flows, forms, navigation
+        """
+        # Extract basic elements with lxml
+        basic_elements = self._extract_basic_elements(root)
+        return await self._analyze_elements(url, title, root, basic_elements, batcher)
+
+    async def _analyze_elements(
+        self,
+        url: str,
+        title: str,
+        root: lxml.html.HtmlElement,
+        basic_elements: dict[str, list[ElementInfo]],
+        batcher: "_AnalysisBatcher | None" = None,
+    ) -> dict[str, Any]:
+        """
+        Complete the analysis of a page whose basic elements are already extracted.
+
+        Args:
+            url: Page URL
+            title: Page title
+            root: Parsed page HTML
+            basic_elements: Elements extracted from root
+            batcher: Optional batcher that combines LLM requests of several pages
+
+        Returns:
+            Analysis results dict with elements, flows, forms, navigation
+        """
+        # Pages without interactive elements (policies, redirects) aren't worth an LLM call
+        element_count = sum(len(elements) for elements in basic_elements.values())
+        if element_count < self.min_elements:
+            analysis = {
+                "skipped": True,
+                "reason": f"{element_count} interactive elements (minimum {self.min_elements})",
+            }
+        else:
+            # Use LLM for advanced analysis (simplification mutates the tree, so it runs last)
+            analysis = await self._llm_analyze(url, title, root, batcher)
 
         return {
             "url": url,
@@ -57,18 +371,18 @@ class UIAnalyzer:
             "ai_analysis": analysis,
         }
 
-    def _extract_basic_elements(self, html: str) -> dict[str, list[dict[str, Any]]]:
+    def _extract_basic_elements(
+        self, root: lxml.html.HtmlElement
+    ) -> dict[str, list[ElementInfo]]:
         """
-        Extract basic interactive elements using BeautifulSoup.
+        Extract basic interactive elements in a single pass over the lxml tree.
 
         Args:
-            html: Page HTML content
+            root: Parsed page HTML
 
         Returns:
             Dict with categorized elements
         """
-        soup = BeautifulSoup(html, "lxml")
-
         elements = {
             "buttons": [],
             "links": [],
@@ -77,125 +391,410 @@ class UIAnalyzer:
             "textareas": [],
             "forms": [],
         }
+        handlers = self._element_handlers
 
-        # Extract buttons
-        for button in soup.find_all(["button", "input"], type=["button", "submit", "reset"]):
-            elements["buttons"].append(self._extract_element_info(button))
-
-        # Extract links
-        for link in soup.find_all("a", href=True):
-            elements["links"].append(self._extract_element_info(link))
-
-        # Extract inputs
-        for input_elem in soup.find_all("input"):
-            if input_elem.get("type") not in ["button", "submit", "reset"]:
-                elements["inputs"].append(self._extract_element_info(input_elem))
-
-        # Extract selects
-        for select in soup.find_all("select"):
-            elem_info = self._extract_element_info(select)
-            # Add options
-            elem_info["options"] = [
-                {"value": opt.get("value", ""), "text": opt.get_text(strip=True)}
-                for opt in select.find_all("option")
-            ]
-            elements["selects"].append(elem_info)
-
-        # Extract textareas
-        for textarea in soup.find_all("textarea"):
-            elements["textareas"].append(self._extract_element_info(textarea))
-
-        # Extract forms
-        for form in soup.find_all("form"):
-            elements["forms"].append(self._extract_element_info(form))
+        # Tag filtering happens inside lxml; Python only sees candidate elements
+        for element in root.iter(*handlers):
+            handlers[element.tag](element, elements)
 
         return elements
 
-    def _extract_element_info(self, element: Any) -> dict[str, Any]:
+    def _add_input(
+        self, element: lxml.html.HtmlElement, elements: dict[str, list[ElementInfo]]
+    ) -> None:
+        """Categorize an <input> as a button or a data entry field."""
+        if element.get("type") in _BUTTON_INPUT_TYPES:
+            elements["buttons"].append(self._extract_element_info(element))
+        else:
+            elements["inputs"].append(self._extract_element_info(element))
+
+    def _add_link(
+        self, element: lxml.html.HtmlElement, elements: dict[str, list[ElementInfo]]
+    ) -> None:
+        """Add an <a> that has an href."""
+        if "href" in element.attrib:
+            elements["links"].append(self._extract_element_info(element))
+
+    def _add_button(
+        self, element: lxml.html.HtmlElement, elements: dict[str, list[ElementInfo]]
+    ) -> None:
+        """Add a <button> with an explicit button type."""
+        if element.get("type") in _BUTTON_INPUT_TYPES:
+            elements["buttons"].append(self._extract_element_info(element))
+
+    def _add_select(
+        self, element: lxml.html.HtmlElement, elements: dict[str, list[ElementInfo]]
+    ) -> None:
+        """Add a <select> together with its options."""
+        elem_info = self._extract_element_info(element)
+        # Add options
+        elem_info.options = [
+            {"value": opt.get("value", ""), "text": _element_text(opt)}
+            for opt in element.iter("option")
+        ]
+        elements["selects"].append(elem_info)
+
+    def _add_textarea(
+        self, element: lxml.html.HtmlElement, elements: dict[str, list[ElementInfo]]
+    ) -> None:
+        """Add a <textarea>."""
+        elements["textareas"].append(self._extract_element_info(element))
+
+    def _add_form(
+        self, element: lxml.html.HtmlElement, elements: dict[str, list[ElementInfo]]
+    ) -> None:
+        """Add a <form>."""
+        elements["forms"].append(self._extract_element_info(element))
+
+    def _extract_element_info(self, element: lxml.html.HtmlElement) -> ElementInfo:
         """
-        Extract information from a BeautifulSoup element.
+        Extract information from an lxml element.
 
         Args:
-            element: BeautifulSoup element
+            element: lxml HTML element
 
         Returns:
-            Dict with element information
+            Element information
         """
-        return {
-            "tag": element.name,
-            "id": element.get("id", ""),
-            "name": element.get("name", ""),
-            "class": element.get("class", []),
-            "type": element.get("type", ""),
-            "text": element.get_text(strip=True),
-            "placeholder": element.get("placeholder", ""),
-            "aria_label": element.get("aria-label", ""),
-            "data_testid": element.get("data-testid", ""),
-            "href": element.get("href", ""),
-            "value": element.get("value", ""),
-        }
+        # Bound Element.get skips building an attrib proxy; this runs for every element
+        get = element.get
+        return ElementInfo(
+            tag=element.tag,
+            id=get("id", ""),
+            name=get("name", ""),
+            class_=get("class", "").split(),
+            type=get("type", ""),
+            text=_element_text(element),
+            placeholder=get("placeholder", ""),
+            aria_label=get("aria-label", ""),
+            data_testid=get("data-testid", ""),
+            href=get("href", ""),
+            value=get("value", ""),
+        )
 
-    async def _llm_analyze(self, url: str, title: str, html: str) -> dict[str, Any]:
+    async def _llm_analyze(
+        self,
+        url: str,
+        title: str,
+        root: lxml.html.HtmlElement,
+        batcher: "_AnalysisBatcher | None" = None,
+    ) -> dict[str, Any]:
         """
         Use LLM to analyze page structure and identify test scenarios.
 
         Args:
             url: Page URL
             title: Page title
-            html: Page HTML
+            root: Parsed page HTML (modified in place by simplification)
+            batcher: Optional batcher that combines LLM requests of several pages
 
         Returns:
             AI analysis results
         """
         # Simplify HTML for LLM (remove scripts, styles, etc.)
-        simplified_html = self._simplify_html(html)
+        simplified_html = self._simplify_html(root)
+
+        # Reuse the analysis of an identical page instead of asking the LLM again
+        cache_key = hashlib.blake2b(simplified_html.encode(), digest_size=16).hexdigest()
+        if cache_key in self._analysis_cache:
+            return self._analysis_cache[cache_key]
+
+        # Unchanged pages reuse the analysis from an earlier run
+        if self.cache_dir:
+            analysis = await asyncio.to_thread(self._read_cached_analysis, cache_key)
+            if analysis is not None:
+                self._analysis_cache[cache_key] = analysis
+                return analysis
+
+        # Send the layout shared by the site's pages once, in the cacheable system prompt
+        system_prompt, page_html = self._split_shared_layout(url, simplified_html)
+
+        if batcher:
+            analysis = await batcher.analyze(url, title, page_html, system_prompt)
+        else:
+            analysis = await self._request_analysis(url, title, page_html, system_prompt)
+
+        if "error" not in analysis:
+            self._analysis_cache[cache_key] = analysis
+            if self.cache_dir:
+                await asyncio.to_thread(self._write_cached_analysis, cache_key, analysis)
+        return analysis
+
+    def _read_cached_analysis(self, cache_key: str) -> dict[str, Any] | None:
+        """
+        Load an analysis persisted by an earlier run (blocking).
+
+        Args:
+            cache_key: Simplified HTML digest
+
+        Returns:
+            Cached analysis, or None if missing, unreadable or made by another model
+        """
+        try:
+            entry = json_utils.loads((self.cache_dir / f"{cache_key}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("model") != self.llm_client.get_model_name():
+            return None
+        return entry.get("analysis")
+
+    def _write_cached_analysis(self, cache_key: str, analysis: dict[str, Any]) -> None:
+        """
+        Persist an analysis for later runs (blocking).
+
+        Args:
+            cache_key: Simplified HTML digest
+            analysis: AI analysis results
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"model": self.llm_client.get_model_name(), "analysis": analysis}
+        (self.cache_dir / f"{cache_key}.json").write_bytes(json_utils.dumps(entry))
 
+    def _split_shared_layout(self, url: str, simplified_html: str) -> tuple[str, str]:
+        """
+        Separate a page from the layout it shares with other pages of its origin.
+
+        The layout is learned from the first two pages of an origin and then kept
+        fixed, so the system prompt stays byte-identical for provider prompt caching.
+
+        Args:
+            url: Page URL
+            simplified_html: Simplified page HTML
+
+        Returns:
+            (system_prompt, html) tuple; html is the page content without the layout
+        """
+        origin = _url_origin(url)
+
+        if origin not in self._layout_by_origin:
+            reference = self._layout_reference.setdefault(origin, simplified_html)
+            if reference == simplified_html:
+                return ANALYZE_UI_SYSTEM_PROMPT, simplified_html
+
+            prefix, suffix = _shared_layout(reference, simplified_html)
+            if len(prefix) + len(suffix) >= _MIN_SHARED_LAYOUT_LENGTH:
+                system_prompt = render_analyze_ui_shared_layout_system_prompt(
+                    layout=prefix + SHARED_LAYOUT_CONTENT_MARKER + suffix
+                )
+                self._layout_by_origin[origin] = (prefix, suffix, system_prompt)
+            else:
+                self._layout_by_origin[origin] = None
+
+        layout = self._layout_by_origin[origin]
+        if layout:
+            prefix, suffix, system_prompt = layout
+            if (
+                len(simplified_html) >= len(prefix) + len(suffix)
+                and simplified_html.startswith(prefix)
+                and simplified_html.endswith(suffix)
+            ):
+                content = simplified_html[len(prefix):len(simplified_html) - len(suffix)]
+                return system_prompt, content
+
+        return ANALYZE_UI_SYSTEM_PROMPT, simplified_html
+
+    async def _request_analysis(
+        self,
+        url: str,
+        title: str,
+        simplified_html: str,
+        system_prompt: str = ANALYZE_UI_SYSTEM_PROMPT,
+    ) -> dict[str, Any]:
+        """
+        Ask the LLM to analyze a single simplified page.
+
+        Args:
+            url: Page URL
+            title: Page title
+            simplified_html: Simplified page HTML
+            system_prompt: System prompt to send
+
+        Returns:
+            AI analysis results
+        """
         # Generate prompt
-        user_prompt = ANALYZE_UI_USER_PROMPT.format(
+        user_prompt = render_analyze_ui_user_prompt(
             url=url, title=title, html=simplified_html
         )
 
         try:
             # Get LLM response
-            response = await self.llm_client.generate_with_system_prompt(
-                system_prompt=ANALYZE_UI_SYSTEM_PROMPT,
+            response, truncated = await self._complete_json(
+                system_prompt=system_prompt,
                 user_prompt=user_prompt,
-                temperature=0.3,  # Lower temperature for more consistent output
+                expected_start="{",
             )
 
             # Parse JSON response
-            analysis = json.loads(response)
+            analysis = json_utils.loads(response)
             return analysis
 
         except json.JSONDecodeError:
             # If LLM doesn't return valid JSON, return raw response
-            return {"raw_response": response, "error": "Failed to parse JSON"}
+            failure = {"raw_response": response, "error": "Failed to parse JSON"}
+            if truncated:
+                # raw_response is only the start of the reply, where reading stopped
+                failure["truncated"] = True
+            return failure
         except Exception as e:
             return {"error": str(e)}
 
-    def _simplify_html(self, html: str, max_length: int = 8000) -> str:
+    async def _llm_analyze_batch(
+        self,
+        items: list[tuple[str, str, str]],
+        system_prompt: str = ANALYZE_UI_SYSTEM_PROMPT,
+    ) -> list[dict[str, Any]]:
+        """
+        Analyze several simplified pages with a single LLM request.
+
+        Batches whose replies could exceed the model's output token limit are split,
+        so every page keeps the configured per-page token budget. Falls back to one
+        request per page if the batched response can't be parsed.
+
+        Args:
+            items: (url, title, simplified_html) tuples
+            system_prompt: System prompt to send
+
+        Returns:
+            AI analysis results in the same order as items
+        """
+        if len(items) == 1:
+            return [await self._request_analysis(*items[0], system_prompt)]
+
+        # A request the provider rejects for asking too many tokens would only add a
+        # wasted call before the per-page fallback
+        per_page_tokens = self.llm_client.config.max_tokens
+        pages_per_request = max(1, self.llm_client.get_max_output_tokens() // max(per_page_tokens, 1))
+        if len(items) > pages_per_request:
+            chunks = await asyncio.gather(
+                *(
+                    self._llm_analyze_batch(items[start:start + pages_per_request], system_prompt)
+                    for start in range(0, len(items), pages_per_request)
+                )
+            )
+            return [analysis for chunk in chunks for analysis in chunk]
+
+        pages = "\n".join(
+            render_analyze_ui_batch_page(index=i, url=url, title=title, html=html)
+            for i, (url, title, html) in enumerate(items, start=1)
+        )
+        user_prompt = render_analyze_ui_batch_user_prompt(count=len(items), pages=pages)
+
+        try:
+            response, _ = await self._complete_json(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                expected_start="[",
+                # Leave room for one full analysis per page
+                max_tokens=per_page_tokens * len(items),
+            )
+
+            analyses = self._match_batch_analyses(json_utils.loads(response), len(items))
+        except Exception:
+            analyses = {}
+
+        # Only pages the batched reply didn't cover are requested again, one by one
+        missing = [index for index in range(len(items)) if index not in analyses]
+        retried = await asyncio.gather(
+            *(self._request_analysis(*items[index], system_prompt) for index in missing)
+        )
+        analyses.update(zip(missing, retried, strict=True))
+
+        return [analyses[index] for index in range(len(items))]
+
+    def _match_batch_analyses(self, reply: Any, count: int) -> dict[int, dict[str, Any]]:
+        """
+        Assign the analyses of a batched reply to the pages they describe.
+
+        Analyses are matched by their "page" number; a reply without page numbers is
+        only trusted if it holds exactly one analysis per page, in order.
+
+        Args:
+            reply: Parsed batched LLM response
+            count: Number of pages in the batch
+
+        Returns:
+            Analyses by zero-based page index (pages without a usable analysis omitted)
+        """
+        if not isinstance(reply, list):
+            return {}
+        analyses = [analysis for analysis in reply if isinstance(analysis, dict)]
+
+        matched = {}
+        for analysis in analyses:
+            page = analysis.pop("page", None)
+            if isinstance(page, int) and 1 <= page <= count:
+                matched.setdefault(page - 1, analysis)
+
+        if not matched and len(analyses) == len(reply) == count:
+            return dict(enumerate(analyses))
+        return matched
+
+    async def _complete_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        expected_start: str,
+        max_tokens: int | None = None,
+    ) -> tuple[str, bool]:
+        """
+        Stream an LLM response that should be a JSON document.
+
+        Reading stops as soon as the response can't be the expected JSON, so a reply
+        in prose doesn't have to be generated in full before it is rejected.
+
+        Args:
+            system_prompt: System instruction
+            user_prompt: User query
+            expected_start: Character the JSON document must start with ("{" or "[")
+            max_tokens: Maximum tokens
+
+        Returns:
+            Response content (partial if reading stopped early), and whether reading
+            stopped early
+        """
+        parts = []
+        started = False
+        truncated = False
+
+        stream = self.llm_client.stream_with_system_prompt(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=0.3,  # Lower temperature for more consistent output
+            max_tokens=max_tokens,
+        )
+        try:
+            async for content in stream:
+                parts.append(content)
+                if not started and content.strip():
+                    started = True
+                    if not content.lstrip().startswith(expected_start):
+                        truncated = True
+                        break
+        finally:
+            await stream.aclose()
+
+        return "".join(parts), truncated
+
+    def _simplify_html(self, root: lxml.html.HtmlElement, max_length: int = 8000) -> str:
         """
         Simplify HTML for LLM processing.
 
         Args:
-            html: Original HTML
+            root: Parsed page HTML (scripts, styles and comments are removed in place)
             max_length: Maximum length of simplified HTML
 
         Returns:
             Simplified HTML
         """
-        soup = BeautifulSoup(html, "lxml")
-
-        # Remove scripts, styles, comments
-        for element in soup(["script", "style", "noscript"]):
-            element.decompose()
-
-        # Remove comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, str) and text.strip().startswith("<!--")):
-            comment.extract()
+        # Remove scripts, styles and comments (keeping the text that follows them)
+        etree.strip_elements(
+            root, "script", "style", "noscript", etree.Comment, with_tail=False
+        )
 
-        # Get text representation with some structure
-        simplified = str(soup)
+        # Get text representation with some structure, serializing no more than needed
+        simplified = _serialize_bounded(root, max_length)
 
         # Truncate if too long
         if len(simplified) > max_length:
@@ -217,73 +816,76 @@ class UIAnalyzer:
             List of elements with selector information
         """
         html = await page.content()
-        soup = BeautifulSoup(html, "lxml")
+        root = lxml.html.document_fromstring(html)
 
-        elements = []
+        include_interactive = selector_type in ["all", "interactive"]
+        include_forms = selector_type in ["all", "forms"]
 
-        if selector_type in ["all", "interactive"]:
-            # Interactive elements
-            for elem in soup.find_all(["button", "a", "input", "select", "textarea"]):
-                elements.append(self._create_selector_info(elem))
+        elements = []
+        forms = []
 
-        if selector_type in ["all", "forms"]:
-            # Form elements
-            for elem in soup.find_all("form"):
-                elements.append(self._create_selector_info(elem))
+        # Single pass over the tree; forms are still listed after interactive elements
+        for elem in root.iter():
+            if elem.tag in _INTERACTIVE_TAGS:
+                if include_interactive:
+                    elements.append(self._create_selector_info(elem))
+            elif elem.tag == "form" and include_forms:
+                forms.append(self._create_selector_info(elem))
 
-        return elements
+        return elements + forms
 
-    def _create_selector_info(self, element: Any) -> dict[str, Any]:
+    def _create_selector_info(self, element: lxml.html.HtmlElement) -> dict[str, Any]:
         """
         Create selector information for an element.
 
         Args:
-            element: BeautifulSoup element
+            element: lxml HTML element
 
         Returns:
             Dict with selector options
         """
+        # Read attributes and text once, then derive the selectors from them
+        info = self._extract_element_info(element)
         selectors = []
 
         # ID selector (highest priority)
-        if element.get("id"):
-            selectors.append({"type": "id", "value": f"#{element['id']}"})
+        if info.id:
+            selectors.append({"type": "id", "value": f"#{info.id}"})
 
         # Data-testid
-        if element.get("data-testid"):
+        if info.data_testid:
             selectors.append(
-                {"type": "data-testid", "value": f"[data-testid='{element['data-testid']}']"}
+                {"type": "data-testid", "value": f"[data-testid='{info.data_testid}']"}
             )
 
         # Name
-        if element.get("name"):
-            selectors.append({"type": "name", "value": f"[name='{element['name']}']"})
+        if info.name:
+            selectors.append({"type": "name", "value": f"[name='{info.name}']"})
 
         # Type + placeholder (for inputs)
-        if element.name == "input" and element.get("placeholder"):
+        if info.tag == "input" and info.placeholder:
             selectors.append(
                 {
                     "type": "placeholder",
-                    "value": f"input[placeholder='{element['placeholder']}']",
+                    "value": f"input[placeholder='{info.placeholder}']",
                 }
             )
 
         # Text content (for buttons and links)
-        text = element.get_text(strip=True)
-        if text and element.name in ["button", "a"]:
-            selectors.append({"type": "text", "value": f"text='{text}'"})
+        if info.text and info.tag in ("button", "a"):
+            selectors.append({"type": "text", "value": f"text='{info.text}'"})
 
         # ARIA label
-        if element.get("aria-label"):
+        if info.aria_label:
             selectors.append(
-                {"type": "aria-label", "value": f"[aria-label='{element['aria-label']}']"}
+                {"type": "aria-label", "value": f"[aria-label='{info.aria_label}']"}
             )
 
         return {
-            "tag": element.name,
-            "text": text,
+            "tag": info.tag,
+            "text": info.text,
             "selectors": selectors,
-            "attributes": self._extract_element_info(element),
+            "attributes": info,
         }
 
     async def save_analysis(self, analysis: dict[str, Any], output_path: Path) -> None:
@@ -294,17 +896,76 @@ class UIAnalyzer:
             analysis: Analysis results
             output_path: Output file path
         """
+        # Encoding and disk I/O run in a worker thread so the event loop stays responsive
+        await asyncio.to_thread(self._write_analysis, analysis, output_path)
+
+    def _write_analysis(self, analysis: dict[str, Any], output_path: Path) -> None:
+        """
+        Write analysis results to a JSON file (blocking).
+
+        Args:
+            analysis: Analysis results
+            output_path: Output file path
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        output_path.write_bytes(json_utils.dumps(analysis, indent=True, default=json_default))
+
+    async def save_analyses(
+        self,
+        analyses: Mapping[str, dict[str, Any]] | AsyncIterable[tuple[str, dict[str, Any]]],
+        output_path: Path,
+    ) -> None:
+        """
+        Save the analyses of several pages to one JSON file keyed by URL.
+
+        Args:
+            analyses: Analysis results by page URL, or an async iterable of
+                (URL, analysis) pairs (e.g. iter_crawl_and_analyze) written as they arrive
+            output_path: Output file path
+        """
+        if isinstance(analyses, Mapping):
+            await asyncio.to_thread(self._write_analyses, analyses, output_path)
+            return
+
+        await asyncio.to_thread(output_path.parent.mkdir, parents=True, exist_ok=True)
+        f = await asyncio.to_thread(open, output_path, "wb")
+        try:
+            await asyncio.to_thread(f.write, b"{")
+            count = 0
+            async for url, analysis in analyses:
+                await asyncio.to_thread(_write_analyses_entry, f, count, url, analysis)
+                count += 1
+            await asyncio.to_thread(f.write, b"\n}" if count else b"}")
+        finally:
+            await asyncio.to_thread(f.close)
+
+    def _write_analyses(self, analyses: Mapping[str, dict[str, Any]], output_path: Path) -> None:
+        """
+        Write analyses to a JSON object file one page at a time (blocking).
+
+        Only one page is encoded at a time, so memory stays flat however many pages
+        the crawl produced. The output matches encoding the whole dict at once.
+
+        Args:
+            analyses: Analysis results by page URL
+            output_path: Output file path
+        """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(analysis, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(b"{")
+            for index, (url, analysis) in enumerate(analyses.items()):
+                _write_analyses_entry(f, index, url, analysis)
+            f.write(b"\n}" if analyses else b"}")
 
     async def discover_urls(
         self,
         page: Page,
         start_url: str,
         max_pages: int = 50,
-        same_origin_only: bool = True
+        same_origin_only: bool = True,
+        wait_until: str = "domcontentloaded",
     ) -> list[str]:
         """
         Discover all URLs from a website by crawling links.
@@ -314,60 +975,43 @@ class UIAnalyzer:
             start_url: Starting URL to crawl from
             max_pages: Maximum number of pages to discover
             same_origin_only: Only crawl pages from the same origin
+            wait_until: Playwright load state to wait for when navigating
 
         Returns:
             List of discovered URLs
         """
-        visited_urls = set()
-        to_visit = {start_url}
+        # FIFO breadth-first order keeps pages of the same section together
+        to_visit = deque([start_url])
+        enqueued_urls = {start_url}
+        visited_count = 0
         discovered = []
 
         start_origin = self._get_origin(start_url)
 
-        while to_visit and len(visited_urls) < max_pages:
-            url = to_visit.pop()
-
-            # Skip if already visited
-            if url in visited_urls:
-                continue
-
-            # Skip if different origin and same_origin_only
-            if same_origin_only and self._get_origin(url) != start_origin:
-                continue
+        while to_visit and visited_count < max_pages:
+            url = to_visit.popleft()
+            visited_count += 1
 
             try:
                 # Navigate to page
-                await page.goto(url, wait_until="networkidle", timeout=30000)
+                await self.navigate(page, url, wait_until)
                 discovered.append(url)
-                visited_urls.add(url)
 
                 # Extract links (without full analysis)
                 html = await page.content()
-                basic_elements = self._extract_basic_elements(html)
-                links = basic_elements.get("links", [])
-
-                for link in links:
-                    href = link.get("href", "")
-                    if href and not href.startswith(("javascript:", "mailto:")):
-                        # Handle hash-based routing (e.g., #!/page)
-                        if href.startswith("#!"):
-                            # Hash route - construct full URL
-                            base_url = url.split("#")[0]  # Remove any existing hash
-                            absolute_url = base_url + href
-                            if absolute_url not in visited_urls:
-                                to_visit.add(absolute_url)
-                        elif href.startswith("#"):
-                            # Regular anchor link - skip
-                            continue
-                        else:
-                            # Regular URL or relative path
-                            absolute_url = urljoin(url, href)
-                            if absolute_url not in visited_urls:
-                                to_visit.add(absolute_url)
+
+                for absolute_url in self._resolve_links(url, _extract_hrefs(html)):
+                    # Filter before enqueueing so each URL is queued at most once
+                    if absolute_url in enqueued_urls:
+                        continue
+                    if same_origin_only and self._get_origin(absolute_url) != start_origin:
+                        continue
+                    enqueued_urls.add(absolute_url)
+                    to_visit.append(absolute_url)
 
             except Exception:
                 # Skip pages that fail to load
-                visited_urls.add(url)
+                pass
 
         return discovered
 
@@ -377,7 +1021,10 @@ class UIAnalyzer:
         start_url: str,
         max_pages: int = 50,
         same_origin_only: bool = True,
-        progress_callback = None
+        progress_callback = None,
+        concurrency: int = 1,
+        wait_until: str = "domcontentloaded",
+        batch_size: int = 1,
     ) -> dict[str, dict[str, Any]]:
         """
         Crawl website starting from URL and analyze all discovered pages.
@@ -388,37 +1035,248 @@ class UIAnalyzer:
             max_pages: Maximum number of pages to analyze
             same_origin_only: Only crawl pages from the same origin
             progress_callback: Optional callback function called after each page analysis
+            concurrency: Number of pages loaded in parallel (extra pages share the
+                context of ``page``)
+            wait_until: Playwright load state to wait for when navigating
+            batch_size: Maximum number of pages analyzed together in one LLM request
 
         Returns:
             Dict mapping URLs to their analysis results
         """
-        # First, discover all URLs (fast)
-        urls = await self.discover_urls(page, start_url, max_pages, same_origin_only)
+        return {
+            url: analysis
+            async for url, analysis in self.iter_crawl_and_analyze(
+                page,
+                start_url,
+                max_pages=max_pages,
+                same_origin_only=same_origin_only,
+                progress_callback=progress_callback,
+                concurrency=concurrency,
+                wait_until=wait_until,
+                batch_size=batch_size,
+            )
+        }
 
-        # Then analyze each URL (slow, with progress updates)
-        analyses = {}
-        for i, url in enumerate(urls):
-            try:
-                await page.goto(url, wait_until="networkidle", timeout=30000)
-                analysis = await self.analyze_page(page)
-                analyses[url] = analysis
+    async def iter_crawl_and_analyze(
+        self,
+        page: Page,
+        start_url: str,
+        max_pages: int = 50,
+        same_origin_only: bool = True,
+        progress_callback = None,
+        concurrency: int = 1,
+        wait_until: str = "domcontentloaded",
+        batch_size: int = 1,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Crawl website starting from URL and yield each page's analysis as it completes.
+
+        Only analyses the caller hasn't consumed yet are held, so a caller that writes
+        each page out as it arrives needs memory for a handful of pages, not the crawl.
+
+        Args:
+            page: Playwright page instance
+            start_url: Starting URL to crawl from
+            max_pages: Maximum number of pages to analyze
+            same_origin_only: Only crawl pages from the same origin
+            progress_callback: Optional callback function called after each page analysis
+            concurrency: Number of pages loaded in parallel (extra pages share the
+                context of ``page``)
+            wait_until: Playwright load state to wait for when navigating
+            batch_size: Maximum number of pages analyzed together in one LLM request
 
-                if progress_callback:
-                    progress_callback(i + 1, len(urls), url, analysis.get("title", ""))
+        Yields:
+            (URL, analysis results) pairs in completion order
+        """
+        start_origin = self._get_origin(start_url)
 
+        # Workers run on one event loop and only yield at awaits, so the shared
+        # bookkeeping below needs no lock
+        seen_urls = {start_url}
+        visited_urls = set()
+        analyzed_count = 0
+        results: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        queue.put_nowait(start_url)
+        batcher = _AnalysisBatcher(self, batch_size) if batch_size > 1 else None
+
+        def record(url: str, analysis: dict[str, Any], title: str) -> None:
+            nonlocal analyzed_count
+            analyzed_count += 1
+            results.put_nowait((url, analysis))
+            if progress_callback:
+                # The crawl size is only known once it ends, so report a running estimate
+                progress_callback(analyzed_count, min(max_pages, len(seen_urls)), url, title)
+
+        def record_error(url: str, error: Exception) -> None:
+            # Log error but continue
+            analysis = {
+                "url": url,
+                "error": str(error),
+                "title": "",
+                "basic_elements": {},
+                "ai_analysis": {"error": str(error)}
+            }
+            record(url, analysis, f"Error: {error}")
+
+        # Navigation doesn't wait for the LLM: a worker hands each loaded page to an
+        # analysis task and moves on. Pages count as done (queue.task_done) only once
+        # analyzed, so queue.join() covers both stages.
+        worker_count = max(concurrency, 1)
+        pending_analyses = asyncio.Semaphore(worker_count * _PENDING_ANALYSES_PER_WORKER)
+        analysis_tasks: set[asyncio.Task] = set()
+        failed = asyncio.get_running_loop().create_future()
+
+        async def analyze(
+            url: str,
+            title: str,
+            root: lxml.html.HtmlElement,
+            basic_elements: dict[str, list[ElementInfo]],
+        ) -> None:
+            try:
+                try:
+                    analysis = await self._analyze_elements(
+                        url, title, root, basic_elements, batcher
+                    )
+                except Exception as e:
+                    record_error(url, e)
+                else:
+                    record(url, analysis, title)
             except Exception as e:
-                # Log error but continue
-                analyses[url] = {
-                    "url": url,
-                    "error": str(e),
-                    "title": "",
-                    "basic_elements": {},
-                    "ai_analysis": {"error": str(e)}
-                }
-                if progress_callback:
-                    progress_callback(i + 1, len(urls), url, f"Error: {e}")
+                # Errors from the progress callback abort the crawl
+                if not failed.done():
+                    failed.set_exception(e)
+            finally:
+                pending_analyses.release()
+                queue.task_done()
+
+        async def worker(worker_page: Page) -> None:
+            while True:
+                url = await queue.get()
+                handed_off = False
+                try:
+                    if len(visited_urls) >= max_pages:
+                        continue
+                    visited_urls.add(url)
+
+                    try:
+                        await self.navigate(worker_page, url, wait_until)
+                    except Exception:
+                        # Skip pages that fail to load
+                        continue
+
+                    try:
+                        title = await worker_page.title()
+                        html = await worker_page.content()
+                        root = lxml.html.document_fromstring(html)
+                        basic_elements = self._extract_basic_elements(root)
+                    except Exception as e:
+                        record_error(url, e)
+                        continue
+
+                    # Next links come from the extracted elements, before the LLM is asked
+                    hrefs = [link.href for link in basic_elements["links"]]
+                    for absolute_url in self._resolve_links(url, hrefs):
+                        if absolute_url in seen_urls:
+                            continue
+                        if same_origin_only and self._get_origin(absolute_url) != start_origin:
+                            continue
+                        seen_urls.add(absolute_url)
+                        queue.put_nowait(absolute_url)
+
+                    await pending_analyses.acquire()
+                    task = asyncio.create_task(analyze(url, title, root, basic_elements))
+                    analysis_tasks.add(task)
+                    task.add_done_callback(analysis_tasks.discard)
+                    handed_off = True
+                finally:
+                    if not handed_off:
+                        queue.task_done()
+
+        extra_pages = [await page.context.new_page() for _ in range(worker_count - 1)]
+        workers = [asyncio.create_task(worker(p)) for p in [page, *extra_pages]]
+        finished = asyncio.create_task(queue.join())
+
+        # Completes when the queue drains, or early if a worker or the callback raised
+        stopped = asyncio.ensure_future(
+            asyncio.wait([finished, failed, *workers], return_when=asyncio.FIRST_COMPLETED)
+        )
+
+        try:
+            while not stopped.done():
+                next_result = asyncio.ensure_future(results.get())
+                await asyncio.wait([next_result, stopped], return_when=asyncio.FIRST_COMPLETED)
+                if not next_result.done():
+                    next_result.cancel()
+                    break
+                yield next_result.result()
+
+            if failed.done():
+                raise failed.exception()
+            for task in workers:
+                if task.done() and task.exception():
+                    raise task.exception()
+
+            # Pages are queued as results before they are marked done, so none are lost
+            while not results.empty():
+                yield results.get_nowait()
+        finally:
+            stopped.cancel()
+            for task in [finished, *workers, *analysis_tasks]:
+                task.cancel()
+            await asyncio.gather(finished, *workers, *analysis_tasks, return_exceptions=True)
+            if batcher:
+                await batcher.close()
+            for extra_page in extra_pages:
+                await extra_page.close()
+
+    async def navigate(self, page: Page, url: str, wait_until: str = "domcontentloaded") -> None:
+        """
+        Navigate to a URL and give the page a moment to settle.
 
-        return analyses
+        Unlike waiting for networkidle outright, this doesn't stall on pages that keep
+        analytics beacons or websockets busy: the settle wait is capped and best-effort.
+
+        Args:
+            page: Playwright page instance
+            url: URL to navigate to
+            wait_until: Playwright load state to wait for
+        """
+        await page.goto(url, wait_until=wait_until, timeout=_NAVIGATION_TIMEOUT_MS)
+
+        if wait_until != "networkidle":
+            try:
+                # Let client-side rendering finish, but don't wait on endless beacons
+                await page.wait_for_load_state("networkidle", timeout=_SETTLE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                pass
+
+    def _resolve_links(self, url: str, hrefs: list[str]) -> list[str]:
+        """
+        Resolve crawlable link targets found on a page.
+
+        Args:
+            url: URL of the page the links were found on
+            hrefs: Raw href attribute values
+
+        Returns:
+            Absolute URLs, skipping javascript:, mailto: and plain anchor links
+        """
+        resolved = []
+        for href in hrefs:
+            if href and not href.startswith(("javascript:", "mailto:")):
+                # Handle hash-based routing (e.g., #!/page)
+                if href.startswith("#!"):
+                    # Hash route - construct full URL
+                    base_url = url.split("#")[0]  # Remove any existing hash
+                    resolved.append(base_url + href)
+                elif href.startswith("#"):
+                    # Regular anchor link - skip
+                    continue
+                else:
+                    # Regular URL or relative path
+                    resolved.append(urljoin(url, href))
+        return resolved
 
     def _get_origin(self, url: str) -> str:
         """
@@ -430,5 +1288,94 @@ class UIAnalyzer:
         Returns:
             Origin string (e.g., "http://localhost:3000")
         """
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}"
+        return _url_origin(url)
+
+
+class _AnalysisBatcher:
+    """Collect page analysis requests from crawl workers and send them in batches."""
+
+    def __init__(self, analyzer: UIAnalyzer, batch_size: int):
+        """
+        Initialize batcher.
+
+        Args:
+            analyzer: Analyzer whose LLM client serves the batches
+            batch_size: Number of pages that triggers an immediate request
+        """
+        self.analyzer = analyzer
+        self.batch_size = batch_size
+        # Pending pages per system prompt; only pages sharing one can go in one request
+        self._pending: dict[str, list[tuple[tuple[str, str, str], asyncio.Future]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._requests: set[asyncio.Task] = set()
+
+    async def analyze(
+        self, url: str, title: str, simplified_html: str, system_prompt: str
+    ) -> dict[str, Any]:
+        """
+        Queue a page for the next batch and wait for its analysis.
+
+        Args:
+            url: Page URL
+            title: Page title
+            simplified_html: Simplified page HTML
+            system_prompt: System prompt the page is analyzed with
+
+        Returns:
+            AI analysis results
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(system_prompt, [])
+        pending.append(((url, title, simplified_html), future))
+
+        if len(pending) >= self.batch_size:
+            self._send(system_prompt)
+        elif self._timer is None:
+            # Don't hold a partial batch back when the crawl runs out of pages
+            self._timer = loop.call_later(_BATCH_WINDOW_SECONDS, self._flush)
+
+        return await future
+
+    async def close(self) -> None:
+        """Cancel requests that are still in flight."""
+        if self._timer:
+            self._timer.cancel()
+        for request in self._requests:
+            request.cancel()
+        await asyncio.gather(*self._requests, return_exceptions=True)
+
+    def _flush(self) -> None:
+        """Send all pending pages."""
+        self._timer = None
+        for system_prompt in list(self._pending):
+            self._send(system_prompt)
+
+    def _send(self, system_prompt: str) -> None:
+        """Send the pending pages of one system prompt as a batch."""
+        batch = self._pending.pop(system_prompt, [])
+        if not self._pending and self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if batch:
+            request = asyncio.create_task(self._request(batch, system_prompt))
+            self._requests.add(request)
+            request.add_done_callback(self._requests.discard)
+
+    async def _request(
+        self,
+        batch: list[tuple[tuple[str, str, str], asyncio.Future]],
+        system_prompt: str,
+    ) -> None:
+        """Analyze a batch and hand each result to its waiting worker."""
+        try:
+            analyses = await self.analyzer._llm_analyze_batch(
+                [item for item, _ in batch], system_prompt
+            )
+        except Exception as e:
+            analyses = [{"error": str(e)}] * len(batch)
+
+        for (_, future), analysis in zip(batch, analyses, strict=True):
+            if not future.done():
+                future.set_result(analysis)
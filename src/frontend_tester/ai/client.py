@@ -1,6 +1,11 @@
 """LiteLLM client wrapper for unified LLM access."""
 
+import asyncio
+import contextlib
+import logging
 import os
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import litellm
@@ -8,6 +13,56 @@ from litellm import acompletion, completion
 
 from frontend_tester.core.config import LLMConfig
 
+logger = logging.getLogger(__name__)
+
+# Warn once the requests-per-minute limit holds back more than this share of requests,
+# judged after enough requests for the share to mean something
+_THROTTLED_WARNING_SHARE = 0.5
+_THROTTLED_WARNING_MIN_REQUESTS = 20
+
+# Output token limit assumed for models missing from LiteLLM's model map
+_DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+
+class _RateLimiter:
+    """Token bucket allowing ``max_rate`` requests per ``period`` seconds."""
+
+    def __init__(self, max_rate: int, period: float = 60.0):
+        """
+        Initialize the rate limiter with a full bucket.
+
+        Args:
+            max_rate: Requests allowed per period
+            period: Length of the period in seconds
+        """
+        self.max_rate = max_rate
+        self.rate = max_rate / period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        # Waiters queue on the lock, so they are served in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> bool:
+        """
+        Wait until a request may be sent.
+
+        Returns:
+            True if the request had to wait for the limit
+        """
+        async with self._lock:
+            self._refill()
+            throttled = self._tokens < 1
+            if throttled:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+            return throttled
+
 
 class LLMClient:
     """Unified LLM client using LiteLLM."""
@@ -30,6 +85,17 @@ class LLMClient:
 
         # Configure LiteLLM
         litellm.drop_params = True  # Drop unsupported params instead of erroring
+        litellm.suppress_debug_info = True  # No provider list printed for unmapped models
+
+        # Shared by every caller of this client (analyzer and generator alike)
+        self._request_slots = asyncio.Semaphore(self.config.max_concurrent_requests)
+        self._rate_limiter = (
+            _RateLimiter(self.config.rpm_limit) if self.config.rpm_limit else None
+        )
+        self._request_count = 0
+        self._throttled_count = 0
+        self._warned_throttled = False
+        self._max_output_tokens: int | None = None
 
     def get_model_name(self) -> str:
         """Get the full model name for LiteLLM."""
@@ -39,6 +105,85 @@ class LLMClient:
         else:
             return f"{self.config.provider}/{self.config.model}"
 
+    def get_max_output_tokens(self) -> int:
+        """
+        Get the most tokens the model can generate in one response.
+
+        Returns:
+            Limit from LiteLLM's model map, or a conservative default for unmapped models
+        """
+        if self._max_output_tokens is None:
+            try:
+                limit = litellm.get_model_info(self.get_model_name()).get("max_output_tokens")
+            except Exception:
+                limit = None
+            self._max_output_tokens = limit or _DEFAULT_MAX_OUTPUT_TOKENS
+        return self._max_output_tokens
+
+    @contextlib.asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Hold one of the concurrent request slots, within the requests-per-minute limit."""
+        async with self._request_slots:
+            if self._rate_limiter is not None:
+                throttled = await self._rate_limiter.acquire()
+                self._record_throttling(throttled)
+            yield
+
+    def _record_throttling(self, throttled: bool) -> None:
+        """
+        Track how often the rate limit delays requests and warn once it dominates.
+
+        Args:
+            throttled: Whether the latest request had to wait for the limit
+        """
+        self._request_count += 1
+        self._throttled_count += throttled
+        if (
+            not self._warned_throttled
+            and self._request_count >= _THROTTLED_WARNING_MIN_REQUESTS
+            and self._throttled_count > self._request_count * _THROTTLED_WARNING_SHARE
+        ):
+            self._warned_throttled = True
+            logger.warning(
+                "LLM requests are held back by the %d requests/minute limit (%d of %d "
+                "throttled); analyze several pages per request with --batch-size",
+                self.config.rpm_limit,
+                self._throttled_count,
+                self._request_count,
+            )
+
+    def _with_cache_hints(self, messages: list[dict[str, str]]) -> list[dict[str, Any]]:
+        """
+        Mark system prompts as cacheable prefixes for providers that need explicit hints.
+
+        Anthropic only caches prompt prefixes flagged with ``cache_control``; OpenAI
+        caches identical prefixes automatically, so messages are passed through as-is.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+
+        Returns:
+            Messages ready to send to LiteLLM
+        """
+        if self.config.provider != "anthropic":
+            return messages
+
+        return [
+            {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": message["content"],
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+            if message["role"] == "system" and isinstance(message["content"], str)
+            else message
+            for message in messages
+        ]
+
     async def chat(
         self,
         messages: list[dict[str, str]],
@@ -58,16 +203,57 @@ class LLMClient:
         Returns:
             Response content as string
         """
-        response = await acompletion(
-            model=self.get_model_name(),
-            messages=messages,
-            temperature=temperature or self.config.temperature,
-            max_tokens=max_tokens or self.config.max_tokens,
-            **kwargs,
-        )
+        async with self._request_slot():
+            response = await acompletion(
+                model=self.get_model_name(),
+                messages=self._with_cache_hints(messages),
+                temperature=temperature or self.config.temperature,
+                max_tokens=max_tokens or self.config.max_tokens,
+                **kwargs,
+            )
 
         return response.choices[0].message.content
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Send chat completion request and yield the response as it is generated.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (overrides config)
+            max_tokens: Maximum tokens (overrides config)
+            **kwargs: Additional parameters for LiteLLM
+
+        Yields:
+            Response content fragments
+        """
+        # The slot is held until the whole response has been streamed
+        async with self._request_slot():
+            response = await acompletion(
+                model=self.get_model_name(),
+                messages=self._with_cache_hints(messages),
+                temperature=temperature or self.config.temperature,
+                max_tokens=max_tokens or self.config.max_tokens,
+                stream=True,
+                **kwargs,
+            )
+
+            try:
+                async for chunk in response:
+                    content = chunk.choices[0].delta.content
+                    if content:
+                        yield content
+            finally:
+                # Stop the provider generating tokens nobody reads when the caller
+                # stops early
+                await response.aclose()
+
     def chat_sync(
         self,
         messages: list[dict[str, str]],
@@ -89,7 +275,7 @@ class LLMClient:
         """
         response = completion(
             model=self.get_model_name(),
-            messages=messages,
+            messages=self._with_cache_hints(messages),
             temperature=temperature or self.config.temperature,
             max_tokens=max_tokens or self.config.max_tokens,
             **kwargs,
@@ -123,6 +309,38 @@ class LLMClient:
 
         return await self.chat(messages, temperature, max_tokens)
 
+    async def stream_with_system_prompt(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate response with system and user prompts, streaming it as it is generated.
+
+        Args:
+            system_prompt: System instruction
+            user_prompt: User query
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+
+        Yields:
+            Response content fragments
+        """
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+        # Closing this generator early also closes the inner stream, releasing its
+        # request slot and response right away
+        async with contextlib.aclosing(
+            self.chat_stream(messages, temperature, max_tokens)
+        ) as stream:
+            async for content in stream:
+                yield content
+
     def generate_with_system_prompt_sync(
         self,
         system_prompt: str,
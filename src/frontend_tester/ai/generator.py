@@ -1,34 +1,174 @@
 """Test generation module for creating Gherkin scenarios and step definitions."""
 
-import json
+import asyncio
+import contextlib
+import hashlib
+import os
+import re
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
 
+from frontend_tester.ai.analyzer import ElementInfo, json_default
 from frontend_tester.ai.client import LLMClient
 from frontend_tester.ai.prompts.test_generation import (
-    GENERATE_FEATURE_FILE_SYSTEM_PROMPT,
-    GENERATE_FEATURE_FILE_USER_PROMPT,
     GENERATE_SCENARIOS_SYSTEM_PROMPT,
-    GENERATE_SCENARIOS_USER_PROMPT,
-    GENERATE_STEP_DEFINITIONS_SYSTEM_PROMPT,
-    GENERATE_STEP_DEFINITIONS_USER_PROMPT,
+    render_generate_feature_file_system_prompt,
+    render_generate_feature_file_user_prompt,
+    render_generate_scenarios_user_prompt,
+    render_generate_step_definitions_system_prompt,
+    render_generate_step_definitions_user_prompt,
 )
+from frontend_tester.core import json_utils
+
+# Responses sampled above this temperature are meant to vary between runs, so
+# they are never served from the cache
+_MAX_CACHEABLE_TEMPERATURE = 0.5
+
+# Gherkin keywords that start a step line
+_STEP_KEYWORDS = ("Given", "When", "Then", "And", "But")
+
+# ASCII characters not allowed in generated filenames (all but letters, digits and "_")
+_FILENAME_DELETE_TABLE = dict.fromkeys(
+    code for code in range(128) if not (chr(code).isalnum() or chr(code) == "_")
+)
+
+# Markdown code fences (```python, ```gherkin, etc.) around LLM code responses
+_FENCE_OPEN_PATTERN = re.compile(r"^```[a-z]*\n", re.MULTILINE)
+_FENCE_CLOSE_PATTERN = re.compile(r"\n```$", re.MULTILINE)
+_FENCE_LANG_LINE_PATTERN = re.compile(r"^```[a-z]*$", re.MULTILINE)
+_FENCE_LINE_PATTERN = re.compile(r"^```$", re.MULTILINE)
+
+# Chatty lead-ins like "Here is the feature file:" before the code
+_HERE_PREAMBLE_PATTERN = re.compile(r"^Here (is|are|'s).*?:\s*\n+", re.IGNORECASE)
+_BELOW_PREAMBLE_PATTERN = re.compile(r"^Below (is|are).*?:\s*\n+", re.IGNORECASE)
+
+# Line starts that mark the beginning of Gherkin or Python code
+_CODE_START_PREFIXES = ("Feature:", "import", "from", "@", "def", "class")
+
+# Prompt budget for page elements, estimated at ~4 characters of JSON per token
+_ELEMENTS_BUDGET_TOKENS = 4000
+_CHARS_PER_TOKEN = 4
+
+# Element categories in the order they are kept when the budget runs out
+_ELEMENT_CATEGORY_PRIORITY = ("buttons", "inputs", "forms", "selects", "textareas", "links")
+
+# AI analysis results worth sending back to the LLM (errors and raw replies are not)
+_ANALYSIS_PROMPT_KEYS = ("interactive_elements", "user_flows", "forms", "navigation")
+
+
+def _compact_element(element: ElementInfo | dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduce an element to its non-empty attributes.
+
+    Args:
+        element: Extracted element (or its dict form loaded from an analysis file)
+
+    Returns:
+        Element dict without empty values
+    """
+    info = element.to_dict() if isinstance(element, ElementInfo) else element
+    return {key: value for key, value in info.items() if value not in (None, "", [])}
+
+
+def _minify_elements(
+    elements: dict[str, list[Any]] | list[Any],
+    budget_tokens: int = _ELEMENTS_BUDGET_TOKENS,
+) -> dict[str, list[dict[str, Any]]] | list[dict[str, Any]]:
+    """
+    Shrink page elements to fit a prompt token budget.
+
+    Empty attributes are dropped, then elements are kept in category priority order
+    (buttons and inputs before links) until the estimated budget is used up.
+
+    Args:
+        elements: Elements by category, or a flat list of elements
+        budget_tokens: Approximate token budget for the elements
+
+    Returns:
+        Compacted elements in the same shape as given
+    """
+    budget = budget_tokens * _CHARS_PER_TOKEN
+
+    def take(category_elements: list[Any]) -> list[dict[str, Any]]:
+        nonlocal budget
+        kept = []
+        for element in category_elements:
+            compact = _compact_element(element)
+            size = len(json_utils.dumps(compact, default=json_default))
+            if size > budget:
+                budget = 0
+                break
+            budget -= size
+            kept.append(compact)
+        return kept
+
+    if isinstance(elements, list):
+        return take(elements)
+
+    categories = [c for c in _ELEMENT_CATEGORY_PRIORITY if c in elements]
+    categories += [c for c in elements if c not in _ELEMENT_CATEGORY_PRIORITY]
+    return {category: take(elements[category]) for category in categories}
+
+
+def _minify_analysis(analysis: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduce a page analysis to the parts useful for test generation.
+
+    Args:
+        analysis: UI analysis results
+
+    Returns:
+        Analysis with compacted elements and only the AI results the LLM needs
+    """
+    ai_analysis = analysis.get("ai_analysis") or {}
+    return {
+        "url": analysis.get("url"),
+        "title": analysis.get("title"),
+        "basic_elements": _minify_elements(analysis.get("basic_elements", {})),
+        "ai_analysis": {
+            key: ai_analysis[key] for key in _ANALYSIS_PROMPT_KEYS if key in ai_analysis
+        },
+    }
+
+
+def _prompt_json(obj: Any) -> str:
+    """
+    Serialize analysis data for a prompt.
+
+    Compact (unindented) JSON reads the same to the model but costs noticeably fewer
+    tokens on large analyses.
+
+    Args:
+        obj: Analysis results or elements
+
+    Returns:
+        JSON text
+    """
+    return json_utils.dumps(obj, default=json_default).decode()
 
 
 class TestGenerator:
     """Generate BDD test scenarios and step definitions using LLM."""
 
-    def __init__(self, llm_client: LLMClient):
+    def __init__(self, llm_client: LLMClient, cache_dir: Path | None = None):
         """
         Initialize test generator.
 
         Args:
             llm_client: LLM client for AI-powered generation
+            cache_dir: Directory persisting LLM responses between runs (None to disable)
         """
         self.llm_client = llm_client
+        self.cache_dir = cache_dir
+        self._response_cache: dict[str, str] = {}
 
     async def generate_scenarios(
-        self, url: str, title: str, analysis: dict[str, Any]
+        self,
+        url: str,
+        title: str,
+        analysis: dict[str, Any],
+        output_path: Path | None = None,
     ) -> str:
         """
         Generate Gherkin scenarios from UI analysis.
@@ -37,21 +177,23 @@ class TestGenerator:
             url: Page URL
             title: Page title
             analysis: UI analysis results
+            output_path: File to write the raw scenarios to as they are generated
 
         Returns:
             Generated Gherkin scenarios as string
         """
-        user_prompt = GENERATE_SCENARIOS_USER_PROMPT.format(
+        user_prompt = render_generate_scenarios_user_prompt(
             url=url,
             title=title,
-            analysis=json.dumps(analysis, indent=2),
+            analysis=_prompt_json(_minify_analysis(analysis)),
         )
 
-        scenarios = await self.llm_client.generate_with_system_prompt(
+        scenarios = await self._cached_generate(
             system_prompt=GENERATE_SCENARIOS_SYSTEM_PROMPT,
             user_prompt=user_prompt,
             temperature=0.7,
             max_tokens=4000,
+            output_path=output_path,
         )
 
         return scenarios
@@ -62,6 +204,7 @@ class TestGenerator:
         url: str,
         flow_name: str,
         elements: list[dict[str, Any]],
+        output_path: Path | None = None,
     ) -> str:
         """
         Generate complete Gherkin feature file.
@@ -71,32 +214,38 @@ class TestGenerator:
             url: Page URL
             flow_name: User flow name
             elements: List of interactive elements
+            output_path: File to write the feature to, streamed as it is generated
 
         Returns:
             Generated feature file content
         """
-        user_prompt = GENERATE_FEATURE_FILE_USER_PROMPT.format(
+        # Elements go in the system prompt, identical (and cached) for every flow
+        system_prompt = render_generate_feature_file_system_prompt(
+            elements=_prompt_json(_minify_elements(elements)),
+        )
+        user_prompt = render_generate_feature_file_user_prompt(
             app_name=app_name,
             url=url,
             flow_name=flow_name,
-            elements=json.dumps(elements, indent=2),
         )
 
-        feature_content = await self.llm_client.generate_with_system_prompt(
-            system_prompt=GENERATE_FEATURE_FILE_SYSTEM_PROMPT,
+        feature_content = await self._cached_generate(
+            system_prompt=system_prompt,
             user_prompt=user_prompt,
             temperature=0.6,
             max_tokens=3000,
+            output_path=output_path,
         )
 
         # Clean up markdown code fences if present
-        return self._clean_code_response(feature_content)
+        return await self._finish_code_file(feature_content, output_path)
 
     async def generate_step_definitions(
         self,
         gherkin_steps: list[str],
         url: str,
         elements: list[dict[str, Any]],
+        output_path: Path | None = None,
     ) -> str:
         """
         Generate Python step definitions for Gherkin steps.
@@ -105,27 +254,181 @@ class TestGenerator:
             gherkin_steps: List of Gherkin step strings
             url: Page URL
             elements: Available elements from analysis
+            output_path: File to write the code to, streamed as it is generated
 
         Returns:
             Generated Python code for step definitions
         """
         steps_text = "\n".join(gherkin_steps)
 
-        user_prompt = GENERATE_STEP_DEFINITIONS_USER_PROMPT.format(
+        system_prompt = render_generate_step_definitions_system_prompt(
+            elements=_prompt_json(_minify_elements(elements)),
+        )
+        user_prompt = render_generate_step_definitions_user_prompt(
             gherkin_steps=steps_text,
             url=url,
-            elements=json.dumps(elements, indent=2),
         )
 
-        step_definitions = await self.llm_client.generate_with_system_prompt(
-            system_prompt=GENERATE_STEP_DEFINITIONS_SYSTEM_PROMPT,
+        step_definitions = await self._cached_generate(
+            system_prompt=system_prompt,
             user_prompt=user_prompt,
             temperature=0.4,  # Lower temperature for code generation
             max_tokens=4000,
+            output_path=output_path,
         )
 
         # Clean up markdown code fences if present
-        return self._clean_code_response(step_definitions)
+        return await self._finish_code_file(step_definitions, output_path)
+
+    async def _finish_code_file(self, response: str, output_path: Path | None) -> str:
+        """
+        Clean a code response and rewrite its streamed file if cleaning changed it.
+
+        Args:
+            response: Raw LLM response
+            output_path: File holding the raw response (None if not written)
+
+        Returns:
+            Cleaned response
+        """
+        cleaned = self._clean_code_response(response)
+        if output_path is not None and cleaned != response:
+            await self._write_file(output_path, cleaned)
+        return cleaned
+
+    async def _cached_generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        output_path: Path | None = None,
+    ) -> str:
+        """
+        Generate a response, reusing earlier identical low-temperature requests.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            output_path: File that receives the raw response (None to skip)
+
+        Returns:
+            Generated text
+        """
+        cache_key = None
+        if temperature <= _MAX_CACHEABLE_TEMPERATURE:
+            request = (
+                self.llm_client.get_model_name(),
+                system_prompt,
+                user_prompt,
+                temperature,
+                max_tokens,
+            )
+            cache_key = hashlib.sha256(repr(request).encode()).hexdigest()
+            response = self._response_cache.get(cache_key)
+            if response is None and self.cache_dir:
+                response = await asyncio.to_thread(self._read_cached_response, cache_key)
+                if response is not None:
+                    self._response_cache[cache_key] = response
+
+            if response is not None:
+                if output_path is not None:
+                    await self._write_file(output_path, response)
+                return response
+
+        response = await self._stream_response(
+            system_prompt, user_prompt, temperature, max_tokens, output_path
+        )
+
+        if cache_key is not None:
+            self._response_cache[cache_key] = response
+            if self.cache_dir:
+                await asyncio.to_thread(self._write_cached_response, cache_key, response)
+        return response
+
+    async def _stream_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        output_path: Path | None,
+    ) -> str:
+        """
+        Stream a response from the LLM, writing it to a file as it arrives.
+
+        The response streams into a ".part" file next to output_path, which replaces
+        output_path once complete; on failure it is removed and output_path is left
+        untouched.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            output_path: File that receives the response (None to only collect it)
+
+        Returns:
+            Generated text
+        """
+        stream = self.llm_client.stream_with_system_prompt(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        # Closing the stream on any exit releases the client's request slot right away,
+        # instead of whenever the abandoned generator is garbage collected
+        async with contextlib.aclosing(stream):
+            if output_path is None:
+                return "".join([fragment async for fragment in stream])
+
+            fragments = []
+            partial_path = output_path.with_name(f"{output_path.name}.part")
+            output_file = await asyncio.to_thread(open, partial_path, "w")
+            try:
+                try:
+                    async for fragment in stream:
+                        # Buffered writes only copy into memory; the file flushes in blocks
+                        output_file.write(fragment)
+                        fragments.append(fragment)
+                finally:
+                    output_file.close()
+                await asyncio.to_thread(os.replace, partial_path, output_path)
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                raise
+        return "".join(fragments)
+
+    def _read_cached_response(self, cache_key: str) -> str | None:
+        """
+        Load a response persisted by an earlier run (blocking).
+
+        Args:
+            cache_key: Request digest
+
+        Returns:
+            Cached response, or None if missing or unreadable
+        """
+        try:
+            entry = json_utils.loads((self.cache_dir / f"{cache_key}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+        return entry.get("response")
+
+    def _write_cached_response(self, cache_key: str, response: str) -> None:
+        """
+        Persist a response for later runs (blocking).
+
+        Args:
+            cache_key: Request digest
+            response: Generated text
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"model": self.llm_client.get_model_name(), "response": response}
+        (self.cache_dir / f"{cache_key}.json").write_bytes(json_utils.dumps(entry))
 
     async def generate_complete_test_suite(
         self,
@@ -148,29 +451,20 @@ class TestGenerator:
         """
         generated_files = {}
 
-        # Create output directories
+        # Create output directories once, before any flow writes into them
         features_dir = output_dir / "features"
         steps_dir = output_dir / "steps"
-        features_dir.mkdir(parents=True, exist_ok=True)
-        steps_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.gather(
+            asyncio.to_thread(features_dir.mkdir, parents=True, exist_ok=True),
+            asyncio.to_thread(steps_dir.mkdir, parents=True, exist_ok=True),
+        )
 
         # Extract user flows from analysis
         ai_analysis = analysis.get("ai_analysis", {})
         user_flows = ai_analysis.get("user_flows", [])
 
         if not user_flows:
-            # Generate generic scenarios if no flows detected
-            scenarios = await self.generate_scenarios(
-                url=url,
-                title=analysis.get("title", ""),
-                analysis=analysis,
-            )
-
-            # Clean markdown code fences
-            scenarios_cleaned = self._clean_code_response(scenarios)
-
             # Generate feature filename from URL
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             feature_name = parsed.path.strip("/").replace("/", "_") or "index"
             if parsed.fragment:
@@ -178,72 +472,150 @@ class TestGenerator:
                 if fragment_clean:
                     feature_name += "_" + fragment_clean
 
-            # Save feature file
+            # Generate generic scenarios if no flows detected, saved as they stream in
             feature_file = features_dir / f"{feature_name}.feature"
-            with open(feature_file, "w") as f:
-                f.write(scenarios_cleaned)
+            scenarios = await self.generate_scenarios(
+                url=url,
+                title=analysis.get("title", ""),
+                analysis=analysis,
+                output_path=feature_file,
+            )
+
+            # Clean markdown code fences
+            scenarios_cleaned = self._clean_code_response(scenarios)
 
             generated_files["feature"] = feature_file
 
+            # Rewrite the cleaned feature file while the step definitions are generated
+            pending = []
+            if scenarios_cleaned != scenarios:
+                pending.append(self._write_file(feature_file, scenarios_cleaned))
+
             # Extract steps and generate step definitions
             steps = self._extract_steps_from_feature(scenarios_cleaned)
             if steps:
                 elements = analysis.get("basic_elements", {})
-                step_definitions = await self.generate_step_definitions(
-                    gherkin_steps=steps,
-                    url=url,
-                    elements=elements,
-                )
-
-                # Save step definitions
                 steps_file = steps_dir / f"test_{feature_name}.py"
-                with open(steps_file, "w") as f:
-                    f.write(step_definitions)
+                pending.append(
+                    self.generate_step_definitions(
+                        gherkin_steps=steps,
+                        url=url,
+                        elements=elements,
+                        output_path=steps_file,
+                    )
+                )
 
                 generated_files["steps"] = steps_file
 
-        else:
-            # Generate feature file for each flow
-            for i, flow in enumerate(user_flows):
-                flow_name = flow.get("name", f"Flow {i + 1}")
-                elements = analysis.get("basic_elements", {})
+            await asyncio.gather(*pending)
 
-                # Generate feature file
-                feature_content = await self.generate_feature_file(
-                    app_name=app_name,
-                    url=url,
-                    flow_name=flow_name,
-                    elements=elements,
+        else:
+            # Generate every flow concurrently; each flow chains its own step
+            # definitions as soon as its feature file is ready
+            elements = analysis.get("basic_elements", {})
+            step_requests: dict[str, asyncio.Task[str]] = {}
+            flow_names = [flow.get("name", f"Flow {i + 1}") for i, flow in enumerate(user_flows)]
+            flow_results = await asyncio.gather(
+                *(
+                    self._generate_flow_files(
+                        app_name=app_name,
+                        url=url,
+                        flow_name=flow_name,
+                        safe_flow_name=safe_flow_name,
+                        elements=elements,
+                        features_dir=features_dir,
+                        steps_dir=steps_dir,
+                        step_requests=step_requests,
+                    )
+                    for flow_name, safe_flow_name in zip(
+                        flow_names, self._unique_filenames(flow_names), strict=True
+                    )
                 )
+            )
 
-                # Save feature file
-                safe_flow_name = self._sanitize_filename(flow_name)
-                feature_file = features_dir / f"{safe_flow_name}.feature"
-                with open(feature_file, "w") as f:
-                    f.write(feature_content)
+            # Merge in flow order so the result is deterministic
+            for flow_files in flow_results:
+                generated_files.update(flow_files)
 
-                generated_files[f"feature_{safe_flow_name}"] = feature_file
+        return generated_files
 
-                # Extract steps from feature content
-                steps = self._extract_steps_from_feature(feature_content)
+    async def _generate_flow_files(
+        self,
+        app_name: str,
+        url: str,
+        flow_name: str,
+        safe_flow_name: str,
+        elements: list[dict[str, Any]],
+        features_dir: Path,
+        steps_dir: Path,
+        step_requests: dict[str, asyncio.Task[str]],
+    ) -> dict[str, Path]:
+        """
+        Generate and save the feature file and step definitions for one flow.
+
+        Args:
+            app_name: Application name
+            url: Page URL
+            flow_name: User flow name
+            safe_flow_name: File name stem for the flow, unique within the suite
+            elements: Available elements from analysis
+            features_dir: Directory for feature files
+            steps_dir: Directory for step definition files
+            step_requests: Step definition requests of the suite, by step set digest
+
+        Returns:
+            Dict mapping file types to generated file paths for this flow
+        """
+        generated_files = {}
+
+        # Generate feature file, saved as it streams in
+        feature_file = features_dir / f"{safe_flow_name}.feature"
+        feature_content = await self.generate_feature_file(
+            app_name=app_name,
+            url=url,
+            flow_name=flow_name,
+            elements=elements,
+            output_path=feature_file,
+        )
+
+        generated_files[f"feature_{safe_flow_name}"] = feature_file
 
-                # Generate step definitions
-                if steps:
-                    step_definitions = await self.generate_step_definitions(
+        # Extract steps from feature content
+        steps = self._extract_steps_from_feature(feature_content)
+
+        # Generate step definitions, once per distinct step set of the suite
+        if steps:
+            steps_file = steps_dir / f"test_{safe_flow_name}.py"
+            step_key = hashlib.sha256("\n".join(sorted(steps)).encode()).hexdigest()
+            request = step_requests.get(step_key)
+            if request is None:
+                request = asyncio.create_task(
+                    self.generate_step_definitions(
                         gherkin_steps=steps,
                         url=url,
                         elements=elements,
+                        output_path=steps_file,
                     )
+                )
+                step_requests[step_key] = request
+                await request
+            else:
+                await self._write_file(steps_file, await request)
 
-                    # Save step definitions
-                    steps_file = steps_dir / f"test_{safe_flow_name}.py"
-                    with open(steps_file, "w") as f:
-                        f.write(step_definitions)
-
-                    generated_files[f"steps_{safe_flow_name}"] = steps_file
+            generated_files[f"steps_{safe_flow_name}"] = steps_file
 
         return generated_files
 
+    async def _write_file(self, path: Path, content: str) -> None:
+        """
+        Write generated content without blocking the event loop.
+
+        Args:
+            path: Output file path
+            content: File content
+        """
+        await asyncio.to_thread(path.write_text, content)
+
     def _extract_steps_from_feature(self, feature_content: str) -> list[str]:
         """
         Extract Gherkin steps from feature file content.
@@ -252,18 +624,16 @@ class TestGenerator:
             feature_content: Feature file content
 
         Returns:
-            List of unique step strings
+            List of unique step strings, in order of first appearance
         """
-        steps = []
-        lines = feature_content.split("\n")
-
-        for line in lines:
+        # Insertion-ordered dedupe, so prompts (and their cache keys) are stable
+        steps = {}
+        for line in feature_content.split("\n"):
             line = line.strip()
-            if any(line.startswith(keyword) for keyword in ["Given", "When", "Then", "And", "But"]):
-                steps.append(line)
+            if line.startswith(_STEP_KEYWORDS):
+                steps[line] = None
 
-        # Return unique steps
-        return list(set(steps))
+        return list(steps)
 
     def _sanitize_filename(self, name: str) -> str:
         """
@@ -278,10 +648,38 @@ class TestGenerator:
         # Replace spaces and special characters
         safe_name = name.lower()
         safe_name = safe_name.replace(" ", "_")
-        safe_name = "".join(c for c in safe_name if c.isalnum() or c == "_")
+        safe_name = safe_name.translate(_FILENAME_DELETE_TABLE)
+
+        # Non-ASCII letters and digits are kept, other non-ASCII characters dropped
+        if not safe_name.isascii():
+            safe_name = "".join(c for c in safe_name if c.isalnum() or c == "_")
 
         return safe_name
 
+    def _unique_filenames(self, names: list[str]) -> list[str]:
+        """
+        Sanitize names for use as filenames, suffixing those that would collide.
+
+        Flows are generated concurrently, so two flows sharing a file would stream
+        into it at the same time.
+
+        Args:
+            names: Original names
+
+        Returns:
+            Distinct sanitized filenames, in the order of names
+        """
+        used: set[str] = set()
+        filenames = []
+        for name in names:
+            base = self._sanitize_filename(name)
+            filename, counter = base, 2
+            while filename in used:
+                filename, counter = f"{base}_{counter}", counter + 1
+            used.add(filename)
+            filenames.append(filename)
+        return filenames
+
     def _clean_code_response(self, response: str) -> str:
         """
         Clean LLM response by removing markdown code fences and preamble.
@@ -292,26 +690,24 @@ class TestGenerator:
         Returns:
             Cleaned response
         """
-        import re
-
         # Remove markdown code fences (```python, ```gherkin, etc.)
-        cleaned = re.sub(r'^```[a-z]*\n', '', response, flags=re.MULTILINE)
-        cleaned = re.sub(r'\n```$', '', cleaned, flags=re.MULTILINE)
-        cleaned = re.sub(r'^```[a-z]*$', '', cleaned, flags=re.MULTILINE)
-        cleaned = re.sub(r'^```$', '', cleaned, flags=re.MULTILINE)
+        cleaned = _FENCE_OPEN_PATTERN.sub("", response)
+        cleaned = _FENCE_CLOSE_PATTERN.sub("", cleaned)
+        cleaned = _FENCE_LANG_LINE_PATTERN.sub("", cleaned)
+        cleaned = _FENCE_LINE_PATTERN.sub("", cleaned)
 
         # Remove common preamble patterns
         # Match lines like "Here is..." or "Here's..." at the start
-        cleaned = re.sub(r'^Here (is|are|\'s).*?:\s*\n+', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'^Below (is|are).*?:\s*\n+', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _HERE_PREAMBLE_PATTERN.sub("", cleaned)
+        cleaned = _BELOW_PREAMBLE_PATTERN.sub("", cleaned)
 
         # If the response starts with "Feature:" or "import", it's likely clean
         # Otherwise, try to find the actual code start
-        if not (cleaned.strip().startswith(('Feature:', 'import', 'from', '@', 'def', 'class'))):
+        if not cleaned.strip().startswith(_CODE_START_PREFIXES):
             # Try to find where actual code starts
             lines = cleaned.split('\n')
             for i, line in enumerate(lines):
-                if line.strip().startswith(('Feature:', 'import', 'from', '@', 'def', 'class')):
+                if line.strip().startswith(_CODE_START_PREFIXES):
                     cleaned = '\n'.join(lines[i:])
                     break
 
@@ -327,10 +723,8 @@ class TestGenerator:
             feature_content: Feature file content
             output_path: Output file path
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w") as f:
-            f.write(feature_content)
+        await asyncio.to_thread(output_path.parent.mkdir, parents=True, exist_ok=True)
+        await self._write_file(output_path, feature_content)
 
     async def save_step_definitions(
         self, step_definitions: str, output_path: Path
@@ -342,7 +736,5 @@ class TestGenerator:
             step_definitions: Step definitions code
             output_path: Output file path
         """
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, "w") as f:
-            f.write(step_definitions)
+        await asyncio.to_thread(output_path.parent.mkdir, parents=True, exist_ok=True)
+        await self._write_file(output_path, step_definitions)
@@ -1 +1,46 @@
 """Prompt templates for AI test generation."""
+
+from collections.abc import Callable
+from string import Formatter
+
+
+def compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Compile a str.format-style prompt template into a render function.
+
+    The template is parsed once, so rendering only joins the static text with the
+    given values. Output is identical to ``template.format(**values)``.
+
+    Args:
+        template: Template with named ``{field}`` placeholders (no format specs)
+
+    Returns:
+        Function taking the field values as keyword arguments
+
+    Raises:
+        ValueError: If the template uses positional fields, format specs or conversions
+    """
+    literals = []
+    fields = []
+    literal_text = ""
+
+    # Escaped braces split the static text into several chunks; merge them per field
+    for literal, field, format_spec, conversion in Formatter().parse(template):
+        literal_text += literal
+        if field is None:
+            continue
+        if not field.isidentifier() or format_spec or conversion:
+            raise ValueError(f"Unsupported prompt placeholder: {{{field}}}")
+        literals.append(literal_text)
+        fields.append(field)
+        literal_text = ""
+    literals.append(literal_text)
+
+    def render(**values: object) -> str:
+        parts = [literals[0]]
+        for field, literal in zip(fields, literals[1:], strict=True):
+            parts.append(str(values[field]))
+            parts.append(literal)
+        return "".join(parts)
+
+    return render
@@ -1,5 +1,7 @@
 """Prompt templates for test generation."""
 
+from frontend_tester.ai.prompts import compile_prompt
+
 GENERATE_SCENARIOS_SYSTEM_PROMPT = """You are an expert QA engineer specializing in BDD (Behavior-Driven Development).
 Generate Gherkin scenarios for automated testing based on UI analysis.
 
@@ -14,34 +16,36 @@ Guidelines:
 
 Generate scenarios that can be automated with Playwright."""
 
-GENERATE_SCENARIOS_USER_PROMPT = """Based on the following UI analysis, generate BDD test scenarios:
-
-URL: {url}
-Page Title: {title}
-
-UI Analysis:
-{analysis}
+# Static instructions come first and request data last, so that consecutive requests
+# share the longest possible prefix for provider-side prompt caching
+GENERATE_SCENARIOS_USER_PROMPT = """Generate BDD test scenarios for the page whose UI analysis is given at the end of this message.
 
-Generate Gherkin scenarios for testing this page. Include:
+Include:
 1. Main user flows (happy paths)
 2. Edge cases
 3. Validation scenarios
 4. Navigation scenarios
 
 Format as valid Gherkin with proper Feature and Scenario structure.
-Add tags for test categorization (@smoke, @regression, etc.)."""
+Add tags for test categorization (@smoke, @regression, etc.).
+
+URL: {url}
+Page Title: {title}
+
+UI Analysis:
+{analysis}"""
 
 GENERATE_FEATURE_FILE_SYSTEM_PROMPT = """You are a BDD test automation expert.
 Generate complete Gherkin feature files for web application testing."""
 
-GENERATE_FEATURE_FILE_USER_PROMPT = """Generate a complete Gherkin feature file for:
+# The page elements are the same for every flow of a page, so they live in the
+# (cacheable) system prompt and the user prompt only names the flow
+GENERATE_FEATURE_FILE_ELEMENTS_SYSTEM_PROMPT = GENERATE_FEATURE_FILE_SYSTEM_PROMPT + """
 
-Application: {app_name}
-URL: {url}
-User Flow: {flow_name}
+Interactive Elements of the page under test:
+{elements}"""
 
-Interactive Elements:
-{elements}
+GENERATE_FEATURE_FILE_USER_PROMPT = """Generate a complete Gherkin feature file for the user flow given at the end of this message.
 
 Include:
 1. Feature description
@@ -53,7 +57,11 @@ Include:
 4. Appropriate tags
 
 Use step definitions that can be implemented with Playwright.
-Focus on blackbox testing (no internal implementation details)."""
+Focus on blackbox testing (no internal implementation details).
+
+Application: {app_name}
+URL: {url}
+User Flow: {flow_name}"""
 
 GENERATE_STEP_DEFINITIONS_SYSTEM_PROMPT = """You are a Playwright automation expert.
 Generate Python step definitions for pytest-bdd that implement Gherkin scenarios.
@@ -67,13 +75,12 @@ Guidelines:
 6. Use fixtures (page, browser_context)
 7. Make steps reusable"""
 
-GENERATE_STEP_DEFINITIONS_USER_PROMPT = """Generate Python step definitions for these Gherkin steps:
-
-{gherkin_steps}
+GENERATE_STEP_DEFINITIONS_ELEMENTS_SYSTEM_PROMPT = GENERATE_STEP_DEFINITIONS_SYSTEM_PROMPT + """
 
-Page URL: {url}
 Available Elements:
-{elements}
+{elements}"""
+
+GENERATE_STEP_DEFINITIONS_USER_PROMPT = """Generate Python step definitions for the Gherkin steps given at the end of this message.
 
 Requirements:
 1. Use pytest-bdd with Playwright
@@ -82,4 +89,22 @@ Requirements:
 4. Include assertions with clear error messages
 5. Add docstrings
 
-Generate complete, working Python code."""
+Generate complete, working Python code.
+
+Page URL: {url}
+
+Gherkin Steps:
+{gherkin_steps}"""
+
+# Precompiled renderers for the per-request prompts (same output as .format)
+render_generate_scenarios_user_prompt = compile_prompt(GENERATE_SCENARIOS_USER_PROMPT)
+render_generate_feature_file_system_prompt = compile_prompt(
+    GENERATE_FEATURE_FILE_ELEMENTS_SYSTEM_PROMPT
+)
+render_generate_feature_file_user_prompt = compile_prompt(GENERATE_FEATURE_FILE_USER_PROMPT)
+render_generate_step_definitions_system_prompt = compile_prompt(
+    GENERATE_STEP_DEFINITIONS_ELEMENTS_SYSTEM_PROMPT
+)
+render_generate_step_definitions_user_prompt = compile_prompt(
+    GENERATE_STEP_DEFINITIONS_USER_PROMPT
+)
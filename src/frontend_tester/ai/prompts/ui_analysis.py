@@ -1,5 +1,7 @@
 """Prompt templates for UI analysis."""
 
+from frontend_tester.ai.prompts import compile_prompt
+
 ANALYZE_UI_SYSTEM_PROMPT = """You are an expert frontend QA engineer specializing in blackbox testing.
 Your task is to analyze web page HTML and identify testable elements and user flows.
 
@@ -12,15 +14,22 @@ Focus on:
 
 Provide structured analysis that can be used to generate automated tests."""
 
-ANALYZE_UI_USER_PROMPT = """Analyze the following HTML from a web page:
+# Marks where each page's own HTML goes in a site's shared layout
+SHARED_LAYOUT_CONTENT_MARKER = "<!-- page content -->"
 
-URL: {url}
-Page Title: {title}
+# Used once a site's pages are known to share a layout; the layout is sent here, in the
+# cacheable system prompt, and user prompts carry only the page-specific HTML
+ANALYZE_UI_SHARED_LAYOUT_SYSTEM_PROMPT = ANALYZE_UI_SYSTEM_PROMPT + """
 
-HTML Content:
-{html}
+All pages of this site share the layout below. The HTML content given for a page
+replaces the """ + SHARED_LAYOUT_CONTENT_MARKER + """ marker; treat the elements of the
+layout (navigation, header, footer) as part of every page.
+
+Shared layout:
+{layout}"""
 
-Please provide:
+# Shared by the single-page and batch prompts
+_ANALYZE_UI_REQUIREMENTS = """Please provide:
 1. List of all interactive elements (buttons, links, inputs, selects, etc.) with their:
    - Type (button, link, input, etc.)
    - Identifier (id, name, or unique selector)
@@ -32,9 +41,9 @@ Please provide:
 3. Forms on the page with their fields
 
 4. Navigation elements (menus, breadcrumbs, etc.)
+"""
 
-Format your response as JSON with this structure:
-{{
+_ANALYZE_UI_SCHEMA = """{{
   "interactive_elements": [
     {{
       "type": "button",
@@ -63,6 +72,45 @@ Format your response as JSON with this structure:
 }}
 """
 
+# Static instructions come first and page data last, so that consecutive requests
+# share the longest possible prefix for provider-side prompt caching
+ANALYZE_UI_USER_PROMPT = """Analyze the HTML from a web page given at the end of this message.
+
+""" + _ANALYZE_UI_REQUIREMENTS + """
+Format your response as JSON with this structure:
+""" + _ANALYZE_UI_SCHEMA + """
+URL: {url}
+Page Title: {title}
+
+HTML Content:
+{html}
+"""
+
+ANALYZE_UI_BATCH_USER_PROMPT = """Analyze each of the {count} web pages given at the end of this message.
+
+""" + _ANALYZE_UI_REQUIREMENTS + """
+Format your response as a JSON array holding exactly one analysis object per page,
+in the same order as the pages are given. Add a "page" field with the page number to
+each object, which otherwise has this structure:
+""" + _ANALYZE_UI_SCHEMA + """
+{pages}"""
+
+ANALYZE_UI_BATCH_PAGE = """Page {index}:
+URL: {url}
+Page Title: {title}
+
+HTML Content:
+{html}
+"""
+
+# Precompiled renderers for the per-page prompts (same output as .format)
+render_analyze_ui_shared_layout_system_prompt = compile_prompt(
+    ANALYZE_UI_SHARED_LAYOUT_SYSTEM_PROMPT
+)
+render_analyze_ui_user_prompt = compile_prompt(ANALYZE_UI_USER_PROMPT)
+render_analyze_ui_batch_user_prompt = compile_prompt(ANALYZE_UI_BATCH_USER_PROMPT)
+render_analyze_ui_batch_page = compile_prompt(ANALYZE_UI_BATCH_PAGE)
+
 EXTRACT_ELEMENTS_SYSTEM_PROMPT = """You are a web scraping expert.
 Extract all interactive elements from the HTML that can be used for automated testing.
 Focus on elements users can interact with: buttons, links, inputs, selects, textareas."""
@@ -7,11 +7,31 @@ from playwright.async_api import Page, expect
 from pytest_bdd import given, when, then, parsers
 
 
+def _step_regex(pattern: str) -> parsers.re:
+    """Build a step parser from a regular expression, compiled once at import.
+
+    Wording aliases share one pattern (alternations), so each step lookup tries
+    fewer parsers. Quoted and unquoted forms stay separate patterns: optional quotes
+    would also strip a closing quote that belongs to an unquoted argument (as in
+    ``text="Save"``).
+
+    Matches like ``parsers.parse`` (case-insensitive, whole step text) but skips the
+    parse library's result building and type conversion on every step lookup.
+
+    Args:
+        pattern: Regular expression with named groups for the step arguments
+
+    Returns:
+        Step parser for the given/when/then decorators
+    """
+    return parsers.re(pattern, re.IGNORECASE | re.DOTALL)
+
+
 # Navigation Steps
 
 
-@given(parsers.parse('I am on "{url}"'))
-@given(parsers.parse("I am on {url}"))
+@given(_step_regex(r'I am on "(?P<url>[^"]+)"'))
+@given(_step_regex(r'I am on (?!"[^"]+"$)(?P<url>.+)'))
 async def navigate_to_url(page: Page, url: str) -> None:
     """Navigate to a URL.
 
@@ -34,8 +54,8 @@ async def navigate_to_homepage(page: Page, base_url: str) -> None:
     await page.goto(base_url)
 
 
-@when(parsers.parse('I navigate to "{url}"'))
-@when(parsers.parse("I navigate to {url}"))
+@when(_step_regex(r'I navigate to "(?P<url>[^"]+)"'))
+@when(_step_regex(r'I navigate to (?!"[^"]+"$)(?P<url>.+)'))
 async def navigate_to(page: Page, url: str) -> None:
     """Navigate to a URL.
 
@@ -80,8 +100,8 @@ async def reload_page(page: Page) -> None:
 # Click Actions
 
 
-@when(parsers.parse('I click on "{selector}"'))
-@when(parsers.parse("I click on {selector}"))
+@when(_step_regex(r'I click on "(?P<selector>[^"]+)"'))
+@when(_step_regex(r'I click on (?!"[^"]+"$)(?P<selector>.+)'))
 async def click_element(page: Page, selector: str) -> None:
     """Click on an element.
 
@@ -92,7 +112,7 @@ async def click_element(page: Page, selector: str) -> None:
     await page.click(selector)
 
 
-@when(parsers.parse('I click the button "{text}"'))
+@when(_step_regex(r'I click the button "(?P<text>.+?)"'))
 async def click_button_by_text(page: Page, text: str) -> None:
     """Click a button by its text.
 
@@ -103,7 +123,7 @@ async def click_button_by_text(page: Page, text: str) -> None:
     await page.get_by_role("button", name=text).click()
 
 
-@when(parsers.parse('I click the link "{text}"'))
+@when(_step_regex(r'I click the link "(?P<text>.+?)"'))
 async def click_link_by_text(page: Page, text: str) -> None:
     """Click a link by its text.
 
@@ -117,8 +137,8 @@ async def click_link_by_text(page: Page, text: str) -> None:
 # Form Interactions
 
 
-@when(parsers.parse('I type "{text}" into "{selector}"'))
-@when(parsers.parse("I type {text} into {selector}"))
+@when(_step_regex(r'I type "(?P<text>[^"]+)" into "(?P<selector>[^"]+)"'))
+@when(_step_regex(r'I type (?!"[^"]+" into "[^"]+"$)(?P<text>.+?) into (?P<selector>.+)'))
 async def type_into_field(page: Page, text: str, selector: str) -> None:
     """Type text into an input field.
 
@@ -130,7 +150,7 @@ async def type_into_field(page: Page, text: str, selector: str) -> None:
     await page.fill(selector, text)
 
 
-@when(parsers.parse('I fill "{field}" with "{value}"'))
+@when(_step_regex(r'I fill "(?P<field>.+?)" with "(?P<value>.+?)"'))
 async def fill_field(page: Page, field: str, value: str) -> None:
     """Fill a form field by label or placeholder.
 
@@ -147,7 +167,7 @@ async def fill_field(page: Page, field: str, value: str) -> None:
         await page.get_by_placeholder(field).fill(value)
 
 
-@when(parsers.parse('I select "{option}" from "{selector}"'))
+@when(_step_regex(r'I select "(?P<option>.+?)" from "(?P<selector>.+?)"'))
 async def select_option(page: Page, option: str, selector: str) -> None:
     """Select an option from a dropdown.
 
@@ -159,7 +179,7 @@ async def select_option(page: Page, option: str, selector: str) -> None:
     await page.select_option(selector, option)
 
 
-@when(parsers.parse('I check "{selector}"'))
+@when(_step_regex(r'I check "(?P<selector>.+?)"'))
 async def check_checkbox(page: Page, selector: str) -> None:
     """Check a checkbox.
 
@@ -170,7 +190,7 @@ async def check_checkbox(page: Page, selector: str) -> None:
     await page.check(selector)
 
 
-@when(parsers.parse('I uncheck "{selector}"'))
+@when(_step_regex(r'I uncheck "(?P<selector>.+?)"'))
 async def uncheck_checkbox(page: Page, selector: str) -> None:
     """Uncheck a checkbox.
 
@@ -181,7 +201,7 @@ async def uncheck_checkbox(page: Page, selector: str) -> None:
     await page.uncheck(selector)
 
 
-@when(parsers.parse('I press "{key}"'))
+@when(_step_regex(r'I press "(?P<key>.+?)"'))
 async def press_key(page: Page, key: str) -> None:
     """Press a keyboard key.
 
@@ -195,7 +215,7 @@ async def press_key(page: Page, key: str) -> None:
 # Assertions
 
 
-@then(parsers.parse('I should see "{text}"'))
+@then(_step_regex(r'I should see "(?P<text>.+?)"'))
 async def should_see_text(page: Page, text: str) -> None:
     """Assert that text is visible on the page.
 
@@ -206,7 +226,7 @@ async def should_see_text(page: Page, text: str) -> None:
     await expect(page.get_by_text(text)).to_be_visible()
 
 
-@then(parsers.parse('I should not see "{text}"'))
+@then(_step_regex(r'I should not see "(?P<text>.+?)"'))
 async def should_not_see_text(page: Page, text: str) -> None:
     """Assert that text is not visible on the page.
 
@@ -217,7 +237,7 @@ async def should_not_see_text(page: Page, text: str) -> None:
     await expect(page.get_by_text(text)).not_to_be_visible()
 
 
-@then(parsers.parse('I should see the heading "{text}"'))
+@then(_step_regex(r'I should see the heading "(?P<text>.+?)"'))
 async def should_see_heading(page: Page, text: str) -> None:
     """Assert that a heading with text is visible.
 
@@ -228,7 +248,7 @@ async def should_see_heading(page: Page, text: str) -> None:
     await expect(page.get_by_role("heading", name=text)).to_be_visible()
 
 
-@then(parsers.parse('the page title should be "{title}"'))
+@then(_step_regex(r'the page title should be "(?P<title>.+?)"'))
 async def page_title_should_be(page: Page, title: str) -> None:
     """Assert the page title.
 
@@ -239,7 +259,7 @@ async def page_title_should_be(page: Page, title: str) -> None:
     await expect(page).to_have_title(title)
 
 
-@then(parsers.parse('the page title should contain "{text}"'))
+@then(_step_regex(r'the page title should contain "(?P<text>.+?)"'))
 async def page_title_should_contain(page: Page, text: str) -> None:
     """Assert the page title contains text.
 
@@ -250,7 +270,7 @@ async def page_title_should_contain(page: Page, text: str) -> None:
     await expect(page).to_have_title(re.compile(re.escape(text)))
 
 
-@then(parsers.parse('the URL should be "{url}"'))
+@then(_step_regex(r'the URL should be "(?P<url>.+?)"'))
 async def url_should_be(page: Page, url: str) -> None:
     """Assert the current URL.
 
@@ -261,7 +281,7 @@ async def url_should_be(page: Page, url: str) -> None:
     await expect(page).to_have_url(url)
 
 
-@then(parsers.parse('the URL should contain "{text}"'))
+@then(_step_regex(r'the URL should contain "(?P<text>.+?)"'))
 async def url_should_contain(page: Page, text: str) -> None:
     """Assert the URL contains text.
 
@@ -272,7 +292,7 @@ async def url_should_contain(page: Page, text: str) -> None:
     await expect(page).to_have_url(re.compile(re.escape(text)))
 
 
-@then(parsers.parse('"{selector}" should be visible'))
+@then(_step_regex(r'"(?P<selector>.+?)" should be visible'))
 async def element_should_be_visible(page: Page, selector: str) -> None:
     """Assert an element is visible.
 
@@ -283,8 +303,7 @@ async def element_should_be_visible(page: Page, selector: str) -> None:
     await expect(page.locator(selector)).to_be_visible()
 
 
-@then(parsers.parse('"{selector}" should not be visible'))
-@then(parsers.parse('"{selector}" should be hidden'))
+@then(_step_regex(r'"(?P<selector>.+?)" should (?:not be visible|be hidden)'))
 async def element_should_not_be_visible(page: Page, selector: str) -> None:
     """Assert an element is not visible.
 
@@ -295,7 +314,7 @@ async def element_should_not_be_visible(page: Page, selector: str) -> None:
     await expect(page.locator(selector)).not_to_be_visible()
 
 
-@then(parsers.parse('"{selector}" should be enabled'))
+@then(_step_regex(r'"(?P<selector>.+?)" should be enabled'))
 async def element_should_be_enabled(page: Page, selector: str) -> None:
     """Assert an element is enabled.
 
@@ -306,7 +325,7 @@ async def element_should_be_enabled(page: Page, selector: str) -> None:
     await expect(page.locator(selector)).to_be_enabled()
 
 
-@then(parsers.parse('"{selector}" should be disabled'))
+@then(_step_regex(r'"(?P<selector>.+?)" should be disabled'))
 async def element_should_be_disabled(page: Page, selector: str) -> None:
     """Assert an element is disabled.
 
@@ -317,7 +336,7 @@ async def element_should_be_disabled(page: Page, selector: str) -> None:
     await expect(page.locator(selector)).to_be_disabled()
 
 
-@then(parsers.parse('"{selector}" should contain "{text}"'))
+@then(_step_regex(r'"(?P<selector>.+?)" should contain "(?P<text>.+?)"'))
 async def element_should_contain_text(page: Page, selector: str, text: str) -> None:
     """Assert an element contains text.
 
@@ -329,7 +348,7 @@ async def element_should_contain_text(page: Page, selector: str, text: str) -> N
     await expect(page.locator(selector)).to_contain_text(text)
 
 
-@then(parsers.parse('"{selector}" should have value "{value}"'))
+@then(_step_regex(r'"(?P<selector>.+?)" should have value "(?P<value>.+?)"'))
 async def element_should_have_value(page: Page, selector: str, value: str) -> None:
     """Assert an input element has a specific value.
 
@@ -341,7 +360,7 @@ async def element_should_have_value(page: Page, selector: str, value: str) -> No
     await expect(page.locator(selector)).to_have_value(value)
 
 
-@then(parsers.parse('"{selector}" should be checked'))
+@then(_step_regex(r'"(?P<selector>.+?)" should be checked'))
 async def checkbox_should_be_checked(page: Page, selector: str) -> None:
     """Assert a checkbox is checked.
 
@@ -352,8 +371,7 @@ async def checkbox_should_be_checked(page: Page, selector: str) -> None:
     await expect(page.locator(selector)).to_be_checked()
 
 
-@then(parsers.parse('"{selector}" should not be checked'))
-@then(parsers.parse('"{selector}" should be unchecked'))
+@then(_step_regex(r'"(?P<selector>.+?)" should (?:not be checked|be unchecked)'))
 async def checkbox_should_not_be_checked(page: Page, selector: str) -> None:
     """Assert a checkbox is not checked.
 
@@ -367,7 +385,7 @@ async def checkbox_should_not_be_checked(page: Page, selector: str) -> None:
 # Wait Steps
 
 
-@when(parsers.parse("I wait for {seconds:d} seconds"))
+@when(_step_regex(r"I wait for (?P<seconds>\d+) seconds"), converters={"seconds": int})
 async def wait_for_seconds(page: Page, seconds: int) -> None:
     """Wait for a specified number of seconds.
 
@@ -378,7 +396,7 @@ async def wait_for_seconds(page: Page, seconds: int) -> None:
     await page.wait_for_timeout(seconds * 1000)
 
 
-@when(parsers.parse('I wait for "{selector}" to be visible'))
+@when(_step_regex(r'I wait for "(?P<selector>.+?)" to be visible'))
 async def wait_for_element_visible(page: Page, selector: str) -> None:
     """Wait for an element to be visible.
 
@@ -389,7 +407,7 @@ async def wait_for_element_visible(page: Page, selector: str) -> None:
     await page.wait_for_selector(selector, state="visible")
 
 
-@when(parsers.parse('I wait for "{selector}" to be hidden'))
+@when(_step_regex(r'I wait for "(?P<selector>.+?)" to be hidden'))
 async def wait_for_element_hidden(page: Page, selector: str) -> None:
     """Wait for an element to be hidden.
 
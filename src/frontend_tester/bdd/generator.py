@@ -1,18 +1,22 @@
 """Feature file generator using Jinja2 templates."""
 
+import functools
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader
 
 
+@functools.cache
 def get_template_env() -> Environment:
-    """Get Jinja2 environment for BDD templates."""
+    """Get Jinja2 environment for BDD templates (created once, compiled templates cached)."""
     template_dir = Path(__file__).parent / "templates"
     return Environment(
         loader=FileSystemLoader(str(template_dir)),
         trim_blocks=True,
         lstrip_blocks=True,
+        # Bundled templates never change at runtime; skip the per-lookup mtime check
+        auto_reload=False,
     )
 
 
@@ -1,17 +1,46 @@
 """Analyze command for UI analysis."""
 
 import asyncio
+import functools
 import json
 from pathlib import Path
+from urllib.parse import urlparse
 
 from typing_extensions import Annotated
 import typer
 
-from frontend_tester.ai.analyzer import UIAnalyzer
-from frontend_tester.ai.client import LLMClient
-from frontend_tester.cli.utils import console, print_error, print_info, print_success
+from frontend_tester.cli.utils import (
+    console,
+    print_error,
+    print_info,
+    print_success,
+    run_async,
+)
 from frontend_tester.core.config import load_config
-from frontend_tester.playwright_runner.browser_manager import BrowserManager
+
+# Characters replaced or dropped when turning a page URL into a filename, applied in a
+# single str.translate pass each ("!" is only dropped from hash-bang fragments)
+_PATH_FILENAME_TABLE = str.maketrans({"/": "_", "#": None})
+_FRAGMENT_FILENAME_TABLE = str.maketrans({"/": "_", "!": None, "#": None})
+
+
+# A pure function of the URL, so repeated URLs reuse the name computed before
+@functools.lru_cache(maxsize=1024)
+def _page_filename(page_url: str) -> str:
+    """
+    Create a safe analysis filename from a page URL.
+
+    Args:
+        page_url: URL of the analyzed page
+
+    Returns:
+        Filename, e.g. 'app__users.json' for http://localhost/app#!/users
+    """
+    parsed = urlparse(page_url)
+    filename = parsed.path.strip("/").translate(_PATH_FILENAME_TABLE) or "index"
+    if parsed.fragment:
+        filename += "_" + parsed.fragment.translate(_FRAGMENT_FILENAME_TABLE)
+    return filename + ".json"
 
 
 async def analyze_page_async(
@@ -21,8 +50,17 @@ async def analyze_page_async(
     headless: bool,
     crawl: bool,
     max_pages: int,
+    concurrency: int = 1,
+    batch_size: int = 1,
+    cache_dir: Path | None = None,
 ) -> None:
     """Async implementation of page analysis."""
+    # Imported here so that CLI startup and other commands skip the LLM and
+    # Playwright libraries
+    from frontend_tester.ai.analyzer import UIAnalyzer
+    from frontend_tester.ai.client import LLMClient
+    from frontend_tester.playwright_runner.browser_manager import BrowserManager
+
     config = load_config()
 
     # Validate LLM configuration
@@ -35,137 +73,184 @@ async def analyze_page_async(
 
     # Initialize components
     llm_client = LLMClient(config.llm)
-    analyzer = UIAnalyzer(llm_client)
+    analyzer = UIAnalyzer(llm_client, cache_dir=cache_dir)
 
-    # Launch browser
-    print_info(f"Launching {browser_type} browser...")
-    async with BrowserManager(config.browser) as manager:
-        page = await manager.create_page(browser_type)
+    # 'all' analyzes the page in every configured browser at once
+    browser_names = list(config.browser.browsers) if browser_type == "all" else [browser_type]
+    if crawl and len(browser_names) > 1:
+        print_error("Crawling uses a single browser; pass --browser with one browser name")
+        raise typer.Exit(1)
 
+    # Launch browser
+    print_info(f"Launching {', '.join(browser_names)} browser...")
+    async with BrowserManager(config.browser, browsers=browser_names) as manager:
         if crawl:
+            page = await manager.create_page(browser_names[0])
+
             # Crawl and analyze multiple pages
-            print_info(f"Crawling website (max {max_pages} pages)...")
+            print_info(f"Crawling website (max {max_pages} pages, {concurrency} in parallel)...")
 
             # Progress callback
             def progress_cb(current, total, page_url, title):
                 console.print(f"  [{current}/{total}] {title[:50]} - {page_url}")
 
-            analyses = await analyzer.crawl_and_analyze(
-                page, url, max_pages=max_pages, progress_callback=progress_cb
-            )
-
-            console.print(f"\n[bold cyan]Crawl Results: {len(analyses)} pages analyzed[/bold cyan]")
-
-            # Display summary
-            for page_url, analysis in analyses.items():
-                if "error" not in analysis:
-                    console.print(f"  ✓ {analysis.get('title', 'Untitled')} - {page_url}")
-                else:
-                    console.print(f"  ✗ Error analyzing {page_url}")
-
-            # Save analyses
             output_dir = output_file.parent if output_file else Path("analysis")
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save individual page analyses
-            for page_url, analysis in analyses.items():
-                # Create safe filename from URL
-                from urllib.parse import urlparse
-                parsed = urlparse(page_url)
-                filename = parsed.path.strip("/").replace("/", "_") or "index"
-                if parsed.fragment:
-                    filename += "_" + parsed.fragment.replace("/", "_").replace("!", "")
-                filename = filename.replace("#", "") + ".json"
-
-                page_output = output_dir / filename
-                await analyzer.save_analysis(analysis, page_output)
-
-            # Save combined analysis
+            # Pages are written out as the crawl produces them; only their URL, title and
+            # status stay in memory for the summary
+            summary: list[tuple[str, str, bool]] = []
+            page_writes: dict[str, asyncio.Task] = {}
+
+            async def save_pages():
+                async for page_url, analysis in analyzer.iter_crawl_and_analyze(
+                    page,
+                    url,
+                    max_pages=max_pages,
+                    progress_callback=progress_cb,
+                    concurrency=concurrency,
+                    batch_size=batch_size,
+                ):
+                    summary.append(
+                        (page_url, analysis.get("title", "Untitled"), "error" not in analysis)
+                    )
+                    # URLs differing only in their query share a filename; the last one
+                    # wins, so a rewrite waits for the previous write of that file
+                    filename = _page_filename(page_url)
+                    if filename in page_writes:
+                        await page_writes[filename]
+                    page_writes[filename] = asyncio.create_task(
+                        analyzer.save_analysis(analysis, output_dir / filename)
+                    )
+                    yield page_url, analysis
+
+            # Save the combined analysis while the individual page files are written
             combined_output = output_dir / "all_pages.json"
-            with open(combined_output, "w") as f:
-                json.dump(analyses, f, indent=2)
+            try:
+                await analyzer.save_analyses(save_pages(), combined_output)
+            finally:
+                await asyncio.gather(*page_writes.values())
+
+            # Display summary, rendered and flushed in one print call
+            lines = [f"\n[bold cyan]Crawl Results: {len(summary)} pages analyzed[/bold cyan]"]
+            for page_url, title, succeeded in summary:
+                if succeeded:
+                    lines.append(f"  ✓ {title} - {page_url}")
+                else:
+                    lines.append(f"  ✗ Error analyzing {page_url}")
+            console.print("\n".join(lines))
 
             print_success(f"Analyses saved to: {output_dir}/")
-            print_info(f"  • Individual pages: {len(analyses)} files")
+            print_info(f"  • Individual pages: {len(summary)} files")
             print_info(f"  • Combined analysis: all_pages.json")
 
+            await page.close()
+
         else:
-            # Single page analysis
-            print_info(f"Navigating to {url}...")
-            await page.goto(url, wait_until="networkidle", timeout=60000)
-
-            # Analyze page
-            print_info("Analyzing page structure...")
-            analysis = await analyzer.analyze_page(page)
-
-            # Display results
-            console.print("\n[bold cyan]Analysis Results:[/bold cyan]")
-            console.print(f"[bold]URL:[/bold] {analysis['url']}")
-            console.print(f"[bold]Title:[/bold] {analysis['title']}")
-
-            # Display basic elements summary
-            basic_elements = analysis.get("basic_elements", {})
-            console.print("\n[bold green]Detected Elements:[/bold green]")
-            for elem_type, elements in basic_elements.items():
-                if elements:
-                    console.print(f"  • {elem_type.capitalize()}: {len(elements)}")
-
-            # Display AI analysis
-            ai_analysis = analysis.get("ai_analysis", {})
-            if ai_analysis and "error" not in ai_analysis:
-                console.print("\n[bold green]AI Analysis:[/bold green]")
-
-                # User flows
-                user_flows = ai_analysis.get("user_flows", [])
-                if user_flows:
-                    console.print(f"  • User Flows: {len(user_flows)}")
-                    for flow in user_flows[:3]:  # Show first 3
-                        console.print(f"    - {flow.get('name', 'Unnamed flow')}")
-
-                # Interactive elements
-                interactive = ai_analysis.get("interactive_elements", [])
-                if interactive:
-                    console.print(f"  • Interactive Elements: {len(interactive)}")
-
-                # Forms
-                forms = ai_analysis.get("forms", [])
-                if forms:
-                    console.print(f"  • Forms: {len(forms)}")
-
-            elif "error" in ai_analysis:
-                print_error(f"AI analysis error: {ai_analysis['error']}")
-
-            # Save to file
-            if output_file:
-                await analyzer.save_analysis(analysis, output_file)
-                print_success(f"Analysis saved to: {output_file}")
-            else:
-                # Save to default location
-                default_output = Path("analysis/analysis.json")
-                await analyzer.save_analysis(analysis, default_output)
-                print_success(f"Analysis saved to: {default_output}")
-
-            # Display sample JSON
-            console.print("\n[bold cyan]Sample Analysis (truncated):[/bold cyan]")
-            sample_analysis = {
-                "url": analysis["url"],
-                "title": analysis["title"],
-                "element_counts": {k: len(v) for k, v in basic_elements.items()},
-            }
-            console.print(json.dumps(sample_analysis, indent=2))
-
-        await page.close()
+            # Single page analysis, in all requested browsers concurrently
+            async def analyze_in_browser(browser_name: str) -> dict:
+                browser_page = await manager.create_page(browser_name)
+                try:
+                    await analyzer.navigate(browser_page, url)
+                    return await analyzer.analyze_page(browser_page)
+                finally:
+                    await browser_page.close()
+
+            print_info(f"Navigating to {url} and analyzing page structure...")
+            analyses = await asyncio.gather(*(analyze_in_browser(name) for name in browser_names))
+
+            output_path = output_file or Path("analysis/analysis.json")
+            for browser_name, analysis in zip(browser_names, analyses, strict=True):
+                if len(browser_names) > 1:
+                    # e.g. analysis_firefox.json
+                    console.print(f"\n[bold magenta]{browser_name}[/bold magenta]")
+                    browser_output = output_path.with_stem(f"{output_path.stem}_{browser_name}")
+                else:
+                    browser_output = output_path
+
+                element_counts = _display_page_analysis(analysis)
+
+                # Save to file
+                await analyzer.save_analysis(analysis, browser_output)
+                print_success(f"Analysis saved to: {browser_output}")
+
+                # Display sample JSON
+                console.print("\n[bold cyan]Sample Analysis (truncated):[/bold cyan]")
+                sample_analysis = {
+                    "url": analysis["url"],
+                    "title": analysis["title"],
+                    "element_counts": element_counts,
+                }
+                console.print(json.dumps(sample_analysis, indent=2))
 
     print_success("Analysis complete!")
 
 
+def _display_page_analysis(analysis: dict) -> dict[str, int]:
+    """
+    Print the results of a single page analysis.
+
+    Args:
+        analysis: Analysis results of the page
+
+    Returns:
+        Number of detected elements per element type
+    """
+    # Display results
+    console.print("\n[bold cyan]Analysis Results:[/bold cyan]")
+    console.print(f"[bold]URL:[/bold] {analysis['url']}")
+    console.print(f"[bold]Title:[/bold] {analysis['title']}")
+
+    # Display basic elements summary
+    element_counts = {
+        elem_type: len(elements)
+        for elem_type, elements in analysis.get("basic_elements", {}).items()
+    }
+    console.print("\n[bold green]Detected Elements:[/bold green]")
+    for elem_type, count in element_counts.items():
+        if count:
+            console.print(f"  • {elem_type.capitalize()}: {count}")
+
+    # Display AI analysis
+    ai_analysis = analysis.get("ai_analysis", {})
+    if ai_analysis.get("skipped"):
+        print_info(f"AI analysis skipped: {ai_analysis.get('reason', '')}")
+    elif ai_analysis and "error" not in ai_analysis:
+        console.print("\n[bold green]AI Analysis:[/bold green]")
+
+        # User flows
+        user_flows = ai_analysis.get("user_flows", [])
+        if user_flows:
+            console.print(f"  • User Flows: {len(user_flows)}")
+            for flow in user_flows[:3]:  # Show first 3
+                console.print(f"    - {flow.get('name', 'Unnamed flow')}")
+
+        # Interactive elements
+        interactive = ai_analysis.get("interactive_elements", [])
+        if interactive:
+            console.print(f"  • Interactive Elements: {len(interactive)}")
+
+        # Forms
+        forms = ai_analysis.get("forms", [])
+        if forms:
+            console.print(f"  • Forms: {len(forms)}")
+
+    elif "error" in ai_analysis:
+        print_error(f"AI analysis error: {ai_analysis['error']}")
+
+    return element_counts
+
+
 def analyze_command(
     url: Annotated[str, typer.Argument(help="URL to analyze")],
     output: Annotated[
         Path | None, typer.Option("--output", "-o", help="Output file path or directory")
     ] = None,
     browser: Annotated[
-        str, typer.Option("--browser", "-b", help="Browser to use")
+        str,
+        typer.Option(
+            "--browser", "-b", help="Browser to use ('all' for every configured browser)"
+        ),
     ] = "chromium",
     headed: Annotated[
         bool, typer.Option("--headed", help="Run browser in headed mode")
@@ -176,6 +261,17 @@ def analyze_command(
     max_pages: Annotated[
         int, typer.Option("--max-pages", help="Maximum pages to crawl")
     ] = 50,
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", help="Pages to load in parallel while crawling", min=1)
+    ] = 4,
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch-size", help="Pages analyzed together in one LLM request", min=1),
+    ] = 4,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option("--cache-dir", help="Reuse AI analyses of unchanged pages stored here"),
+    ] = None,
 ) -> None:
     """
     Analyze a web page and extract UI structure.
@@ -183,14 +279,17 @@ def analyze_command(
     This command uses Playwright to load the page and AI to analyze
     the structure and identify testable elements and user flows.
 
+    \b
     Example:
         frontend-tester analyze http://localhost:3000
         frontend-tester analyze http://localhost:3000 --crawl --max-pages 20
+        frontend-tester analyze http://localhost:3000 --crawl --concurrency 8
+        frontend-tester analyze http://localhost:3000 --crawl --cache-dir .frontend_tester_cache
         frontend-tester analyze http://localhost:3000 --output analysis.json
         frontend-tester analyze http://localhost:3000 --browser firefox --headed
     """
     try:
-        asyncio.run(
+        run_async(
             analyze_page_async(
                 url=url,
                 output_file=output,
@@ -198,6 +297,9 @@ def analyze_command(
                 headless=not headed,
                 crawl=crawl,
                 max_pages=max_pages,
+                concurrency=concurrency,
+                batch_size=batch_size,
+                cache_dir=cache_dir,
             )
         )
     except Exception as e:
@@ -1,11 +1,11 @@
 """Config command implementation."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
+from pydantic import BaseModel
 from typing_extensions import Annotated
-from rich.table import Table
 
 from frontend_tester.cli.utils import console, print_success, print_error, print_info
 from frontend_tester.core.config import ProjectConfig, load_config
@@ -32,6 +32,7 @@ def config_command(
     """
     Manage Frontend Tester configuration.
 
+    \b
     Examples:
       frontend-tester config list
       frontend-tester config get --key llm.model
@@ -72,6 +73,8 @@ def _list_config(config_path: Path) -> None:
     console.print(f"\n[bold cyan]Configuration[/bold cyan] ({config_path})\n")
 
     # Create a table
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Setting", style="cyan", no_wrap=True)
     table.add_column("Value", style="white")
@@ -111,16 +114,16 @@ def _get_config(config_path: Path, key: str) -> None:
 
     # Parse nested key
     parts = key.split(".")
-    value = config.model_dump()
-
-    try:
-        for part in parts:
-            value = value[part]
-        console.print(f"[cyan]{key}[/cyan] = [white]{value}[/white]")
-    except (KeyError, TypeError):
+    value, depth = _lookup_value(config, parts)
+    if depth < len(parts):
         print_error(f"Config key not found: {key}")
         raise typer.Exit(1)
 
+    # Whole sections print in their plain dict form
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    console.print(f"[cyan]{key}[/cyan] = [white]{value}[/white]")
+
 
 def _set_config(config_path: Path, key: str, value: str) -> None:
     """Set a configuration value."""
@@ -133,24 +136,17 @@ def _set_config(config_path: Path, key: str, value: str) -> None:
 
     # Parse nested key
     parts = key.split(".")
-    config_dict = config.model_dump()
 
-    # Navigate to the parent of the target key
-    current = config_dict
-    for part in parts[:-1]:
-        if part not in current:
-            print_error(f"Invalid config path: {key}")
-            raise typer.Exit(1)
-        current = current[part]
-
-    # Set the value
-    last_key = parts[-1]
-    if last_key not in current:
+    # Navigate to the target key
+    old_value, depth = _lookup_value(config, parts)
+    if depth < len(parts) - 1:
+        print_error(f"Invalid config path: {key}")
+        raise typer.Exit(1)
+    if depth < len(parts):
         print_error(f"Config key not found: {key}")
         raise typer.Exit(1)
 
     # Try to convert value to the right type
-    old_value = current[last_key]
     if isinstance(old_value, bool):
         value = value.lower() in ("true", "yes", "1")
     elif isinstance(old_value, int):
@@ -160,13 +156,61 @@ def _set_config(config_path: Path, key: str, value: str) -> None:
     elif isinstance(old_value, list):
         value = [v.strip() for v in value.split(",")]
 
-    current[last_key] = value
-
     # Save the updated config
     try:
-        updated_config = ProjectConfig(**config_dict)
+        updated_config = _replace_value(config, parts, value)
         updated_config.save_to_file(config_path)
         print_success(f"Updated {key} = {value}")
     except Exception as e:
         print_error(f"Failed to save config: {e}")
         raise typer.Exit(1)
+
+
+def _lookup_value(model: BaseModel, parts: list[str]) -> tuple[Any, int]:
+    """
+    Look up a nested config value without dumping the whole config.
+
+    Args:
+        model: Config model to search
+        parts: Key path below model (e.g. ['llm', 'model'])
+
+    Returns:
+        The deepest value found and how many parts of the path led to it
+    """
+    value: Any = model
+    for depth, part in enumerate(parts):
+        if isinstance(value, BaseModel) and part in type(value).model_fields:
+            value = getattr(value, part)
+        elif isinstance(value, dict) and part in value:
+            value = value[part]
+        else:
+            return value, depth
+    return value, len(parts)
+
+
+def _replace_value(model: BaseModel, parts: list[str], value: Any) -> BaseModel:
+    """
+    Return a copy of a config model with a nested value replaced.
+
+    Only the model that directly holds the value is re-validated; its parents are
+    copied with the new submodel swapped in.
+
+    Args:
+        model: Config model to update
+        parts: Key path below model (e.g. ['llm', 'model'])
+        value: New value
+
+    Returns:
+        Updated copy of model
+    """
+    field = parts[0]
+    current = getattr(model, field)
+    if len(parts) > 1 and isinstance(current, BaseModel):
+        return model.model_copy(update={field: _replace_value(current, parts[1:], value)})
+
+    data = model.model_dump()
+    target = data
+    for part in parts[:-1]:
+        target = target[part]
+    target[parts[-1]] = value
+    return type(model).model_validate(data)
@@ -1,18 +1,20 @@
 """Generate command for test generation."""
 
 import asyncio
-import json
 from pathlib import Path
 
 from typing_extensions import Annotated
 import typer
 
-from frontend_tester.ai.analyzer import UIAnalyzer
-from frontend_tester.ai.client import LLMClient
-from frontend_tester.ai.generator import TestGenerator
-from frontend_tester.cli.utils import console, print_error, print_info, print_success
+from frontend_tester.cli.utils import (
+    console,
+    print_error,
+    print_info,
+    print_success,
+    run_async,
+)
+from frontend_tester.core import json_utils
 from frontend_tester.core.config import load_config
-from frontend_tester.playwright_runner.browser_manager import BrowserManager
 
 
 async def generate_tests_async(
@@ -22,8 +24,16 @@ async def generate_tests_async(
     browser_type: str,
     headless: bool,
     analysis_file: Path | None,
+    cache_dir: Path | None = None,
 ) -> None:
     """Async implementation of test generation."""
+    # Imported here so that CLI startup and other commands skip the LLM and
+    # Playwright libraries
+    from frontend_tester.ai.analyzer import UIAnalyzer
+    from frontend_tester.ai.client import LLMClient
+    from frontend_tester.ai.generator import TestGenerator
+    from frontend_tester.playwright_runner.browser_manager import BrowserManager
+
     config = load_config()
 
     # Validate LLM configuration
@@ -37,23 +47,22 @@ async def generate_tests_async(
 
     # Initialize components
     llm_client = LLMClient(config.llm)
-    analyzer = UIAnalyzer(llm_client)
-    generator = TestGenerator(llm_client)
+    analyzer = UIAnalyzer(llm_client, cache_dir=cache_dir)
+    generator = TestGenerator(llm_client, cache_dir=cache_dir)
 
     # Get analysis
     if analysis_file and analysis_file.exists():
         print_info(f"Loading existing analysis from: {analysis_file}")
-        with open(analysis_file, "r") as f:
-            analysis = json.load(f)
+        analysis = json_utils.loads(await asyncio.to_thread(analysis_file.read_bytes))
     else:
         print_info("No existing analysis found. Analyzing page...")
         # Launch browser and analyze
-        async with BrowserManager(config.browser) as manager:
+        async with BrowserManager(config.browser, browsers=[browser_type]) as manager:
             page = await manager.create_page(browser_type)
 
             # Navigate to URL
             print_info(f"Navigating to {url}...")
-            await page.goto(url, wait_until="networkidle", timeout=60000)
+            await analyzer.navigate(page, url)
 
             # Analyze page
             print_info("Analyzing page structure...")
@@ -104,6 +113,10 @@ def generate_command(
     analysis_file: Annotated[
         Path | None, typer.Option("--analysis", "-a", help="Existing analysis file to use")
     ] = None,
+    cache_dir: Annotated[
+        Path | None,
+        typer.Option("--cache-dir", help="Reuse LLM responses for unchanged inputs stored here"),
+    ] = None,
 ) -> None:
     """
     Generate BDD test scenarios from a web page.
@@ -111,14 +124,16 @@ def generate_command(
     This command analyzes the page (or uses existing analysis) and generates
     Gherkin feature files and pytest-bdd step definitions.
 
+    \b
     Example:
         frontend-tester generate http://localhost:3000
         frontend-tester generate http://localhost:3000 --output-dir /tmp/tests
         frontend-tester generate http://localhost:3000 --analysis analysis.json
+        frontend-tester generate http://localhost:3000 --cache-dir .frontend_tester_cache
         frontend-tester generate http://localhost:3000 --app-name "My App" --browser firefox
     """
     try:
-        asyncio.run(
+        run_async(
             generate_tests_async(
                 url=url,
                 output_dir=output_dir,
@@ -126,6 +141,7 @@ def generate_command(
                 browser_type=browser,
                 headless=not headed,
                 analysis_file=analysis_file,
+                cache_dir=cache_dir,
             )
         )
     except Exception as e:
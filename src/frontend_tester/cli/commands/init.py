@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Optional
 
 import typer
+from pydantic import ValidationError
 from typing_extensions import Annotated
 from rich.prompt import Prompt, Confirm
 
@@ -15,7 +16,21 @@ from frontend_tester.cli.utils import (
     print_header,
 )
 from frontend_tester.core.config import ProjectConfig, BrowserConfig, LLMConfig
-from frontend_tester.core.project import create_project_structure
+from frontend_tester.core.project_scaffold import create_example_tests, create_project_config
+
+# Interactive menu choices -> browsers to test
+_BROWSER_CHOICES = {
+    "1": ("chromium",),
+    "2": ("firefox",),
+    "3": ("webkit",),
+    "4": ("chromium", "firefox", "webkit"),
+}
+
+# Interactive menu choices -> (LLM provider, model)
+_LLM_CHOICES = {
+    "1": ("openai", "gpt-4"),
+    "2": ("anthropic", "claude-sonnet-4"),
+}
 
 
 def init_command(
@@ -35,15 +50,33 @@ def init_command(
         bool,
         typer.Option("--yes", "-y", help="Skip prompts, use defaults"),
     ] = False,
+    config_json: Annotated[
+        Optional[str],
+        typer.Option(
+            "--config-json",
+            help="Complete configuration as JSON (skips prompts; --name/--url still apply)",
+        ),
+    ] = None,
+    examples: Annotated[
+        bool,
+        typer.Option("--examples/--no-examples", help="Create the example tests in TEST_DIR/"),
+    ] = True,
 ) -> None:
     """
     Initialize a new Frontend Tester test repository.
 
+    \b
     Creates test directory structure with:
     • config.yaml - Configuration
     • features/ - Test features (example + AI-generated)
     • steps/ - Step definitions
     • support/ - Browser fixtures and pytest config
+
+    \b
+    Examples:
+      frontend-tester init my-tests --yes
+      frontend-tester init my-tests --yes --no-examples
+      frontend-tester init my-tests --config-json '{"llm": {"provider": "anthropic"}}'
     """
     target_path = path or Path.cwd()
 
@@ -58,7 +91,9 @@ def init_command(
     console.print("\nThis wizard will help you set up a new test repository.\n")
 
     # Get project configuration
-    if non_interactive:
+    if config_json:
+        config = _get_config_from_json(config_json, name, url)
+    elif non_interactive:
         config = _get_default_config(name, url)
     else:
         config = _get_config_interactive(name, url)
@@ -66,11 +101,13 @@ def init_command(
     # Create project structure
     try:
         print_info("Creating test repository structure...")
-        create_project_structure(target_path, config)
+        create_project_config(target_path, config)
+        if examples:
+            create_example_tests(target_path, config)
         print_success("Test repository created")
 
         # Display summary
-        _display_summary(target_path, config)
+        _display_summary(target_path, config, examples)
 
     except Exception as e:
         print_error(f"Failed to create test repository: {e}")
@@ -89,6 +126,28 @@ def _get_default_config(
     )
 
 
+def _get_config_from_json(
+    config_json: str, name: Optional[str] = None, url: Optional[str] = None
+) -> ProjectConfig:
+    """Get configuration from a JSON document, with --name/--url taking precedence."""
+    try:
+        config = ProjectConfig.model_validate_json(config_json)
+    except ValidationError as e:
+        print_error(f"Invalid --config-json: {e}")
+        raise typer.Exit(1) from None
+
+    overrides = {}
+    if name:
+        overrides["name"] = name
+    if url:
+        overrides["target_urls"] = [url]
+    elif not config.target_urls:
+        # Reject it before any file is written; the summary and generate need a URL
+        print_error("Invalid --config-json: target_urls must list at least one URL (or pass --url)")
+        raise typer.Exit(1)
+    return config.model_copy(update=overrides)
+
+
 def _get_config_interactive(
     name: Optional[str] = None, url: Optional[str] = None
 ) -> ProjectConfig:
@@ -116,13 +175,7 @@ def _get_config_interactive(
 
     browser_choice = Prompt.ask("Choice", choices=["1", "2", "3", "4"], default="1")
 
-    browser_map = {
-        "1": ["chromium"],
-        "2": ["firefox"],
-        "3": ["webkit"],
-        "4": ["chromium", "firefox", "webkit"],
-    }
-    browsers = browser_map[browser_choice]
+    browsers = list(_BROWSER_CHOICES[browser_choice])
 
     # Headless mode
     headless = Confirm.ask(
@@ -142,8 +195,7 @@ def _get_config_interactive(
 
     llm_choice = Prompt.ask("Choice", choices=["1", "2"], default="1")
 
-    llm_provider = "openai" if llm_choice == "1" else "anthropic"
-    llm_model = "gpt-4" if llm_choice == "1" else "claude-sonnet-4"
+    llm_provider, llm_model = _LLM_CHOICES[llm_choice]
 
     return ProjectConfig(
         name=project_name,
@@ -160,40 +212,49 @@ def _get_config_interactive(
     )
 
 
-def _display_summary(path: Path, config: ProjectConfig) -> None:
-    """Display project creation summary."""
-    console.print("\n[bold green]✓ Test repository initialized successfully![/bold green]\n")
-
-    console.print("[bold cyan]Repository Details:[/bold cyan]")
-    console.print(f"  Name: {config.name}")
-    console.print(f"  Location: {path.absolute()}")
-    console.print(f"  Config: {path / 'config.yaml'}")
-    console.print(f"  Target URLs: {', '.join(config.target_urls)}")
-    console.print(f"  Browsers: {', '.join(config.browser.browsers)}")
-    console.print(f"  LLM: {config.llm.provider} ({config.llm.model})")
-
-    console.print("\n[bold cyan]Structure Created:[/bold cyan]")
-    console.print("  [cyan]config.yaml[/cyan] - Configuration file")
-    console.print("  [cyan]features/[/cyan] - Gherkin feature files (example + AI-generated)")
-    console.print("  [cyan]steps/[/cyan] - Python step definitions")
-    console.print("  [cyan]support/[/cyan] - Browser fixtures and pytest config")
-    console.print("  [cyan]analysis/[/cyan] - UI analysis JSON files")
-    console.print("  [cyan]baselines/[/cyan] - Visual regression baselines")
-    console.print("  [cyan]reports/[/cyan] - Test execution reports")
-
-    console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-    console.print("  1. Check the README:")
-    console.print("     [dim]$ cat README.md[/dim]")
-    console.print("\n  2. Run the example tests:")
-    console.print("     [dim]$ pytest -v[/dim]")
-    console.print("\n  3. Set your API keys in .env file:")
-    console.print("     [dim]OPENAI_API_KEY=sk-...[/dim]")
-    console.print("     [dim]ANTHROPIC_API_KEY=sk-ant-...[/dim]")
-    console.print("\n  4. Generate tests with AI:")
-    console.print(f"     [dim]$ frontend-tester generate {config.target_urls[0]}[/dim]")
-    console.print("\n  5. View/edit configuration:")
-    console.print("     [dim]$ frontend-tester config list[/dim]")
-
-    console.print(
-        "\n[dim]For more information, see README.md in this directory[/dim]\n"
-    )
+def _display_summary(path: Path, config: ProjectConfig, examples: bool = True) -> None:
+    """Display project creation summary.
+
+    Args:
+        path: Project directory
+        config: Project configuration
+        examples: Whether the example tests were created
+    """
+    next_steps = [
+        ("Check the README:", ["$ cat README.md"]),
+        ("Run the example tests:", ["$ pytest -v"]) if examples else None,
+        (
+            "Set your API keys in .env file:",
+            ["OPENAI_API_KEY=sk-...", "ANTHROPIC_API_KEY=sk-ant-..."],
+        ),
+        ("Generate tests with AI:", [f"$ frontend-tester generate {config.target_urls[0]}"]),
+        ("View/edit configuration:", ["$ frontend-tester config list"]),
+    ]
+    features = "example + AI-generated" if examples else "AI-generated"
+    lines = [
+        "\n[bold green]✓ Test repository initialized successfully![/bold green]\n",
+        "[bold cyan]Repository Details:[/bold cyan]",
+        f"  Name: {config.name}",
+        f"  Location: {path.absolute()}",
+        f"  Config: {path / 'config.yaml'}",
+        f"  Target URLs: {', '.join(config.target_urls)}",
+        f"  Browsers: {', '.join(config.browser.browsers)}",
+        f"  LLM: {config.llm.provider} ({config.llm.model})",
+        "\n[bold cyan]Structure Created:[/bold cyan]",
+        "  [cyan]config.yaml[/cyan] - Configuration file",
+        f"  [cyan]features/[/cyan] - Gherkin feature files ({features})",
+        "  [cyan]steps/[/cyan] - Python step definitions",
+        "  [cyan]support/[/cyan] - Browser fixtures and pytest config",
+        "  [cyan]analysis/[/cyan] - UI analysis JSON files",
+        "  [cyan]baselines/[/cyan] - Visual regression baselines",
+        "  [cyan]reports/[/cyan] - Test execution reports",
+        "\n[bold cyan]Next Steps:[/bold cyan]",
+    ]
+    for number, (title, commands) in enumerate(filter(None, next_steps), start=1):
+        # Blank line between steps
+        separator = "" if number == 1 else "\n"
+        lines.append(f"{separator}  {number}. {title}")
+        lines.extend(f"     [dim]{command}[/dim]" for command in commands)
+    lines.append("\n[dim]For more information, see README.md in this directory[/dim]\n")
+    # One print call renders and flushes the whole summary at once
+    console.print("\n".join(lines))
@@ -1,7 +1,8 @@
 """Run command for executing tests."""
 
+import importlib.util
+import os
 import sys
-import subprocess
 from pathlib import Path
 from typing import Optional
 
@@ -9,8 +10,90 @@ from typer import Argument, Option
 from typing_extensions import Annotated
 
 from frontend_tester.cli.utils import print_error, print_info, print_success, print_header
+from frontend_tester.core.browser_names import VALID_BROWSERS
 from frontend_tester.core.project import find_project_root
 
+# Crashed pytest-xdist workers (e.g. after a browser crash) replaced before giving up
+_MAX_WORKER_RESTARTS = 3
+
+
+def _list_feature_files(features_dir: Path) -> set[str]:
+    """
+    List the feature files directly inside a directory.
+
+    Args:
+        features_dir: Directory to scan
+
+    Returns:
+        Names of the ``.feature`` files, empty if the directory doesn't exist
+    """
+    try:
+        with os.scandir(features_dir) as entries:
+            return {entry.name for entry in entries if entry.name.endswith(".feature")}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _parallel_args(parallel: Optional[int]) -> list[str]:
+    """
+    Build the pytest-xdist arguments for a test run.
+
+    Without an explicit worker count, runs on all CPUs when pytest-xdist is
+    installed, the host has more than one CPU and FRONTEND_TESTER_AUTO_PARALLEL
+    isn't "0". A count of 0 disables parallel execution.
+
+    Args:
+        parallel: Number of workers requested on the command line, if any
+
+    Returns:
+        Arguments to append to the pytest command (empty for a serial run)
+    """
+    if parallel is None:
+        cpu_count = os.cpu_count() or 1
+        if (
+            cpu_count < 2
+            or os.environ.get("FRONTEND_TESTER_AUTO_PARALLEL") == "0"
+            or importlib.util.find_spec("xdist") is None
+        ):
+            return []
+        workers = "auto"
+    elif parallel == 0:
+        return []
+    else:
+        workers = str(parallel)
+
+    # Keep each feature file on one worker so its scenarios share a browser, and
+    # stop replacing workers that keep crashing
+    return ["-n", workers, "--dist", "loadfile", "--max-worker-restart", str(_MAX_WORKER_RESTARTS)]
+
+
+def _exec_pytest(pytest_args: list[str], cwd: str, env: Optional[dict[str, str]]) -> None:
+    """
+    Replace the current process with pytest.
+
+    Returns only if the exec fails for a reason other than pytest missing, in
+    which case the caller falls back to running pytest as a child process.
+
+    Args:
+        pytest_args: pytest command line, starting with the executable
+        cwd: Directory to run pytest in
+        env: Environment for pytest (None to inherit the current one)
+    """
+    # Output still buffered in this process would be lost by the exec
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    previous_cwd = os.getcwd()
+    try:
+        os.chdir(cwd)
+        os.execvpe(pytest_args[0], pytest_args, env if env is not None else os.environ)
+    except FileNotFoundError:
+        print_error("pytest not found. Make sure it's installed:")
+        print_info("  uv sync --extra dev")
+        raise SystemExit(1) from None
+    except OSError:
+        os.chdir(previous_cwd)
+
 
 def run_command(
     path: Annotated[
@@ -35,7 +118,11 @@ def run_command(
     ] = False,
     parallel: Annotated[
         Optional[int],
-        Option("--parallel", "-n", help="Run tests in parallel (number of workers)"),
+        Option(
+            "--parallel",
+            "-n",
+            help="Run tests in parallel (number of workers, 0 = serial; default: all CPUs)",
+        ),
     ] = None,
     verbose: Annotated[
         bool,
@@ -50,24 +137,42 @@ def run_command(
 
     Executes BDD tests from the features directory using Playwright.
 
+    \b
     Examples:
         # Run all tests
         frontend-tester run
 
+    \b
         # Run specific feature
         frontend-tester run --feature login.feature
 
+    \b
         # Run with tag
         frontend-tester run --tag smoke
 
+    \b
         # Run in parallel
         frontend-tester run --parallel 4
 
+    \b
         # Run with visible browser
         frontend-tester run --headed
     """
     print_header("Running Frontend Tests")
 
+    # Check argument shapes before touching the filesystem, so bad input fails fast
+    if tag is not None and not tag.lstrip("@"):
+        print_error("Tag must not be empty")
+        raise SystemExit(1)
+    if browser and browser.lower() not in VALID_BROWSERS:
+        print_error(
+            f"Invalid browser: {browser}. Valid options: {', '.join(sorted(VALID_BROWSERS))}"
+        )
+        raise SystemExit(2)
+    if parallel is not None and parallel < 0:
+        print_error("Number of parallel workers must not be negative")
+        raise SystemExit(1)
+
     # Find project root
     project_root = find_project_root(path or Path.cwd())
     if not project_root:
@@ -77,8 +182,9 @@ def run_command(
     features_dir = project_root / "features"
     support_dir = project_root / "support"
 
-    # Check if features exist
-    if not features_dir.exists() or not any(features_dir.glob("*.feature")):
+    # Check if features exist, listing the directory once for the feature filter too
+    feature_names = _list_feature_files(features_dir)
+    if not feature_names:
         print_error("No feature files found in features/")
         print_info("Create feature files or use 'frontend-tester generate' to create them.")
         raise SystemExit(1)
@@ -92,8 +198,8 @@ def run_command(
 
     # Add feature filter
     if feature:
-        feature_path = features_dir / feature
-        if not feature_path.exists():
+        # Names in subdirectories aren't in the listing and still need a lookup
+        if feature not in feature_names and not (features_dir / feature).exists():
             print_error(f"Feature file not found: {feature}")
             raise SystemExit(1)
         pytest_args[-1] = f"features/{feature}"
@@ -112,8 +218,7 @@ def run_command(
         pytest_args.append("-v")
 
     # Add parallel execution
-    if parallel:
-        pytest_args.extend(["-n", str(parallel)])
+    pytest_args.extend(_parallel_args(parallel))
 
     # Add HTML report
     if html_report:
@@ -135,19 +240,21 @@ def run_command(
 
     print()  # Empty line
 
-    # Run pytest
-    try:
-        import os
+    # Merge with current environment; without overrides pytest simply inherits it
+    full_env = {**os.environ, **env} if env else None
+    # Run from project root so pytest finds support/conftest.py
+    cwd = os.path.abspath(project_root)
 
-        # Merge with current environment
-        full_env = os.environ.copy()
-        full_env.update(env)
+    # Without an HTML report to point at, nothing needs to happen after pytest
+    # exits, so replace this process with it instead of waiting on a child
+    if not html_report and os.name == "posix":
+        _exec_pytest(pytest_args, cwd, full_env)
 
-        result = subprocess.run(
-            pytest_args,
-            cwd=project_root,  # Run from project root so pytest finds support/conftest.py
-            env=full_env,
-        )
+    # Run pytest
+    import subprocess
+
+    try:
+        result = subprocess.run(pytest_args, cwd=cwd, env=full_env)
 
         print()  # Empty line after output
 
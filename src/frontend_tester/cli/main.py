@@ -1,31 +1,81 @@
 """Main CLI entry point for Frontend Tester."""
 
+import importlib
+from typing import Any
+
 import typer
+from typer.core import TyperGroup
 from typing_extensions import Annotated
 
 from frontend_tester import __version__
-from frontend_tester.cli.utils import console, print_header
-from frontend_tester.cli.commands import (
-    init,
-    config as config_cmd,
-    run as run_cmd,
-    analyze as analyze_cmd,
-    generate as generate_cmd,
-)
+from frontend_tester.cli import utils as cli_utils
+
+# Subcommand name -> (module, function); a module is imported only when its command
+# is invoked or listed in help, so startup doesn't pay for every command's imports
+_LAZY_COMMANDS = {
+    "init": ("frontend_tester.cli.commands.init", "init_command"),
+    "config": ("frontend_tester.cli.commands.config", "config_command"),
+    "run": ("frontend_tester.cli.commands.run", "run_command"),
+    "analyze": ("frontend_tester.cli.commands.analyze", "analyze_command"),
+    "generate": ("frontend_tester.cli.commands.generate", "generate_command"),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports subcommand modules on first use."""
+
+    def parse_args(self, ctx: typer.Context, args: list[str]) -> list[str]:
+        """Print help to stdout when run without arguments, as rich help mode does."""
+        # Plain help mode would otherwise print this help as an error, to stderr
+        if not args and self.no_args_is_help and not ctx.resilient_parsing:
+            typer.echo(ctx.get_help())
+            ctx.exit(2)
+        return super().parse_args(ctx, args)
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        """List loaded and lazy subcommands, in registration order."""
+        loaded = super().list_commands(ctx)
+        return [*loaded, *(name for name in _LAZY_COMMANDS if name not in loaded)]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        """Get a subcommand, importing its module if it isn't loaded yet."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _LAZY_COMMANDS:
+            module_name, function_name = _LAZY_COMMANDS[cmd_name]
+            function = getattr(importlib.import_module(module_name), function_name)
+
+            # A single-command Typer app converts to that command itself
+            command_app = typer.Typer(rich_markup_mode=self.rich_markup_mode, add_completion=False)
+            command_app.command(name=cmd_name)(function)
+            command = typer.main.get_command(command_app)
+            self.add_command(command, cmd_name)
+        return command
+
+    def resolve_command(self, ctx: typer.Context, args: list[str]) -> tuple[Any, Any, list[str]]:
+        """Resolve a subcommand, loading all of them first for typo suggestions."""
+        if args and self.get_command(ctx, args[0]) is None:
+            for name in _LAZY_COMMANDS:
+                self.get_command(ctx, name)
+        return super().resolve_command(ctx, args)
+
 
 # Create the main Typer app
 app = typer.Typer(
     name="frontend-tester",
     help="AI-powered CLI tool for automated frontend regression testing",
+    cls=LazyTyperGroup,
     add_completion=False,
     no_args_is_help=True,
-    rich_markup_mode="rich",
+    # Plain click help: the help texts use no markup, and rich help rendering
+    # imports rich and markdown-it on every --help
+    rich_markup_mode=None,
 )
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
+        console = cli_utils.console
         console.print(f"[bold cyan]Frontend Tester[/bold cyan] version [bold]{__version__}[/bold]")
         console.print("\nAI-powered blackbox regression testing for frontend applications")
         raise typer.Exit()
@@ -56,12 +106,7 @@ def main(
     pass
 
 
-# Register subcommands
-app.command(name="init")(init.init_command)
-app.command(name="config")(config_cmd.config_command)
-app.command(name="run")(run_cmd.run_command)
-app.command(name="analyze")(analyze_cmd.analyze_command)
-app.command(name="generate")(generate_cmd.generate_command)
+# Subcommands are registered lazily through LazyTyperGroup (see _LAZY_COMMANDS)
 
 
 if __name__ == "__main__":
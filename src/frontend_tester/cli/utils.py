@@ -1,42 +1,98 @@
 """CLI utilities for pretty output and user interaction."""
 
-from rich.console import Console
-from rich.theme import Theme
+import asyncio
+import functools
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+try:
+    # Optional faster event loop (pip install frontend-tester[speedups])
+    import uvloop
+except ImportError:
+    uvloop = None
+
+T = TypeVar("T")
 
 # Custom theme for Frontend Tester
-custom_theme = Theme({
+CUSTOM_THEME_STYLES = {
     "info": "cyan",
     "warning": "yellow",
     "error": "bold red",
     "success": "bold green",
     "highlight": "bold magenta",
-})
+}
+
+# Global console instance, created on first print so that paths which print
+# nothing (or only through Typer) don't pay for importing rich
+_console: "Console | None" = None
+
+
+def _get_console() -> "Console":
+    """Get the global console, importing rich and creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        from rich.theme import Theme
+
+        _console = Console(theme=Theme(CUSTOM_THEME_STYLES))
+    return _console
+
 
-# Global console instance
-console = Console(theme=custom_theme)
+def __getattr__(name: str) -> Any:
+    """Create the module's ``console`` attribute lazily (PEP 562)."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[info]ℹ[/info] {message}")
+    _get_console().print(f"[info]ℹ[/info] {message}")
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[success]✓[/success] {message}")
+    _get_console().print(f"[success]✓[/success] {message}")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[warning]⚠[/warning] {message}")
+    _get_console().print(f"[warning]⚠[/warning] {message}")
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[error]✗[/error] {message}")
+    _get_console().print(f"[error]✗[/error] {message}")
 
 
 def print_header(title: str) -> None:
     """Print a section header."""
+    console = _get_console()
     console.print(f"\n[bold cyan]{title}[/bold cyan]")
-    console.print("─" * len(title))
+    console.print(_header_rule(len(title)))
+
+
+@functools.lru_cache(maxsize=32)
+def _header_rule(width: int) -> str:
+    """Get the line drawn under a header of the given width (headers repeat)."""
+    return "─" * width
+
+
+def run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a command's coroutine to completion on a new event loop.
+
+    Uses uvloop when it is installed, the default asyncio loop otherwise.
+
+    Args:
+        coroutine: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coroutine)
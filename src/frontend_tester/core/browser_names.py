@@ -0,0 +1,7 @@
+"""Browser names accepted in configuration and on the command line.
+
+Kept free of pydantic and YAML so the CLI can validate arguments cheaply.
+"""
+
+# Playwright engines plus the branded names users commonly type for them
+VALID_BROWSERS = frozenset({"chromium", "firefox", "webkit", "chrome", "edge", "safari"})
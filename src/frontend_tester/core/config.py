@@ -1,15 +1,41 @@
 """Configuration management for Frontend Tester."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field, field_validator
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from frontend_tester.core.browser_names import VALID_BROWSERS
+
+# Whether the .env file has been loaded into the environment (done on first
+# config load rather than at import, so commands that don't read config skip it)
+_dotenv_loaded = False
+
+
+def _load_dotenv() -> None:
+    """Load environment variables from the .env file, once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def _yaml_loader() -> Any:
+    """Get PyYAML's safe loader, the libyaml-backed one when PyYAML was built with it."""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_dumper() -> Any:
+    """Get PyYAML's safe dumper, the libyaml-backed one when PyYAML was built with it."""
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 class BrowserConfig(BaseModel):
@@ -37,12 +63,11 @@ class BrowserConfig(BaseModel):
     @classmethod
     def validate_browsers(cls, v: list[str]) -> list[str]:
         """Validate browser names."""
-        valid_browsers = {"chromium", "firefox", "webkit", "chrome", "edge", "safari"}
         for browser in v:
-            if browser.lower() not in valid_browsers:
+            if browser.lower() not in VALID_BROWSERS:
                 raise ValueError(
                     f"Invalid browser: {browser}. "
-                    f"Valid options: {', '.join(valid_browsers)}"
+                    f"Valid options: {', '.join(sorted(VALID_BROWSERS))}"
                 )
         return v
 
@@ -69,6 +94,12 @@ class LLMConfig(BaseModel):
     api_key: str = Field(default="", description="API key (prefer environment variables)")
     temperature: float = Field(default=0.7, description="Sampling temperature")
     max_tokens: int = Field(default=2000, description="Maximum tokens in response")
+    max_concurrent_requests: int = Field(
+        default=4, ge=1, description="Maximum number of LLM requests in flight at once"
+    )
+    rpm_limit: int | None = Field(
+        default=None, ge=1, description="Provider requests-per-minute limit (None = unlimited)"
+    )
 
     @field_validator("provider")
     @classmethod
@@ -118,8 +149,11 @@ class ProjectConfig(BaseModel):
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
+        import yaml
+
+        _load_dotenv()
         with open(config_path, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_yaml_loader()) or {}
 
         # Override with environment variables
         if os.getenv("OPENAI_API_KEY"):
@@ -133,6 +167,8 @@ class ProjectConfig(BaseModel):
 
     def save_to_file(self, config_path: Path) -> None:
         """Save configuration to YAML file."""
+        import yaml
+
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Don't save API keys to file
@@ -141,7 +177,9 @@ class ProjectConfig(BaseModel):
             data["llm"]["api_key"] = ""
 
         with open(config_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                data, f, Dumper=_yaml_dumper(), default_flow_style=False, sort_keys=False
+            )
 
     @classmethod
     def get_default_config_path(cls) -> Path:
@@ -164,18 +202,66 @@ def load_config(config_path: Path | None = None) -> ProjectConfig:
     3. ~/.config/frontend-tester/config.yaml (global)
     4. Default configuration
     """
+    # The cache key below includes the API key variables, which .env may set
+    _load_dotenv()
     if config_path and config_path.exists():
-        return ProjectConfig.load_from_file(config_path)
+        return _load_cached(config_path)
 
     # Try local config
     local_config = ProjectConfig.get_default_config_path()
     if local_config.exists():
-        return ProjectConfig.load_from_file(local_config)
+        return _load_cached(local_config)
 
     # Try global config
     global_config = ProjectConfig.get_global_config_path()
     if global_config.exists():
-        return ProjectConfig.load_from_file(global_config)
+        return _load_cached(global_config)
 
     # Return default config
     return ProjectConfig()
+
+
+def _load_cached(config_path: Path) -> ProjectConfig:
+    """
+    Load a config file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        config_path: Path to the YAML config file
+
+    Returns:
+        A copy of the loaded configuration that the caller may modify
+    """
+    config = _load_config_file(
+        str(config_path.resolve()),
+        config_path.stat().st_mtime_ns,
+        os.getenv("OPENAI_API_KEY"),
+        os.getenv("ANTHROPIC_API_KEY"),
+    )
+    return config.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_file(
+    config_path: str,
+    mtime_ns: int,
+    openai_api_key: str | None,
+    anthropic_api_key: str | None,
+) -> ProjectConfig:
+    """
+    Load and cache a config file.
+
+    Only config_path is read; the other arguments exist to be part of the cache
+    key. The modification time makes an edited file load again, and the API key
+    values (which load_from_file copies into the config) make a changed
+    environment load again instead of serving keys from the old one.
+
+    Args:
+        config_path: Resolved path to the YAML config file
+        mtime_ns: The file's modification time in nanoseconds
+        openai_api_key: Current OPENAI_API_KEY value
+        anthropic_api_key: Current ANTHROPIC_API_KEY value
+
+    Returns:
+        Loaded configuration, shared by all callers (copy it before modifying)
+    """
+    return ProjectConfig.load_from_file(Path(config_path))
@@ -0,0 +1,56 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    # Optional C-backed JSON (pip install frontend-tester[speedups])
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any, indent: bool = False, default: Callable[[Any], Any] | None = None
+) -> bytes:
+    """
+    Serialize a value to UTF-8 encoded JSON.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with two-space indentation
+        default: Converter for objects JSON can't represent natively
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        # Dataclasses go through default so they keep their own dict form
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default, ensure_ascii=False
+    ).encode()
@@ -0,0 +1,401 @@
+"""Scaffolding for new Frontend Tester projects (used by ``init`` only)."""
+
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib import resources
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+
+from frontend_tester.core.config import ProjectConfig
+from frontend_tester.core.project import clear_project_root_cache
+
+# Leaf directories created empty in a new project's .frontend-tester/, and
+# filled with examples in TEST_DIR/; makedirs creates the parents on the way
+_CONFIG_DIRS = (
+    ".frontend-tester/features",
+    ".frontend-tester/steps",
+    ".frontend-tester/support",
+    ".frontend-tester/baselines",
+    ".frontend-tester/reports",
+)
+_EXAMPLE_DIRS = (
+    "TEST_DIR/features",
+    "TEST_DIR/steps",
+    "TEST_DIR/support",
+)
+
+# Test file that registers the example scenarios with pytest
+_TEST_FILE = b'''"""Auto-generated test file for BDD scenarios.
+
+This file registers all scenarios from feature files so pytest can discover them.
+pytest-bdd requires test files (test_*.py) to link feature files to test execution.
+"""
+
+import sys
+from pathlib import Path
+from pytest_bdd import scenarios
+
+# Get the directory containing this file (features/)
+FEATURES_DIR = Path(__file__).parent
+
+# Add parent directory to path so we can import from steps/
+sys.path.insert(0, str(FEATURES_DIR.parent))
+
+# Import step definitions so they get registered with pytest-bdd
+from steps import common_steps  # noqa: F401, E402
+
+# Register all scenarios from all .feature files in this directory
+# This creates a pytest test for each scenario in each feature file
+for feature_file in FEATURES_DIR.glob("*.feature"):
+    scenarios(feature_file.name)
+'''
+
+# __init__.py for the example steps package
+_STEP_INIT = b'''"""Step definitions for BDD tests."""
+'''
+
+# __init__.py for the support package
+_SUPPORT_INIT = b'''"""Support utilities for tests."""
+'''
+
+# Root conftest.py that imports fixtures and step definitions
+_ROOT_CONFTEST = b'''"""Root conftest.py for pytest configuration and fixture discovery.
+
+This file ensures pytest discovers:
+- Fixtures from support/browser.py
+- Configuration from support/conftest.py
+- Step definitions (imported directly here)
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Import fixtures and configuration from support
+from support.conftest import *  # noqa: F403, F401
+
+# Import ALL step definitions directly
+# NOTE: pytest-bdd 8.x requires step definitions to be in conftest.py or test files
+# Simply importing from another module doesn't work
+from steps.test_common_steps import *  # noqa: F403, F401
+'''
+
+# Example feature file, formatted with the fields from _template_fields()
+_EXAMPLE_FEATURE = """Feature: Example Web Application Test
+  As a tester
+  I want to verify the web application works correctly
+  So that users have a good experience
+
+  @smoke
+  Scenario: Homepage loads successfully
+    Given I am on "{target_url}"
+    Then I should see "Example Domain"
+    And the page title should be "Example Domain"
+
+  @smoke
+  Scenario: Page title verification
+    Given I am on "{target_url}"
+    Then the URL should be "{target_url}"
+    And the page title should contain "Example"
+
+  @regression
+  Scenario: Content verification
+    Given I am on "{target_url}"
+    Then I should see "This domain is for use in illustrative examples"
+    And I should see "More information"
+
+  # TODO: Add more scenarios here
+  # Use 'frontend-tester generate <url>' to auto-generate tests
+"""
+
+# README for the .frontend-tester/ directory, formatted like _EXAMPLE_FEATURE
+_PROJECT_README = """# Frontend Tester Configuration: {name}
+
+This directory (`.frontend-tester/`) contains project **configuration** and **AI-generated test content**.
+
+## Structure
+
+- `config.yaml` - Project configuration (browsers, LLM settings, etc.)
+- `features/` - AI-generated Gherkin feature files (empty initially)
+- `steps/` - AI-generated step definitions (empty initially)
+- `support/` - Support utilities (empty initially)
+- `baselines/` - Visual regression baseline images
+- `reports/` - Test execution reports
+
+## Configuration
+
+Edit `config.yaml` to configure:
+- Target URLs for testing
+- Browser settings (chromium, firefox, webkit)
+- LLM provider and model for AI generation
+- Visual regression settings
+
+View current configuration:
+```bash
+frontend-tester config list
+```
+
+Update settings:
+```bash
+frontend-tester config set --key llm.model --value gpt-4
+frontend-tester config set --key browser.headless --value false
+```
+
+## Generating Tests
+
+Generate tests from a URL:
+```bash
+frontend-tester generate {app_url}
+```
+
+Generated tests will be placed in this directory's subdirectories.
+
+## Example Tests
+
+For learning and reference, check out the `TEST_DIR/` directory which contains:
+- Example feature files
+- Example step definitions
+- Working pytest configuration
+- Ready-to-run tests
+
+## Documentation
+
+For full documentation, see: https://github.com/yourusername/frontend-tester
+"""
+
+# README for the TEST_DIR/ directory, formatted like _EXAMPLE_FEATURE
+_TEST_DIR_README = """# Frontend Tester Example Tests: {name}
+
+This directory (`TEST_DIR/`) contains **example tests** to help you learn how to use Frontend Tester.
+
+## Quick Start
+
+Run the example tests:
+```bash
+cd TEST_DIR
+pytest -v
+```
+
+Run with a specific browser:
+```bash
+pytest -v --browser chromium
+pytest -v --browser firefox
+```
+
+Run specific test tags:
+```bash
+pytest -v -m smoke         # Run smoke tests only
+pytest -v -m regression    # Run regression tests only
+```
+
+## Structure
+
+- `features/` - Example Gherkin feature files
+  - `example.feature` - Example scenarios for {target_url}
+  - `test_features.py` - Test file to register scenarios
+- `steps/` - Example step definitions with Playwright
+  - `test_common_steps.py` - Common steps (Given, When, Then)
+- `support/` - Browser fixtures and pytest configuration
+  - `browser.py` - Playwright browser fixtures
+  - `conftest.py` - pytest configuration
+- `conftest.py` - Root pytest configuration
+
+## Learning Path
+
+1. **Read `features/example.feature`** - See how Gherkin scenarios are written
+2. **Explore `steps/test_common_steps.py`** - Understand step definitions and Playwright usage
+3. **Check `support/browser.py`** - Learn about browser fixtures
+4. **Run tests** - Execute `pytest -v` to see everything in action
+5. **Modify examples** - Try changing scenarios or adding new steps
+
+## Configuration
+
+This test directory uses configuration from `../.frontend-tester/config.yaml`.
+
+View configuration:
+```bash
+cd ..
+frontend-tester config list
+```
+
+## AI-Generated Tests
+
+Once you're comfortable with the examples, generate tests for your application:
+
+```bash
+cd ..
+frontend-tester generate {app_url}
+```
+
+Generated tests will be placed in `../.frontend-tester/features/` and `../.frontend-tester/steps/`.
+
+## Next Steps
+
+- Customize `features/example.feature` for your use case
+- Add new step definitions in `steps/`
+- Run tests in CI/CD pipelines
+- Explore visual regression testing (Phase 4)
+
+## Documentation
+
+For full documentation, see: https://github.com/yourusername/frontend-tester
+"""
+
+# Threads used to write the project files, which are independent of each other
+_WRITE_WORKERS = 4
+
+
+# File name pattern for the compiled templates in Jinja2's per-user cache directory
+_BYTECODE_CACHE_PATTERN = "__frontend_tester_scaffold_%s.cache"
+
+
+@functools.cache
+def _get_template_env() -> Environment:
+    """Get Jinja2 environment for the project templates (created once)."""
+    return Environment(
+        loader=PackageLoader("frontend_tester", "bdd/templates"),
+        # Bundled templates never change at runtime; skip the per-lookup mtime check
+        auto_reload=False,
+        # Keep compiled templates across processes, since init runs once per process
+        bytecode_cache=_get_bytecode_cache(),
+    )
+
+
+def _get_bytecode_cache() -> FileSystemBytecodeCache | None:
+    """
+    Get a bytecode cache in Jinja2's private per-user temp directory.
+
+    Returns:
+        The cache, or None if no safe cache directory is available
+    """
+    try:
+        return FileSystemBytecodeCache(pattern=_BYTECODE_CACHE_PATTERN)
+    except (OSError, RuntimeError):
+        return None
+
+
+def create_project_structure(path: Path, config: ProjectConfig) -> None:
+    """
+    Create the Frontend Tester project structure with two directories:
+
+    1. .frontend-tester/ - Configuration and AI-generated tests (empty initially)
+    2. TEST_DIR/ - Visible example tests for learning
+
+    The two are created by create_project_config() and create_example_tests().
+
+    Structure:
+        .frontend-tester/           # Hidden directory for config and generated content
+        ├── config.yaml             # Configuration
+        ├── features/               # AI-generated test features (empty initially)
+        ├── steps/                  # AI-generated step definitions (empty initially)
+        ├── support/                # Support utilities (empty initially)
+        ├── baselines/              # Visual regression baselines
+        ├── reports/                # Test execution reports
+        └── README.md               # Configuration documentation
+
+        TEST_DIR/                   # Visible example tests
+        ├── features/               # Example feature files
+        │   ├── example.feature
+        │   └── test_features.py
+        ├── steps/                  # Example step definitions
+        │   ├── __init__.py
+        │   └── test_common_steps.py
+        ├── support/                # Test support utilities
+        │   ├── __init__.py
+        │   ├── browser.py
+        │   └── conftest.py
+        ├── conftest.py             # Root pytest configuration
+        └── README.md               # Getting started guide
+    """
+    create_project_config(path, config)
+    create_example_tests(path, config)
+
+
+def create_project_config(path: Path, config: ProjectConfig) -> None:
+    """
+    Create the .frontend-tester/ directory with the configuration and its README.
+
+    Args:
+        path: Project root
+        config: Project configuration to save
+    """
+    _make_dirs(path, _CONFIG_DIRS)
+    frontend_tester_dir = path / ".frontend-tester"
+    config.save_to_file(frontend_tester_dir / "config.yaml")
+    (frontend_tester_dir / "README.md").write_bytes(
+        _PROJECT_README.format_map(_template_fields(config)).encode()
+    )
+    # Lookups from inside the new project may have been answered with an outer root
+    clear_project_root_cache()
+
+
+def create_example_tests(path: Path, config: ProjectConfig) -> None:
+    """
+    Create the TEST_DIR/ directory with ready-to-run example tests.
+
+    Args:
+        path: Project root
+        config: Project configuration (names and URLs used in the examples)
+    """
+    _make_dirs(path, _EXAMPLE_DIRS)
+    test_dir = path / "TEST_DIR"
+
+    # Build every file up front, then write them concurrently
+    fields = _template_fields(config)
+    files: list[tuple[Path, bytes]] = [
+        # Example feature and the test file registering its scenarios
+        (
+            test_dir / "features" / "example.feature",
+            _EXAMPLE_FEATURE.format_map(fields).encode(),
+        ),
+        (test_dir / "features" / "test_features.py", _TEST_FILE),
+        # Step definitions
+        (test_dir / "steps" / "__init__.py", _STEP_INIT),
+        (test_dir / "steps" / "test_common_steps.py", _common_steps_source()),
+        # Support files: Playwright browser fixtures and pytest-bdd configuration
+        (test_dir / "support" / "__init__.py", _SUPPORT_INIT),
+        (test_dir / "support" / "browser.py", _render_static_template("browser.jinja2")),
+        (test_dir / "support" / "conftest.py", _render_static_template("conftest.jinja2")),
+        # Root conftest.py and README in TEST_DIR/
+        (test_dir / "conftest.py", _ROOT_CONFTEST),
+        (test_dir / "README.md", _TEST_DIR_README.format_map(fields).encode()),
+    ]
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as pool:
+        # list() re-raises the first write error, if any
+        list(pool.map(lambda entry: entry[0].write_bytes(entry[1]), files))
+
+
+def _make_dirs(path: Path, directories: tuple[str, ...]) -> None:
+    """Create directories (and their parents) below the project root."""
+    base = os.fspath(path)
+    for directory in directories:
+        os.makedirs(os.path.join(base, directory), exist_ok=True)
+
+
+@functools.cache
+def _common_steps_source() -> bytes:
+    """Get the source of common_steps.py (read once per process)."""
+    # Read the file as-is rather than importing the module (and with it
+    # pytest-bdd and Playwright) to get its source
+    return resources.files("frontend_tester.bdd").joinpath("common_steps.py").read_bytes()
+
+
+@functools.cache
+def _render_static_template(name: str) -> bytes:
+    """Render a project template that takes no variables (rendered once per process)."""
+    return _get_template_env().get_template(name).render().encode()
+
+
+def _template_fields(config: ProjectConfig) -> dict[str, str]:
+    """Get the values substituted into the example feature and README templates."""
+    return {
+        "name": config.name,
+        # URL the example scenarios visit
+        "target_url": config.target_urls[0] if config.target_urls else "https://example.com",
+        # URL suggested for 'frontend-tester generate'
+        "app_url": config.target_urls[0] if config.target_urls else "http://localhost:3000",
+    }
@@ -1,5 +1,7 @@
 """Browser management for Playwright."""
 
+import asyncio
+import weakref
 from typing import Any
 from contextlib import asynccontextmanager
 
@@ -14,43 +16,158 @@ from playwright.async_api import (
 from frontend_tester.core.config import BrowserConfig
 
 
+class _SharedPlaywright:
+    """Playwright driver shared by the BrowserManagers running on one event loop."""
+
+    def __init__(self) -> None:
+        self.playwright: Playwright | None = None
+        self.users = 0
+        self.lock = asyncio.Lock()
+
+
+# One driver per event loop (a Playwright instance is bound to the loop it started on)
+_shared_playwrights: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedPlaywright]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _acquire_playwright() -> Playwright:
+    """Get the running loop's Playwright driver, starting it for the first user."""
+    shared = _shared_playwrights.setdefault(asyncio.get_running_loop(), _SharedPlaywright())
+    async with shared.lock:
+        if shared.playwright is None:
+            shared.playwright = await async_playwright().start()
+        shared.users += 1
+        return shared.playwright
+
+
+async def _release_playwright() -> None:
+    """Release the running loop's Playwright driver, stopping it after the last user."""
+    shared = _shared_playwrights[asyncio.get_running_loop()]
+    async with shared.lock:
+        shared.users -= 1
+        if shared.users == 0 and shared.playwright is not None:
+            playwright, shared.playwright = shared.playwright, None
+            await playwright.stop()
+
+
+# Browser names accepted by _launch_browser (attributes of the Playwright instance,
+# looked up once per start() for the browsers being launched)
+_BROWSER_TYPES = frozenset({"chromium", "firefox", "webkit"})
+
+
 class BrowserManager:
     """Manages Playwright browser instances and contexts."""
 
-    def __init__(self, config: BrowserConfig):
+    def __init__(
+        self,
+        config: BrowserConfig,
+        browsers: list[str] | None = None,
+        external_browsers: dict[str, Browser] | None = None,
+    ):
         """Initialize browser manager.
 
         Args:
             config: Browser configuration
+            browsers: Browsers to launch on start, or None for all configured browsers.
+                Commands that drive a single browser pass just that one, so no time
+                is spent cold-starting browsers they never use.
+            external_browsers: Already launched browsers by name. When given, start()
+                uses them instead of starting Playwright and launching its own, and
+                stop() leaves them open for their owner (e.g. a session fixture).
         """
         self.config = config
+        self.browser_names = browsers
+        self.external_browsers = external_browsers
         self._playwright: Playwright | None = None
         self._browsers: dict[str, Browser] = {}
+        # Browser type per name and the options every launch uses, set up by start()
+        self._browser_types: dict[str, Any] = {}
+        self._launch_options: dict[str, Any] = {}
+        # Context options taken from the config (computed once; settings left unset
+        # are omitted so Playwright's own defaults apply)
+        self._default_context_options: dict[str, Any] = {
+            name: value
+            for name, value in (
+                ("viewport", config.viewport),
+                ("locale", config.locale),
+                ("timezone_id", config.timezone),
+            )
+            if value
+        }
+        # Contexts shared by page(reuse_context=True), per browser and context options
+        self._context_pool: dict[tuple[str | None, tuple[tuple[str, str], ...]], BrowserContext] = {}
 
     async def start(self) -> None:
         """Start Playwright and launch browsers."""
-        self._playwright = await async_playwright().start()
+        if self.external_browsers is not None:
+            self._browsers = dict(self.external_browsers)
+            return
 
-        # Launch configured browsers
-        for browser_name in self.config.browsers:
-            browser = await self._launch_browser(browser_name)
-            self._browsers[browser_name] = browser
+        # Managers on the same event loop share one Playwright driver process
+        self._playwright = await _acquire_playwright()
+
+        # Launch requested (by default all configured) browsers concurrently
+        browser_names = self.config.browsers if self.browser_names is None else self.browser_names
+        self._browser_types = {
+            name: getattr(self._playwright, name) for name in browser_names if name in _BROWSER_TYPES
+        }
+        self._launch_options = {
+            "headless": self.config.headless,
+            "args": self.config.args or [],
+            "slow_mo": self.config.slow_mo,
+        }
+        results = await asyncio.gather(
+            *(self._launch_browser(browser_name) for browser_name in browser_names),
+            return_exceptions=True,
+        )
+
+        # Keep the launched browsers (in configured order) so stop() closes them
+        # even when another launch failed
+        errors = []
+        for browser_name, result in zip(browser_names, results, strict=True):
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                self._browsers[browser_name] = result
+        if errors:
+            raise errors[0]
 
     async def stop(self) -> None:
         """Stop all browsers and Playwright."""
-        # Close all browsers
-        for browser in self._browsers.values():
-            await browser.close()
-        self._browsers.clear()
+        try:
+            # Close pooled contexts, then the browsers this manager launched; a failed
+            # close doesn't keep the others (or Playwright) running
+            results = await asyncio.gather(
+                *(context.close() for context in self._context_pool.values()),
+                return_exceptions=True,
+            )
+            self._context_pool.clear()
+            if self.external_browsers is None:
+                results += await asyncio.gather(
+                    *(browser.close() for browser in self._browsers.values()),
+                    return_exceptions=True,
+                )
+            self._browsers.clear()
+        finally:
+            # Stop Playwright (once no other manager uses it)
+            if self._playwright:
+                self._playwright = None
+                await _release_playwright()
+                self._browser_types = {}
 
-        # Stop Playwright
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
 
     async def __aenter__(self) -> "BrowserManager":
         """Async context manager entry."""
-        await self.start()
+        try:
+            await self.start()
+        except BaseException:
+            # Release Playwright and any browsers launched before the failure
+            await self.stop()
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -72,21 +189,12 @@ class BrowserManager:
         if not self._playwright:
             raise RuntimeError("Playwright not started. Call start() first.")
 
-        launch_options = {
-            "headless": self.config.headless,
-            "args": self.config.args or [],
-            "slow_mo": self.config.slow_mo,
-        }
-
-        if browser_name == "chromium":
-            return await self._playwright.chromium.launch(**launch_options)
-        elif browser_name == "firefox":
-            return await self._playwright.firefox.launch(**launch_options)
-        elif browser_name == "webkit":
-            return await self._playwright.webkit.launch(**launch_options)
-        else:
+        browser_type = self._browser_types.get(browser_name)
+        if browser_type is None:
             raise ValueError(f"Invalid browser: {browser_name}")
 
+        return await browser_type.launch(**self._launch_options)
+
     def get_browser(self, browser_name: str | None = None) -> Browser:
         """Get a browser instance.
 
@@ -124,19 +232,8 @@ class BrowserManager:
         """
         browser = self.get_browser(browser_name)
 
-        # Apply default viewport if not specified
-        if "viewport" not in options and self.config.viewport:
-            options["viewport"] = self.config.viewport
-
-        # Apply locale if configured
-        if "locale" not in options and self.config.locale:
-            options["locale"] = self.config.locale
-
-        # Apply timezone if configured
-        if "timezone_id" not in options and self.config.timezone:
-            options["timezone_id"] = self.config.timezone
-
-        return await browser.new_context(**options)
+        # Configured viewport, locale and timezone apply unless given explicitly
+        return await browser.new_context(**{**self._default_context_options, **options})
 
     async def create_page(self, browser_name: str | None = None, **context_options: Any) -> Page:
         """Create a new page in a new context.
@@ -151,14 +248,44 @@ class BrowserManager:
         context = await self.create_context(browser_name, **context_options)
         return await context.new_page()
 
+    async def _get_pooled_context(
+        self, browser_name: str | None, context_options: dict[str, Any]
+    ) -> BrowserContext:
+        """Get the shared context for a browser and options, creating it on first use.
+
+        Args:
+            browser_name: Browser name, or None for the first configured browser
+            context_options: Context options
+
+        Returns:
+            Browser context that stays open until stop()
+        """
+        # Option values may be unhashable (e.g. the viewport dict), so key on their reprs
+        key = (
+            browser_name or next(iter(self._browsers), None),
+            tuple(sorted((name, repr(value)) for name, value in context_options.items())),
+        )
+        context = self._context_pool.get(key)
+        if context is None:
+            context = await self.create_context(browser_name, **context_options)
+            # Another page() may have created the same context meanwhile
+            pooled = self._context_pool.setdefault(key, context)
+            if pooled is not context:
+                await context.close()
+                context = pooled
+        return context
+
     @asynccontextmanager
     async def page(
-        self, browser_name: str | None = None, **context_options: Any
+        self, browser_name: str | None = None, reuse_context: bool = False, **context_options: Any
     ) -> Page:
         """Context manager for creating a page.
 
         Args:
             browser_name: Browser name, or None for the first configured browser
+            reuse_context: Open the page in a context shared with other pages that use
+                the same browser and options, instead of a fresh one. Saves the context
+                start-up cost, but the pages share cookies and storage.
             **context_options: Context options
 
         Yields:
@@ -169,6 +296,15 @@ class BrowserManager:
                 await page.goto("https://example.com")
                 # ... perform actions
         """
+        if reuse_context:
+            context = await self._get_pooled_context(browser_name, context_options)
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+            return
+
         context = await self.create_context(browser_name, **context_options)
         page = await context.new_page()
         try:
@@ -178,11 +314,15 @@ class BrowserManager:
 
 
 @asynccontextmanager
-async def browser_manager(config: BrowserConfig) -> BrowserManager:
+async def browser_manager(
+    config: BrowserConfig, external_browsers: dict[str, Browser] | None = None
+) -> BrowserManager:
     """Context manager for browser manager lifecycle.
 
     Args:
         config: Browser configuration
+        external_browsers: Already launched browsers to use (and leave open) instead
+            of launching new ones
 
     Yields:
         BrowserManager instance
@@ -192,9 +332,5 @@ async def browser_manager(config: BrowserConfig) -> BrowserManager:
             async with manager.page() as page:
                 await page.goto("https://example.com")
     """
-    manager = BrowserManager(config)
-    await manager.start()
-    try:
+    async with BrowserManager(config, external_browsers=external_browsers) as manager:
         yield manager
-    finally:
-        await manager.stop()
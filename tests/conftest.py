@@ -0,0 +1,53 @@
+"""Shared fixtures for tests that drive a real browser."""
+
+import pytest_asyncio
+
+from frontend_tester.core.config import BrowserConfig
+from frontend_tester.playwright_runner import browser_manager as browser_manager_module
+from frontend_tester.playwright_runner.browser_manager import browser_manager
+
+# Config of the shared browser, built once rather than per test
+_SHARED_BROWSER_CFG = BrowserConfig(browsers=["chromium"], headless=True)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_playwright():
+    """Keep one Playwright driver running on the session event loop.
+
+    BrowserManagers started on that loop reuse it instead of starting and stopping
+    their own driver (see _acquire_playwright), so tests using it must run on the
+    session event loop.
+    """
+    playwright = await browser_manager_module._acquire_playwright()
+    yield playwright
+    await browser_manager_module._release_playwright()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_browser(session_playwright):
+    """Launch one headless Chromium for the whole test session.
+
+    Launching a browser costs far more than opening a context, so tests share this
+    one and isolate themselves with a fresh context each (see the page fixture).
+    Under pytest-xdist every worker is its own process and session, so each worker
+    gets its own browser. Tests using it must run on the session event loop.
+    """
+    browser = await session_playwright.chromium.launch(headless=True)
+    yield browser
+    await browser.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_browser_manager(shared_browser):
+    """Wrap the shared browser in a BrowserManager, which leaves it open on exit."""
+    async with browser_manager(
+        _SHARED_BROWSER_CFG, external_browsers={"chromium": shared_browser}
+    ) as manager:
+        yield manager
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(shared_browser_manager):
+    """Open a page in a fresh context of the shared browser, with the configured viewport."""
+    async with shared_browser_manager.page() as page:
+        yield page
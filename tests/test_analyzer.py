@@ -0,0 +1,482 @@
+"""Tests for UI analyzer HTML extraction."""
+
+import asyncio
+import json
+
+import lxml.html
+import pytest
+from assertpy import assert_that
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from frontend_tester.ai import analyzer as analyzer_module
+from frontend_tester.ai.analyzer import UIAnalyzer
+from frontend_tester.core import json_utils
+from frontend_tester.core.config import LLMConfig
+
+SAMPLE_HTML = """<html>
+<head><title>Sample</title><script>var tracking = 1;</script><style>.btn {}</style></head>
+<body>
+  <h1>Welcome</h1>
+  <nav>
+    <a href="#!/home">Home</a>
+    <a href="/about">About</a>
+    <a>No href</a>
+  </nav>
+  <form id="login">
+    <input type="email" name="email" placeholder="Email">
+    <input type="submit" value="Log in">
+    <button type="button" class="btn primary" data-testid="cancel">Cancel</button>
+    <select name="lang"><option value="en">English</option><option>Czech</option></select>
+    <textarea name="notes"></textarea>
+  </form>
+  <noscript>Enable JavaScript</noscript>
+  <!-- build 1234 -->
+</body>
+</html>"""
+
+
+@pytest.fixture
+def analyzer():
+    """Create analyzer without an LLM client (extraction only)."""
+    return UIAnalyzer(llm_client=None)
+
+
+@pytest.fixture
+def root():
+    """Parse the sample page."""
+    return lxml.html.document_fromstring(SAMPLE_HTML)
+
+
+def test_extract_basic_elements_categories(analyzer, root):
+    """Test elements are sorted into the expected categories."""
+    elements = analyzer._extract_basic_elements(root)
+
+    assert_that([b.tag for b in elements["buttons"]]).is_equal_to(["input", "button"])
+    assert_that([link.href for link in elements["links"]]).is_equal_to(["#!/home", "/about"])
+    assert_that([i.name for i in elements["inputs"]]).is_equal_to(["email"])
+    assert_that(elements["textareas"]).is_length(1)
+    assert_that(elements["forms"][0].id).is_equal_to("login")
+
+
+def test_extract_element_info_attributes(analyzer, root):
+    """Test element attributes are extracted."""
+    elements = analyzer._extract_basic_elements(root)
+    cancel = elements["buttons"][1]
+
+    assert_that(cancel.class_).is_equal_to(["btn", "primary"])
+    assert_that(cancel.data_testid).is_equal_to("cancel")
+    assert_that(cancel.text).is_equal_to("Cancel")
+
+
+def test_element_info_json_form(analyzer, root):
+    """Test elements serialize to the analysis JSON dict form."""
+    elements = analyzer._extract_basic_elements(root)
+
+    data = json.loads(json.dumps(elements, default=analyzer_module.json_default))
+
+    assert_that(data["buttons"][1]).contains_entry({"class": ["btn", "primary"]})
+    assert_that(data["buttons"][1]).does_not_contain_key("options")
+    assert_that(data["selects"][0]["options"]).is_length(2)
+
+
+def test_extract_select_options(analyzer, root):
+    """Test select options are captured with values and text."""
+    elements = analyzer._extract_basic_elements(root)
+
+    assert_that(elements["selects"][0].options).is_equal_to(
+        [{"value": "en", "text": "English"}, {"value": "", "text": "Czech"}]
+    )
+
+
+def test_simplify_html_removes_scripts_and_styles(analyzer, root):
+    """Test simplified HTML drops scripts, styles, noscript blocks and comments."""
+    simplified = analyzer._simplify_html(root)
+
+    assert_that(simplified).contains("<h1>Welcome</h1>")
+    assert_that(simplified).does_not_contain("tracking")
+    assert_that(simplified).does_not_contain(".btn {}")
+    assert_that(simplified).does_not_contain("Enable JavaScript")
+    assert_that(simplified).does_not_contain("build 1234")
+
+
+@pytest.mark.parametrize("use_selectolax", [True, False])
+def test_extract_hrefs(monkeypatch, use_selectolax):
+    """Test link discovery returns hrefs with and without selectolax."""
+    if use_selectolax and analyzer_module.LexborHTMLParser is None:
+        pytest.skip("selectolax not installed")
+    if not use_selectolax:
+        monkeypatch.setattr(analyzer_module, "LexborHTMLParser", None)
+
+    hrefs = analyzer_module._extract_hrefs(SAMPLE_HTML)
+
+    assert_that(hrefs).is_equal_to(["#!/home", "/about"])
+
+
+def test_resolve_links(analyzer):
+    """Test crawl link resolution handles hash routes, anchors and relative paths."""
+    hrefs = ["#!/home", "#top", "/about", "mailto:a@b.c", "javascript:void(0)", ""]
+
+    resolved = analyzer._resolve_links("http://localhost:3000/app#!/old", hrefs)
+
+    assert_that(resolved).is_equal_to(
+        ["http://localhost:3000/app#!/home", "http://localhost:3000/about"]
+    )
+
+
+class _CountingLLMClient:
+    """LLM client stand-in that counts requests and returns a fixed analysis."""
+
+    def __init__(self, model="gpt-4"):
+        self.calls = 0
+        self.model = model
+
+    def get_model_name(self):
+        return self.model
+
+    async def stream_with_system_prompt(self, **kwargs):
+        self.calls += 1
+        yield '{"user_flows": []}'
+
+
+async def test_llm_analyze_reuses_cached_analysis():
+    """Test pages with identical simplified HTML trigger a single LLM call."""
+    llm_client = _CountingLLMClient()
+    analyzer = UIAnalyzer(llm_client=llm_client)
+
+    first = await analyzer._llm_analyze(
+        "http://localhost/a", "A", lxml.html.document_fromstring(SAMPLE_HTML)
+    )
+    second = await analyzer._llm_analyze(
+        "http://localhost/b", "B", lxml.html.document_fromstring(SAMPLE_HTML)
+    )
+
+    assert_that(llm_client.calls).is_equal_to(1)
+    assert_that(second).is_equal_to(first)
+
+
+async def test_llm_analyze_persists_analyses(tmp_path):
+    """Test analyses are reused across analyzer instances sharing a cache dir."""
+    first_client = _CountingLLMClient()
+    await UIAnalyzer(llm_client=first_client, cache_dir=tmp_path)._llm_analyze(
+        "http://localhost/a", "A", lxml.html.document_fromstring(SAMPLE_HTML)
+    )
+
+    second_client = _CountingLLMClient()
+    analysis = await UIAnalyzer(llm_client=second_client, cache_dir=tmp_path)._llm_analyze(
+        "http://localhost/a", "A", lxml.html.document_fromstring(SAMPLE_HTML)
+    )
+
+    # A different model doesn't reuse the stored analysis
+    other_client = _CountingLLMClient(model="anthropic/claude-3-opus-20240229")
+    await UIAnalyzer(llm_client=other_client, cache_dir=tmp_path)._llm_analyze(
+        "http://localhost/a", "A", lxml.html.document_fromstring(SAMPLE_HTML)
+    )
+
+    assert_that(first_client.calls).is_equal_to(1)
+    assert_that(second_client.calls).is_equal_to(0)
+    assert_that(analysis).is_equal_to({"user_flows": []})
+    assert_that(other_client.calls).is_equal_to(1)
+
+
+class _ScriptedLLMClient:
+    """LLM client stand-in that replays canned responses and records prompts."""
+
+    config = LLMConfig()
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.prompts = []
+
+    def get_max_output_tokens(self):
+        return 8192
+
+    async def stream_with_system_prompt(self, user_prompt, **kwargs):
+        self.prompts.append(user_prompt)
+        response = self.responses.pop(0)
+        # Stream in small fragments like a provider would
+        for start in range(0, len(response), 4):
+            yield response[start:start + 4]
+
+
+async def test_request_analysis_reports_full_invalid_reply():
+    """Test a reply read to the end but not valid JSON isn't marked truncated."""
+    analyzer = UIAnalyzer(llm_client=_ScriptedLLMClient(['{"forms": [']))
+
+    analysis = await analyzer._request_analysis("http://localhost", "Home", "<p>Home</p>")
+
+    assert_that(analysis).is_equal_to(
+        {"raw_response": '{"forms": [', "error": "Failed to parse JSON"}
+    )
+
+
+async def test_llm_analyze_batch_single_request():
+    """Test a batch of pages is analyzed with one LLM request."""
+    llm_client = _ScriptedLLMClient(['[{"forms": []}, {"forms": [{"name": "Login"}]}]'])
+    analyzer = UIAnalyzer(llm_client=llm_client)
+
+    analyses = await analyzer._llm_analyze_batch(
+        [("http://localhost/a", "A", "<p>a</p>"), ("http://localhost/b", "B", "<p>b</p>")]
+    )
+
+    assert_that(llm_client.prompts).is_length(1)
+    assert_that(llm_client.prompts[0]).contains("URL: http://localhost/a", "URL: http://localhost/b")
+    assert_that(analyses).is_equal_to([{"forms": []}, {"forms": [{"name": "Login"}]}])
+
+
+async def test_llm_analyze_batch_splits_at_output_token_limit():
+    """Test batches are split so no request asks for more than the model's output limit."""
+    requests = []
+
+    class _LimitedLLMClient:
+        config = LLMConfig(max_tokens=2000)
+
+        def get_max_output_tokens(self):
+            return 4096
+
+        async def stream_with_system_prompt(self, user_prompt, max_tokens=None, **kwargs):
+            requests.append(max_tokens)
+            if "Page 1" in user_prompt:
+                yield '[{"page": 1, "forms": []}, {"page": 2, "forms": []}]'
+            else:
+                yield '{"forms": []}'
+
+    items = [(f"http://localhost/{name}", name, "<p/>") for name in "abc"]
+    analyses = await UIAnalyzer(llm_client=_LimitedLLMClient())._llm_analyze_batch(items)
+
+    assert_that(analyses).is_equal_to([{"forms": []}] * 3)
+    # Two pages (4000 tokens) fit under the 4096 limit; the third goes on its own
+    assert_that(requests).is_length(2).contains(4000, None)
+
+
+async def test_llm_analyze_batch_falls_back_per_page():
+    """Test a batched response with the wrong shape falls back to one request per page."""
+    llm_client = _ScriptedLLMClient(['[{"forms": []}]', '{"page": "a"}', '{"page": "b"}'])
+    analyzer = UIAnalyzer(llm_client=llm_client)
+
+    analyses = await analyzer._llm_analyze_batch(
+        [("http://localhost/a", "A", "<p>a</p>"), ("http://localhost/b", "B", "<p>b</p>")]
+    )
+
+    assert_that(llm_client.prompts).is_length(3)
+    assert_that(analyses).is_equal_to([{"page": "a"}, {"page": "b"}])
+
+
+async def test_llm_analyze_batch_retries_only_missing_pages():
+    """Test pages matched by number are kept and only uncovered pages are re-requested."""
+    llm_client = _ScriptedLLMClient(['[{"page": 2, "forms": []}]', '{"forms": [{"name": "A"}]}'])
+    analyzer = UIAnalyzer(llm_client=llm_client)
+
+    analyses = await analyzer._llm_analyze_batch(
+        [("http://localhost/a", "A", "<p>a</p>"), ("http://localhost/b", "B", "<p>b</p>")]
+    )
+
+    assert_that(llm_client.prompts).is_length(2)
+    assert_that(llm_client.prompts[1]).contains("URL: http://localhost/a")
+    assert_that(analyses).is_equal_to([{"forms": [{"name": "A"}]}, {"forms": []}])
+
+
+@pytest.mark.parametrize("max_length", [10, 200, 100000])
+def test_serialize_bounded_matches_full_serialization(max_length):
+    """Test bounded serialization yields a prefix of the full lxml output."""
+    root = lxml.html.document_fromstring(
+        '<html><body><!-- nav --><details open><summary>More</summary>'
+        '<input type="checkbox" checked> &amp; text<br>tail</details></body></html>'
+    )
+    full = lxml.html.tostring(root, encoding="unicode")
+
+    serialized = analyzer_module._serialize_bounded(root, max_length)
+
+    assert_that(full.startswith(serialized)).is_true()
+    assert_that(serialized[:max_length]).is_equal_to(full[:max_length])
+
+
+def test_get_origin(analyzer):
+    """Test origins keep scheme and port and ignore host case."""
+    assert_that(analyzer._get_origin("http://LocalHost:3000/app#!/home")).is_equal_to(
+        "http://localhost:3000"
+    )
+    assert_that(analyzer._get_origin("https://localhost:3000/")).is_not_equal_to(
+        analyzer._get_origin("http://localhost:3000/")
+    )
+
+
+async def test_save_analysis_writes_json(analyzer, root, tmp_path):
+    """Test analyses are written as JSON, creating parent directories."""
+    analysis = {"url": "http://localhost", "basic_elements": analyzer._extract_basic_elements(root)}
+    output_path = tmp_path / "analysis" / "page.json"
+
+    await analyzer.save_analysis(analysis, output_path)
+
+    saved = json.loads(output_path.read_text())
+    assert_that(saved["basic_elements"]["forms"][0]["id"]).is_equal_to("login")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_save_analyses_matches_combined_json(
+    analyzer, root, tmp_path, monkeypatch, use_orjson
+):
+    """Test the page-by-page combined file equals dumping the whole dict at once."""
+    if not use_orjson:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    analyses = {
+        "http://localhost/": {
+            "title": "Café",
+            "basic_elements": analyzer._extract_basic_elements(root),
+        },
+        "http://localhost/empty": {"ai_analysis": {}, "links": []},
+    }
+    output_path = tmp_path / "all_pages.json"
+    streamed_path = tmp_path / "streamed.json"
+
+    async def stream():
+        for item in analyses.items():
+            yield item
+
+    await analyzer.save_analyses(analyses, output_path)
+    await analyzer.save_analyses(stream(), streamed_path)
+
+    expected = json.dumps(
+        analyses, indent=2, default=analyzer_module.json_default, ensure_ascii=False
+    )
+    assert_that(output_path.read_text()).is_equal_to(expected)
+    assert_that(streamed_path.read_text()).is_equal_to(expected)
+
+
+def test_split_shared_layout(analyzer):
+    """Test pages of one origin are sent without the layout they share."""
+    nav = "<html><body><nav>" + '<a href="/x">Link</a>' * 100 + "</nav><main>"
+    footer = "</main><footer>Footer</footer></body></html>"
+    first = nav + "<h1>First</h1>" + footer
+    second = nav + "<form>Second</form>" + footer
+    third = nav + "<p>Third</p>" + footer
+
+    assert_that(analyzer._split_shared_layout("http://localhost/1", first)[1]).is_equal_to(first)
+    system_prompt, second_html = analyzer._split_shared_layout("http://localhost/2", second)
+    third_prompt, third_html = analyzer._split_shared_layout("http://localhost/3", third)
+
+    assert_that(second_html).is_equal_to("<form>Second</form>")
+    assert_that(third_html).is_equal_to("<p>Third</p>")
+    assert_that(third_prompt).is_equal_to(system_prompt).contains("<nav>", "<footer>")
+    # Other origins don't use the layout
+    assert_that(analyzer._split_shared_layout("http://example.com/", second)[1]).is_equal_to(
+        second
+    )
+
+
+async def test_llm_analyze_stops_reading_non_json_response():
+    """Test a prose reply is rejected without reading it to the end."""
+    consumed = []
+
+    class _ProseLLMClient:
+        config = LLMConfig()
+
+        async def stream_with_system_prompt(self, **kwargs):
+            for fragment in ["  ", "Sure! ", "Here is ", "the analysis"]:
+                consumed.append(fragment)
+                yield fragment
+
+    analyzer = UIAnalyzer(llm_client=_ProseLLMClient())
+
+    analysis = await analyzer._request_analysis("http://localhost", "Home", "<p>Home</p>")
+
+    assert_that(analysis).contains_entry({"error": "Failed to parse JSON"}, {"truncated": True})
+    assert_that(consumed).is_equal_to(["  ", "Sure! "])
+
+
+async def test_analyze_skips_pages_without_elements():
+    """Test pages with too few interactive elements don't reach the LLM."""
+    llm_client = _CountingLLMClient()
+    analyzer = UIAnalyzer(llm_client=llm_client, min_elements=2)
+    root = lxml.html.document_fromstring(
+        '<html><body><h1>Privacy policy</h1><a href="/">Home</a></body></html>'
+    )
+
+    analysis = await analyzer._analyze_from_tree("http://localhost/privacy", "Privacy", root)
+
+    assert_that(llm_client.calls).is_equal_to(0)
+    assert_that(analysis["ai_analysis"]).contains_entry({"skipped": True})
+    assert_that(analysis["basic_elements"]["links"]).is_length(1)
+
+
+class _FakeContext:
+    """Browser context stand-in creating fake pages."""
+
+    def __init__(self, site):
+        self.site = site
+
+    async def new_page(self):
+        return _FakePage(self)
+
+
+class _FakePage:
+    """Playwright page stand-in serving a small site of linked pages."""
+
+    def __init__(self, context):
+        self.context = context
+        self.visited = []
+        self.url = None
+
+    async def goto(self, url, **kwargs):
+        self.visited.append(url)
+        self.url = url
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+    async def title(self):
+        return self.url
+
+    async def content(self):
+        return self.context.site[self.url]
+
+    async def close(self):
+        pass
+
+
+async def test_crawl_navigates_while_analysis_is_pending():
+    """Test the crawler keeps loading pages while the LLM is still analyzing."""
+    release = asyncio.Event()
+
+    class _BlockingLLMClient(_CountingLLMClient):
+        async def stream_with_system_prompt(self, **kwargs):
+            self.calls += 1
+            await release.wait()
+            yield '{"user_flows": []}'
+
+    site = {
+        f"http://localhost/p{i}": (
+            f'<html><body><a href="/p{i + 1}">Next</a><button>Go {i}</button></body></html>'
+        )
+        for i in range(3)
+    }
+    page = _FakePage(_FakeContext(site))
+    llm_client = _BlockingLLMClient()
+    analyzer = UIAnalyzer(llm_client=llm_client)
+
+    crawl = asyncio.create_task(
+        analyzer.crawl_and_analyze(page, "http://localhost/p0", max_pages=3)
+    )
+    while len(page.visited) < 3:
+        await asyncio.sleep(0)
+    assert_that(crawl.done()).is_false()
+    release.set()
+    analyses = await crawl
+
+    assert_that(page.visited).is_equal_to(list(site))
+    assert_that(analyses).contains_only(*site)
+    assert_that(analyses["http://localhost/p2"]).does_not_contain_key("error")
+    assert_that(llm_client.calls).is_equal_to(3)
+
+
+async def test_navigate_tolerates_busy_network():
+    """Test navigation returns once loaded even if the network never goes idle."""
+
+    class _BusyPage(_FakePage):
+        async def wait_for_load_state(self, *args, **kwargs):
+            raise PlaywrightTimeoutError("network never idle")
+
+    page = _BusyPage(_FakeContext({}))
+
+    await UIAnalyzer(llm_client=None).navigate(page, "http://localhost/live")
+
+    assert_that(page.visited).is_equal_to(["http://localhost/live"])
@@ -6,10 +6,24 @@ with the application under test, both locally and from within Docker containers.
 
 import os
 import pytest
+import pytest_asyncio
 from assertpy import assert_that
 
-from frontend_tester.core.config import BrowserConfig
-from frontend_tester.playwright_runner.browser_manager import browser_manager
+# The page fixtures (from conftest.py and below) share one browser on the session event loop,
+# so every test here starts a real browser
+pytestmark = [pytest.mark.slow, pytest.mark.asyncio(loop_scope="session")]
+
+# Mobile viewport for test_app_responsive
+_MOBILE_VIEWPORT = {"width": 375, "height": 667}
+
+# True once the ng-view injector exists and $http has no requests in flight
+_ANGULAR_IDLE_JS = """() => {
+    const el = document.querySelector('[ng-view]');
+    if (!el) return false;
+    const inj = window.angular && angular.element(el).injector();
+    if (!inj) return false;
+    return inj.get('$http').pendingRequests.length === 0;
+}"""
 
 
 def get_app_base_url() -> str:
@@ -24,133 +38,112 @@ def get_app_base_url() -> str:
     return os.environ.get("APP_BASE_URL", "http://localhost:3000")
 
 
-@pytest.mark.asyncio
-async def test_app_home_page_loads():
-    """Test that the app home page loads successfully."""
-    config = BrowserConfig(browsers=["chromium"], headless=True)
-    base_url = get_app_base_url()
-
-    async with browser_manager(config) as manager:
-        async with manager.page() as page:
-            # Navigate to the home page
-            response = await page.goto(base_url, wait_until="networkidle")
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def home_response(shared_browser_manager):
+    """Load the home page once for the tests that only inspect it.
 
-            # Verify successful response
-            assert_that(response).is_not_none()
-            assert_that(response.status).is_equal_to(200)
+    Yields:
+        Response of the home page navigation (its page is response.frame.page)
+    """
+    async with shared_browser_manager.page() as page:
+        yield await page.goto(get_app_base_url(), wait_until="load")
 
-            # Verify page title
-            title = await page.title()
-            assert_that(title).contains("AngularJS Demo Application")
 
-            # Verify main heading is present
-            heading = await page.locator("h1").text_content()
-            assert_that(heading).contains("AngularJS")
+@pytest.fixture
+def home_page(home_response):
+    """Home page loaded by home_response (shared, so tests must not navigate it away)."""
+    return home_response.frame.page
 
 
-@pytest.mark.asyncio
-async def test_app_navigation():
-    """Test that navigation works in the app."""
-    config = BrowserConfig(browsers=["chromium"], headless=True)
-    base_url = get_app_base_url()
+async def test_app_home_page_loads(home_response, home_page):
+    """Test that the app home page loads successfully."""
+    # Verify successful response
+    assert_that(home_response).is_not_none()
+    assert_that(home_response.status).is_equal_to(200)
 
-    async with browser_manager(config) as manager:
-        async with manager.page() as page:
-            # Navigate to the home page
-            await page.goto(base_url, wait_until="networkidle")
+    # Verify page title
+    title = await home_page.title()
+    assert_that(title).contains("AngularJS Demo Application")
 
-            # Verify navigation menu is present
-            nav = page.locator("nav")
-            assert_that(await nav.count()).is_greater_than(0)
+    # Verify main heading is present
+    heading = await home_page.locator("h1").text_content()
+    assert_that(heading).contains("AngularJS")
 
-            # Check for navigation links
-            home_link = page.locator('a[href="#!/home"]')
-            assert_that(await home_link.count()).is_greater_than(0)
 
-            data_binding_link = page.locator('a[href="#!/data-binding"]')
-            assert_that(await data_binding_link.count()).is_greater_than(0)
+async def test_app_navigation(home_page):
+    """Test that navigation works in the app."""
+    # Verify the navigation menu and its links are present (each wait fails the test
+    # with a timeout if nothing matches, and returns on the first match)
+    for selector in ("nav", 'a[href="#!/home"]', 'a[href="#!/data-binding"]'):
+        await home_page.locator(selector).first.wait_for(state="attached", timeout=2000)
 
 
-@pytest.mark.asyncio
-async def test_app_angularjs_loaded():
+async def test_app_angularjs_loaded(home_page):
     """Test that AngularJS is loaded and working."""
-    config = BrowserConfig(browsers=["chromium"], headless=True)
-    base_url = get_app_base_url()
-
-    async with browser_manager(config) as manager:
-        async with manager.page() as page:
-            # Navigate to the home page
-            await page.goto(base_url, wait_until="networkidle")
-
-            # Check that AngularJS app is initialized (ng-app attribute)
-            html_element = page.locator("html[ng-app='demoApp']")
-            assert_that(await html_element.count()).is_equal_to(1)
+    # Check that AngularJS app is initialized (ng-app attribute)
+    html_element = home_page.locator("html[ng-app='demoApp']")
+    await html_element.wait_for(state="attached", timeout=5000)
+    assert_that(await html_element.count()).is_equal_to(1)
+
+    # Wait for AngularJS to bootstrap instead of for the network to go idle
+    await home_page.wait_for_function(
+        "() => window.angular && angular.element(document).injector()"
+    )
 
-            # Verify AngularJS is loaded by checking for angular object in window
-            angular_loaded = await page.evaluate("() => typeof window.angular !== 'undefined'")
-            assert_that(angular_loaded).is_true()
+    # Verify AngularJS is loaded by checking for angular object in window
+    angular_loaded = await home_page.evaluate("() => typeof window.angular !== 'undefined'")
+    assert_that(angular_loaded).is_true()
 
 
-@pytest.mark.asyncio
-async def test_app_responsive():
+async def test_app_responsive(shared_browser):
     """Test that the app is accessible with different viewport sizes."""
-    config = BrowserConfig(
-        browsers=["chromium"],
-        headless=True,
-        viewport={"width": 375, "height": 667}  # Mobile viewport
-    )
     base_url = get_app_base_url()
 
-    async with browser_manager(config) as manager:
-        async with manager.page() as page:
-            # Navigate to the home page with mobile viewport
-            response = await page.goto(base_url, wait_until="networkidle")
+    context = await shared_browser.new_context(viewport=_MOBILE_VIEWPORT)
+    page = await context.new_page()
+    try:
+        # Navigate to the home page with mobile viewport
+        response = await page.goto(base_url, wait_until="load")
+
+        # Should still load successfully on mobile
+        assert_that(response.status).is_equal_to(200)
 
-            # Should still load successfully on mobile
-            assert_that(response.status).is_equal_to(200)
+        # Verify page content is still accessible
+        heading = await page.locator("h1").text_content()
+        assert_that(heading).is_not_none()
+    finally:
+        await context.close()
 
-            # Verify page content is still accessible
-            heading = await page.locator("h1").text_content()
-            assert_that(heading).is_not_none()
 
+# AngularJS hash routes checked by test_app_multiple_pages, one test case each
+_ROUTES = [
+    pytest.param("#!/home", id="home"),
+    pytest.param("#!/data-binding", id="data-binding"),
+    pytest.param("#!/controllers", id="controllers"),
+    pytest.param("#!/filters", id="filters"),
+]
 
-@pytest.mark.asyncio
-async def test_app_multiple_pages():
-    """Test navigating to multiple pages in the app."""
-    config = BrowserConfig(browsers=["chromium"], headless=True)
+
+@pytest.mark.parametrize("route", _ROUTES)
+async def test_app_multiple_pages(page, route):
+    """Test navigating to each page of the app."""
     base_url = get_app_base_url()
 
-    # List of pages to test (AngularJS hash routes)
-    pages_to_test = [
-        ("#!/home", "Home"),
-        ("#!/data-binding", "Data Binding"),
-        ("#!/controllers", "Controllers"),
-        ("#!/filters", "Filters"),
-    ]
-
-    async with browser_manager(config) as manager:
-        async with manager.page() as page:
-            # First load the base page
-            initial_response = await page.goto(base_url, wait_until="networkidle")
-            assert_that(initial_response.status).is_equal_to(200)
-
-            for route, expected_content in pages_to_test:
-                # Navigate to specific route
-                url = f"{base_url}/{route}"
-                response = await page.goto(url, wait_until="networkidle")
-
-                # For hash navigation, response might be None (client-side routing)
-                # or it might return a response (depending on Playwright behavior)
-                if response is not None:
-                    assert_that(response.status).is_equal_to(200)
-
-                # Wait for content to render
-                await page.wait_for_timeout(500)  # Give AngularJS time to render
-
-                # Verify we're on the correct page by checking the URL
-                current_url = page.url
-                assert_that(current_url).contains(route)
-
-                # Verify content is present
-                page_content = await page.content()
-                assert_that(page_content).is_not_none()
\ No newline at end of file
+    # First load the base page
+    initial_response = await page.goto(base_url, wait_until="load")
+    assert_that(initial_response.status).is_equal_to(200)
+
+    # Hash routes are client-side, so switch them in place instead of reloading the page
+    await page.evaluate(f"location.hash = {route!r}")
+    await page.wait_for_function(f"() => location.hash === {route!r}")
+
+    # Wait for AngularJS to finish the route's requests and render, rather than a fixed delay
+    await page.wait_for_function(_ANGULAR_IDLE_JS, timeout=2000)
+    await page.locator("[ng-view] *, h1").first.wait_for()
+
+    # Verify we're on the correct page by checking the URL
+    current_url = page.url
+    assert_that(current_url).contains(route)
+
+    # Verify the routed view is shown (without serializing the whole DOM)
+    assert_that(await page.locator("[ng-view]").first.is_visible()).is_true()
@@ -0,0 +1,26 @@
+"""Tests for template-based BDD file generation."""
+
+from assertpy import assert_that
+
+from frontend_tester.bdd import generator as feature_generator
+
+
+def test_generate_feature_file_renders_template(tmp_path):
+    """Test the feature template renders scenarios and steps."""
+    output_path = tmp_path / "features" / "login.feature"
+    scenarios = [
+        {"name": "Valid login", "steps": [{"keyword": "Given", "text": "I am on the homepage"}]}
+    ]
+
+    feature_generator.generate_feature_file(output_path, "Login", scenarios)
+
+    assert_that(output_path.read_text()).starts_with("Feature: Login").contains(
+        "Scenario: Valid login", "Given I am on the homepage"
+    )
+
+
+def test_template_env_is_reused():
+    """Test the Jinja2 environment is built once and shared."""
+    assert_that(feature_generator.get_template_env()).is_same_as(
+        feature_generator.get_template_env()
+    )
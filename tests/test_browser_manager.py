@@ -1,16 +1,31 @@
 """Tests for browser manager."""
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 from assertpy import assert_that
 
 from frontend_tester.core.config import BrowserConfig
+from frontend_tester.playwright_runner import browser_manager as browser_manager_module
 from frontend_tester.playwright_runner.browser_manager import BrowserManager, browser_manager
 
+# Shared configs: the managers only read them, so there is no need to rebuild and
+# re-validate the same model in every test
+_DEFAULT_CFG = BrowserConfig(browsers=["chromium"], headless=True)
+_VIEWPORT_CFG = BrowserConfig(
+    browsers=["chromium"],
+    headless=True,
+    viewport={"width": 1280, "height": 720},
+)
 
-@pytest.mark.asyncio
+
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("session_playwright")
 async def test_browser_manager_lifecycle():
     """Test browser manager start/stop."""
-    config = BrowserConfig(browsers=["chromium"], headless=True)
+    config = _DEFAULT_CFG
     manager = BrowserManager(config)
 
     # Start should initialize Playwright
@@ -25,33 +40,221 @@ async def test_browser_manager_lifecycle():
     assert_that(manager._playwright).is_none()
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("session_playwright")
 async def test_browser_manager_get_browser():
     """Test getting browser instances."""
-    config = BrowserConfig(browsers=["chromium"], headless=True)
-    manager = BrowserManager(config)
+    config = _DEFAULT_CFG
 
-    await manager.start()
+    async with browser_manager(config) as manager:
+        # Get default browser (first in list)
+        browser = manager.get_browser()
+        assert_that(browser).is_not_none()
+
+        # Get specific browser
+        browser2 = manager.get_browser("chromium")
+        assert_that(browser2).is_equal_to(browser)
+
+        # Invalid browser should raise error
+        with pytest.raises(ValueError, match="not launched"):
+            manager.get_browser("firefox")
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("session_playwright")
+async def test_browser_manager_launches_only_requested_browsers():
+    """Test only the browsers a command needs are launched."""
+    config = BrowserConfig(browsers=["chromium", "firefox"], headless=True)
+    async with BrowserManager(config, browsers=["chromium"]) as manager:
+        assert_that(manager._browsers).contains_only("chromium")
 
-    # Get default browser (first in list)
-    browser = manager.get_browser()
-    assert_that(browser).is_not_none()
 
-    # Get specific browser
-    browser2 = manager.get_browser("chromium")
-    assert_that(browser2).is_equal_to(browser)
+@pytest.mark.asyncio
+async def test_browser_manager_launches_browsers_concurrently(monkeypatch):
+    """Test browsers start in parallel and keep their configured order."""
+    launching = []
+    peak = []
+
+    class _FakeBrowser:
+        async def close(self):
+            pass
+
+    def browser_type(delay):
+        async def launch(**options):
+            launching.append(1)
+            peak.append(len(launching))
+            await asyncio.sleep(delay)
+            launching.pop()
+            return _FakeBrowser()
+
+        return SimpleNamespace(launch=launch)
+
+    fake_playwright = SimpleNamespace(
+        chromium=browser_type(0.02), firefox=browser_type(0.01), stop=_FakeBrowser().close
+    )
+
+    async def start():
+        return fake_playwright
 
-    # Invalid browser should raise error
-    with pytest.raises(ValueError, match="not launched"):
-        manager.get_browser("firefox")
+    monkeypatch.setattr(
+        browser_manager_module, "async_playwright", lambda: SimpleNamespace(start=start)
+    )
+    manager = BrowserManager(BrowserConfig(browsers=["chromium", "firefox"], headless=True))
+
+    await manager.start()
 
+    assert_that(max(peak)).is_equal_to(2)
+    assert_that(list(manager._browsers)).is_equal_to(["chromium", "firefox"])
     await manager.stop()
 
 
 @pytest.mark.asyncio
+async def test_browser_managers_share_playwright(monkeypatch):
+    """Test managers on one event loop share a Playwright driver until the last stops."""
+    events = []
+
+    async def stop():
+        events.append("stop")
+
+    async def start():
+        events.append("start")
+        return SimpleNamespace(stop=stop)
+
+    monkeypatch.setattr(
+        browser_manager_module, "async_playwright", lambda: SimpleNamespace(start=start)
+    )
+    config = _DEFAULT_CFG
+    first = BrowserManager(config, browsers=[])
+    second = BrowserManager(config, browsers=[])
+
+    await asyncio.gather(first.start(), second.start())
+    assert_that(first._playwright).is_same_as(second._playwright)
+
+    await first.stop()
+    assert_that(events).is_equal_to(["start"])
+    await second.stop()
+    assert_that(events).is_equal_to(["start", "stop"])
+
+
+@pytest.mark.asyncio
+async def test_browser_manager_failed_start_releases_playwright(monkeypatch):
+    """Test a launch failure inside browser_manager() still stops Playwright."""
+    events = []
+
+    async def stop():
+        events.append("stop")
+
+    async def launch(**options):
+        raise RuntimeError("launch failed")
+
+    async def start():
+        events.append("start")
+        return SimpleNamespace(stop=stop, chromium=SimpleNamespace(launch=launch))
+
+    monkeypatch.setattr(
+        browser_manager_module, "async_playwright", lambda: SimpleNamespace(start=start)
+    )
+
+    with pytest.raises(RuntimeError, match="launch failed"):
+        async with browser_manager(_DEFAULT_CFG):
+            pass
+
+    assert_that(events).is_equal_to(["start", "stop"])
+
+
+@pytest.mark.asyncio
+async def test_browser_manager_failed_close_releases_playwright(monkeypatch):
+    """Test stop() closes every browser and stops Playwright even when a close fails."""
+    events = []
+
+    async def stop():
+        events.append("stop")
+
+    def browser_type(name, error=None):
+        async def close():
+            events.append(f"close {name}")
+            if error:
+                raise error
+
+        async def launch(**options):
+            return SimpleNamespace(close=close)
+
+        return SimpleNamespace(launch=launch)
+
+    async def start():
+        return SimpleNamespace(
+            stop=stop,
+            chromium=browser_type("chromium", RuntimeError("close failed")),
+            firefox=browser_type("firefox"),
+        )
+
+    monkeypatch.setattr(
+        browser_manager_module, "async_playwright", lambda: SimpleNamespace(start=start)
+    )
+    manager = BrowserManager(BrowserConfig(browsers=["chromium", "firefox"], headless=True))
+    await manager.start()
+
+    with pytest.raises(RuntimeError, match="close failed"):
+        await manager.stop()
+
+    assert_that(events).is_equal_to(["close chromium", "close firefox", "stop"])
+    assert_that(manager._browsers).is_empty()
+
+
+@pytest.mark.asyncio
+async def test_browser_manager_reuses_pooled_contexts():
+    """Test pages with reuse_context share one context per browser and options."""
+    contexts = []
+
+    class _FakePage:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    class _FakeContext:
+        closed = False
+
+        async def new_page(self):
+            return _FakePage()
+
+        async def close(self):
+            self.closed = True
+
+    class _FakeBrowser:
+        async def new_context(self, **options):
+            contexts.append(_FakeContext())
+            return contexts[-1]
+
+        async def close(self):
+            pass
+
+    manager = BrowserManager(_DEFAULT_CFG)
+    manager._browsers = {"chromium": _FakeBrowser()}
+
+    async with manager.page(reuse_context=True) as first:
+        pass
+    async with manager.page("chromium", reuse_context=True) as second:
+        pass
+    async with manager.page(reuse_context=True, locale="cs-CZ"):
+        pass
+
+    assert_that(first.closed and second.closed).is_true()
+    assert_that(contexts).is_length(2)
+    assert_that([context.closed for context in contexts]).is_equal_to([False, False])
+
+    await manager.stop()
+    assert_that([context.closed for context in contexts]).is_equal_to([True, True])
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("session_playwright")
 async def test_browser_manager_context_manager():
     """Test browser manager as context manager."""
-    config = BrowserConfig(browsers=["chromium"], headless=True)
+    config = _DEFAULT_CFG
 
     async with browser_manager(config) as manager:
         assert_that(manager._playwright).is_not_none()
@@ -61,10 +264,12 @@ async def test_browser_manager_context_manager():
     # (can't check manager state as it's out of scope, but no errors means success)
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("session_playwright")
 async def test_browser_manager_page_context_manager():
     """Test creating a page with context manager."""
-    config = BrowserConfig(browsers=["chromium"], headless=True)
+    config = _DEFAULT_CFG
 
     async with browser_manager(config) as manager:
         async with manager.page() as page:
@@ -74,42 +279,38 @@ async def test_browser_manager_page_context_manager():
             assert_that(page.url).is_equal_to("about:blank")
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("session_playwright")
 async def test_browser_manager_invalid_browser():
     """Test launching invalid browser (bypassing validation for testing)."""
-    # Create config with valid browser first, then manually set invalid browser
-    config = BrowserConfig(browsers=["chromium"], headless=True)
-    manager = BrowserManager(config)
-
-    # Manually set invalid browser to test launch logic
-    manager.config.browsers = ["invalid"]
+    # Copy a valid config with an invalid browser set (model_copy skips validation),
+    # leaving the shared config untouched
+    config = _DEFAULT_CFG.model_copy(update={"browsers": ["invalid"]})
 
     with pytest.raises(ValueError, match="Invalid browser"):
-        await manager.start()
+        async with browser_manager(config):
+            pass
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("session_playwright")
 async def test_browser_manager_no_browsers():
     """Test getting browser when none launched."""
     config = BrowserConfig(browsers=[], headless=True)
-    manager = BrowserManager(config)
-
-    await manager.start()
 
-    with pytest.raises(ValueError, match="No browsers launched"):
-        manager.get_browser()
-
-    await manager.stop()
+    async with browser_manager(config) as manager:
+        with pytest.raises(ValueError, match="No browsers launched"):
+            manager.get_browser()
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.usefixtures("session_playwright")
 async def test_browser_manager_create_context():
     """Test creating browser context with options."""
-    config = BrowserConfig(
-        browsers=["chromium"],
-        headless=True,
-        viewport={"width": 1280, "height": 720},
-    )
+    config = _VIEWPORT_CFG
 
     async with browser_manager(config) as manager:
         # Create context with default viewport
@@ -124,3 +325,30 @@ async def test_browser_manager_create_context():
 
         await page.close()
         await context.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_manager_uses_external_browsers(monkeypatch):
+    """Test external browsers are used without starting Playwright and left open."""
+
+    class _FakeBrowser:
+        closed = False
+
+        async def new_context(self, **options):
+            return SimpleNamespace(options=options)
+
+        async def close(self):
+            self.closed = True
+
+    async def fail_acquire():
+        raise AssertionError("Playwright should not be started")
+
+    monkeypatch.setattr(browser_manager_module, "_acquire_playwright", fail_acquire)
+    browser = _FakeBrowser()
+
+    async with browser_manager(_VIEWPORT_CFG, external_browsers={"chromium": browser}) as manager:
+        assert_that(manager.get_browser()).is_same_as(browser)
+        context = await manager.create_context()
+        assert_that(context.options["viewport"]).is_equal_to({"width": 1280, "height": 720})
+
+    assert_that(browser.closed).is_false()
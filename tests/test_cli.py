@@ -1,10 +1,18 @@
 """Tests for CLI functionality."""
 
+import os
+import subprocess
+import sys
+
 from typer.testing import CliRunner
 from assertpy import assert_that
 
+from frontend_tester.cli import utils as cli_utils
+from frontend_tester.cli.commands import analyze as analyze_module
+from frontend_tester.cli.commands import run as run_module
 from frontend_tester.cli.main import app
 from frontend_tester import __version__
+from frontend_tester.core.config import ProjectConfig
 
 runner = CliRunner()
 
@@ -45,3 +53,187 @@ def test_config_help():
     result = runner.invoke(app, ["config", "--help"])
     assert_that(result.exit_code).is_equal_to(0)
     assert_that(result.stdout).contains("Manage")
+
+
+def test_subcommand_help_has_no_completion_options():
+    """Test lazily loaded subcommands don't add their own completion options."""
+    for command in ["init", "config", "generate", "analyze", "run"]:
+        result = runner.invoke(app, [command, "--help"])
+        assert_that(result.exit_code).is_equal_to(0)
+        assert_that(result.stdout).does_not_contain("--install-completion", "--show-completion")
+
+
+def test_page_filename():
+    """Test page URLs map to safe analysis filenames."""
+    assert_that(analyze_module._page_filename("http://localhost:3000/")).is_equal_to(
+        "index.json"
+    )
+    assert_that(analyze_module._page_filename("http://localhost/admin/users")).is_equal_to(
+        "admin_users.json"
+    )
+    assert_that(analyze_module._page_filename("http://localhost/app#!/users/1")).is_equal_to(
+        "app__users_1.json"
+    )
+
+
+def test_cli_startup_skips_heavy_imports():
+    """Test loading the CLI doesn't import the LLM, Playwright or subcommand modules."""
+    code = (
+        "import sys, frontend_tester.cli.main; "
+        "print(sorted(m for m in sys.modules if m in ('litellm', 'playwright') "
+        "or m.startswith('frontend_tester.cli.commands.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert_that(result.stdout.strip()).is_equal_to("[]")
+
+
+def test_cli_help_and_version_skip_llm_and_playwright():
+    """Test --help, --version and command help don't import the LLM or Playwright."""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from frontend_tester.cli.main import app\n"
+        "for args in (['--help'], ['--version'], ['generate', '--help'], ['run', '--help']):\n"
+        "    CliRunner().invoke(app, args)\n"
+        "print(sorted(m for m in ('litellm', 'openai', 'playwright') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert_that(result.stdout.strip()).is_equal_to("[]")
+
+
+def test_run_command_skips_config_imports():
+    """Test the run command loads neither the config models nor pydantic."""
+    code = (
+        "import sys, frontend_tester.cli.commands.run; "
+        "print(sorted(m for m in ('pydantic', 'frontend_tester.core.config') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert_that(result.stdout.strip()).is_equal_to("[]")
+
+
+def test_console_created_on_first_use():
+    """Test the rich console is only created once something is printed."""
+    code = (
+        "import sys, frontend_tester.cli.utils as u; before = 'rich.console' in sys.modules; "
+        "u.console; print(before, 'rich.console' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert_that(result.stdout.strip()).is_equal_to("False True")
+
+
+def test_run_rejects_bad_arguments_before_project_lookup(tmp_path):
+    """Test run fails on malformed arguments even outside a project."""
+    result = runner.invoke(app, ["run", str(tmp_path), "--tag", "@"])
+    assert_that(result.exit_code).is_equal_to(1)
+    assert_that(result.output).contains("Tag must not be empty")
+
+    result = runner.invoke(app, ["run", str(tmp_path), "--browser", "chromeum"])
+    assert_that(result.exit_code).is_equal_to(2)
+    assert_that(result.output).contains("Invalid browser: chromeum")
+
+
+def test_list_feature_files(tmp_path):
+    """Test only feature files directly in the directory are listed."""
+    (tmp_path / "login.feature").write_text("Feature: Login")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "cart.feature").write_text("Feature: Cart")
+
+    assert_that(run_module._list_feature_files(tmp_path)).is_equal_to({"login.feature"})
+    assert_that(run_module._list_feature_files(tmp_path / "missing")).is_empty()
+
+
+def test_parallel_args(monkeypatch):
+    """Test explicit worker counts, the auto default and its opt-out."""
+    monkeypatch.setattr(run_module.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(run_module.importlib.util, "find_spec", lambda name: object())
+    monkeypatch.delenv("FRONTEND_TESTER_AUTO_PARALLEL", raising=False)
+
+    assert_that(run_module._parallel_args(4)[:4]).is_equal_to(["-n", "4", "--dist", "loadfile"])
+    assert_that(run_module._parallel_args(0)).is_empty()
+    assert_that(run_module._parallel_args(None)).contains("auto")
+
+    monkeypatch.setenv("FRONTEND_TESTER_AUTO_PARALLEL", "0")
+    assert_that(run_module._parallel_args(None)).is_empty()
+
+    monkeypatch.delenv("FRONTEND_TESTER_AUTO_PARALLEL")
+    monkeypatch.setattr(run_module.importlib.util, "find_spec", lambda name: None)
+    assert_that(run_module._parallel_args(None)).is_empty()
+
+
+def test_run_replaces_process_with_pytest(tmp_path, monkeypatch):
+    """Test run execs pytest in the project root when no report is requested."""
+    (tmp_path / ".frontend-tester").mkdir()
+    (tmp_path / "features").mkdir()
+    (tmp_path / "features" / "login.feature").write_text("Feature: Login")
+    calls = []
+
+    def fake_execvpe(file, args, env):
+        calls.append((file, args, os.getcwd()))
+        raise SystemExit(0)
+
+    monkeypatch.chdir(tmp_path.parent)
+    monkeypatch.setattr(run_module.os, "execvpe", fake_execvpe)
+    result = runner.invoke(app, ["run", str(tmp_path), "--parallel", "0"])
+
+    assert_that(result.exit_code).is_equal_to(0)
+    assert_that(calls).is_equal_to([("pytest", ["pytest", "features", "-v"], str(tmp_path))])
+
+
+def test_init_without_examples(tmp_path):
+    """Test --no-examples creates the configuration but no TEST_DIR/."""
+    result = runner.invoke(app, ["init", str(tmp_path), "--yes", "--no-examples"])
+    assert_that(result.exit_code).is_equal_to(0)
+
+    assert_that((tmp_path / ".frontend-tester" / "config.yaml").exists()).is_true()
+    assert_that((tmp_path / "TEST_DIR").exists()).is_false()
+    # The summary doesn't point at example tests that weren't created
+    assert_that(result.stdout).does_not_contain("Run the example tests", "example +")
+
+
+def test_init_rejects_config_json_without_target_urls(tmp_path):
+    """Test an empty target_urls list is rejected before anything is written."""
+    result = runner.invoke(app, ["init", str(tmp_path), "--config-json", '{"target_urls": []}'])
+
+    assert_that(result.exit_code).is_equal_to(1)
+    assert_that(result.stdout).contains("target_urls")
+    assert_that(list(tmp_path.iterdir())).is_empty()
+
+    # A --url fills the gap
+    result = runner.invoke(
+        app,
+        ["init", str(tmp_path), "--config-json", '{"target_urls": []}', "--url", "http://x.test"],
+    )
+    assert_that(result.exit_code).is_equal_to(0)
+
+
+def test_init_from_config_json(tmp_path):
+    """Test init takes the whole configuration from --config-json without prompting."""
+    config_json = '{"browser": {"browsers": ["firefox"]}, "llm": {"provider": "anthropic"}}'
+    result = runner.invoke(
+        app, ["init", str(tmp_path), "--config-json", config_json, "--name", "shop"]
+    )
+    assert_that(result.exit_code).is_equal_to(0)
+
+    config = ProjectConfig.load_from_file(tmp_path / ".frontend-tester" / "config.yaml")
+    assert_that(config.name).is_equal_to("shop")
+    assert_that(config.browser.browsers).is_equal_to(["firefox"])
+    assert_that(config.llm.provider).is_equal_to("anthropic")
+
+
+def test_run_async_returns_result(monkeypatch):
+    """Test commands' coroutines run to completion without uvloop installed."""
+    monkeypatch.setattr(cli_utils, "uvloop", None)
+
+    async def answer():
+        return 42
+
+    assert_that(cli_utils.run_async(answer())).is_equal_to(42)
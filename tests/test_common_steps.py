@@ -0,0 +1,77 @@
+"""Tests for the common BDD step patterns."""
+
+import pytest
+from assertpy import assert_that
+from pytest_bdd.steps import step_function_context_registry
+
+from frontend_tester.bdd import common_steps
+
+
+def _matching_steps(type_, text):
+    """Return (function name, arguments) of the common steps matching a step text."""
+    return [
+        (context.step_func.__name__, context.parser.parse_arguments(text))
+        for context in step_function_context_registry.values()
+        if context.step_func.__module__ == common_steps.__name__
+        and context.type == type_
+        and context.parser.is_matching(text)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("type_", "text", "expected"),
+    [
+        ("when", 'I click on "#submit"', ("click_element", {"selector": "#submit"})),
+        ("when", "I click on #submit", ("click_element", {"selector": "#submit"})),
+        (
+            "when",
+            'I type "hello" into "#q"',
+            ("type_into_field", {"text": "hello", "selector": "#q"}),
+        ),
+        ("when", "I type hello into #q", ("type_into_field", {"text": "hello", "selector": "#q"})),
+        # Unquoted arguments keep a closing quote of their own
+        ("when", 'I click on text="Save"', ("click_element", {"selector": 'text="Save"'})),
+        (
+            "when",
+            'I type hi into [data-x="y"]',
+            ("type_into_field", {"text": "hi", "selector": '[data-x="y"]'}),
+        ),
+        (
+            "given",
+            'I am on http://x.test/?q="a"',
+            ("navigate_to_url", {"url": 'http://x.test/?q="a"'}),
+        ),
+        ("when", 'I navigate to "http://x.test"', ("navigate_to", {"url": "http://x.test"})),
+        (
+            "then",
+            '"#menu" should be hidden',
+            ("element_should_not_be_visible", {"selector": "#menu"}),
+        ),
+        ("then", 'I should see "Welcome back"', ("should_see_text", {"text": "Welcome back"})),
+        (
+            "then",
+            '"#name" should have value "Ann"',
+            ("element_should_have_value", {"selector": "#name", "value": "Ann"}),
+        ),
+        (
+            "when",
+            'I fill "Email" with "a@b.c"',
+            ("fill_field", {"field": "Email", "value": "a@b.c"}),
+        ),
+    ],
+)
+def test_step_patterns_extract_arguments(type_, text, expected):
+    """Test step texts match their step function with the same arguments as parse."""
+    assert_that(_matching_steps(type_, text)).is_equal_to([expected])
+
+
+def test_wait_for_seconds_converts_to_int():
+    """Test the seconds argument is converted to an integer."""
+    contexts = [
+        context
+        for context in step_function_context_registry.values()
+        if context.step_func is common_steps.wait_for_seconds
+    ]
+
+    assert_that(contexts[0].converters["seconds"]("3")).is_equal_to(3)
+    assert_that(contexts[0].parser.is_matching("I wait for three seconds")).is_false()
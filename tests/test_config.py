@@ -1,14 +1,18 @@
 """Tests for configuration system."""
 
-from pathlib import Path
-import tempfile
+import os
+import subprocess
+import sys
 import pytest
 from assertpy import assert_that
 
+from frontend_tester.cli.commands import config as config_command_module
+from frontend_tester.core import config as config_module
 from frontend_tester.core.config import (
     ProjectConfig,
     BrowserConfig,
     LLMConfig,
+    load_config,
 )
 
 
@@ -36,39 +40,91 @@ def test_config_validation():
         BrowserConfig(browsers=["invalid"])
 
 
-def test_config_save_load():
+def test_config_save_load(tmp_path):
     """Test saving and loading configuration."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.yaml"
+    config_path = tmp_path / "config.yaml"
 
-        # Create and save config
-        config = ProjectConfig(
-            name="test-project",
-            target_urls=["http://example.com"],
-            llm=LLMConfig(provider="anthropic", model="claude-sonnet-4"),
-        )
-        config.save_to_file(config_path)
+    # Create and save config
+    config = ProjectConfig(
+        name="test-project",
+        target_urls=["http://example.com"],
+        llm=LLMConfig(provider="anthropic", model="claude-sonnet-4"),
+    )
+    config.save_to_file(config_path)
 
-        # Load config
-        loaded_config = ProjectConfig.load_from_file(config_path)
-        assert_that(loaded_config.name).is_equal_to("test-project")
-        assert_that(loaded_config.target_urls).is_equal_to(["http://example.com"])
-        assert_that(loaded_config.llm.provider).is_equal_to("anthropic")
+    # Load config
+    loaded_config = ProjectConfig.load_from_file(config_path)
+    assert_that(loaded_config.name).is_equal_to("test-project")
+    assert_that(loaded_config.target_urls).is_equal_to(["http://example.com"])
+    assert_that(loaded_config.llm.provider).is_equal_to("anthropic")
 
 
-def test_config_no_api_key_in_file():
+def test_config_no_api_key_in_file(tmp_path):
     """Test that API keys are not saved to file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.yaml"
-
-        # Create config with API key
-        config = ProjectConfig(
-            name="test",
-            llm=LLMConfig(api_key="sk-secret123"),
-        )
-        config.save_to_file(config_path)
-
-        # Verify API key is not in file
-        content = config_path.read_text()
-        assert_that(content).does_not_contain("sk-secret123")
-        assert_that(content).contains_ignoring_case("api_key").matches(r"api_key:\s*['\"]?\s*['\"]?")
+    config_path = tmp_path / "config.yaml"
+
+    # Create config with API key
+    config = ProjectConfig(
+        name="test",
+        llm=LLMConfig(api_key="sk-secret123"),
+    )
+    config.save_to_file(config_path)
+
+    # Verify API key is not in file
+    content = config_path.read_text()
+    assert_that(content).does_not_contain("sk-secret123")
+    assert_that(content).contains_ignoring_case("api_key").matches(r"api_key:\s*['\"]?\s*['\"]?")
+
+
+def test_load_config_reuses_unchanged_file(tmp_path, monkeypatch):
+    """Test an unchanged config file is parsed once and edits are picked up."""
+    config_path = tmp_path / "config.yaml"
+    ProjectConfig(name="first").save_to_file(config_path)
+    loads = []
+    load_from_file = ProjectConfig.load_from_file
+    monkeypatch.setattr(
+        ProjectConfig,
+        "load_from_file",
+        classmethod(lambda cls, path: loads.append(path) or load_from_file(path)),
+    )
+    config_module._load_config_file.cache_clear()
+
+    config = load_config(config_path)
+    config.name = "changed by caller"
+    assert_that(load_config(config_path).name).is_equal_to("first")
+    assert_that(loads).is_length(1)
+
+    ProjectConfig(name="second").save_to_file(config_path)
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert_that(load_config(config_path).name).is_equal_to("second")
+    assert_that(loads).is_length(2)
+
+
+def test_config_import_defers_yaml_and_dotenv():
+    """Test importing the config module doesn't load YAML or the .env file."""
+    code = (
+        "import sys, frontend_tester.core.config as c; "
+        "print(sorted(m for m in ('yaml', 'dotenv') if m in sys.modules), c._dotenv_loaded)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert_that(result.stdout.strip()).is_equal_to("[] False")
+
+
+def test_replace_value_updates_nested_keys():
+    """Test setting a key replaces only the submodel that holds it."""
+    config = ProjectConfig()
+
+    updated = config_command_module._replace_value(config, ["llm", "model"], "gpt-4o")
+    images = config_command_module._replace_value(
+        config, ["docker", "images", "firefox"], "custom:latest"
+    )
+
+    assert_that(updated.llm.model).is_equal_to("gpt-4o")
+    assert_that(updated.browser).is_same_as(config.browser)
+    assert_that(config.llm.model).is_equal_to("gpt-4")
+    assert_that(images.docker.images).contains_entry({"firefox": "custom:latest"})
+    with pytest.raises(ValueError, match="Invalid provider"):
+        config_command_module._replace_value(config, ["llm", "provider"], "unknown")
@@ -0,0 +1,288 @@
+"""Tests for BDD test suite generation."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from assertpy import assert_that
+
+from frontend_tester.ai import analyzer as analyzer_module
+from frontend_tester.ai import client as client_module
+from frontend_tester.ai import generator as generator_module
+from frontend_tester.ai.client import LLMClient
+from frontend_tester.ai.prompts.test_generation import (
+    GENERATE_FEATURE_FILE_SYSTEM_PROMPT,
+    GENERATE_SCENARIOS_SYSTEM_PROMPT,
+)
+from frontend_tester.core.config import LLMConfig
+
+FEATURE_TEMPLATE = """Feature: {name}
+  Scenario: Run {name}
+    Given I am on the home page
+    When I start {name}
+    Then I should see the result"""
+
+
+class _FlowLLMClient:
+    """LLM stub streaming feature and step responses after a short delay."""
+
+    def __init__(self, fence=False):
+        self.fence = fence
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    def get_model_name(self):
+        return "test/model"
+
+    async def stream_with_system_prompt(self, system_prompt, user_prompt, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if system_prompt.startswith(GENERATE_FEATURE_FILE_SYSTEM_PROMPT):
+            name = user_prompt.split("User Flow: ")[1].splitlines()[0]
+            response = FEATURE_TEMPLATE.format(name=name)
+        elif system_prompt == GENERATE_SCENARIOS_SYSTEM_PROMPT:
+            response = FEATURE_TEMPLATE.format(name="Home")
+        else:
+            response = "from pytest_bdd import given"
+        if self.fence:
+            response = f"```\n{response}\n```"
+        for start in range(0, len(response), 8):
+            yield response[start : start + 8]
+
+
+async def test_generate_complete_test_suite_runs_flows_concurrently(tmp_path):
+    """Test flows are generated in parallel and files keep flow order."""
+    client = _FlowLLMClient()
+    generator = generator_module.TestGenerator(client)
+    analysis = {
+        "ai_analysis": {"user_flows": [{"name": "Login"}, {"name": "Search"}]},
+        "basic_elements": {},
+    }
+
+    files = await generator.generate_complete_test_suite(
+        "App", "http://localhost", analysis, tmp_path
+    )
+
+    assert_that(client.max_active).is_equal_to(2)
+    assert_that(list(files)).is_equal_to(
+        ["feature_login", "steps_login", "feature_search", "steps_search"]
+    )
+    assert_that(files["feature_login"].read_text()).starts_with("Feature: Login")
+    assert_that(files["steps_search"].read_text()).is_equal_to("from pytest_bdd import given")
+
+
+async def test_flows_with_colliding_file_names_get_distinct_files(tmp_path):
+    """Test flows whose names sanitize alike are written to separate files."""
+    generator = generator_module.TestGenerator(_FlowLLMClient())
+    analysis = {
+        "ai_analysis": {"user_flows": [{"name": "Login / Logout"}, {"name": "Login - Logout"}]},
+        "basic_elements": {},
+    }
+
+    files = await generator.generate_complete_test_suite(
+        "App", "http://localhost", analysis, tmp_path
+    )
+
+    first, second = files["feature_login__logout"], files["feature_login__logout_2"]
+    assert_that(first.read_text()).starts_with("Feature: Login / Logout")
+    assert_that(second.read_text()).starts_with("Feature: Login - Logout")
+
+
+async def test_step_definitions_reuse_cached_response(tmp_path):
+    """Test identical step requests are answered from memory and disk caches."""
+    client = _FlowLLMClient()
+    steps = ["Given I am on the home page"]
+
+    first = generator_module.TestGenerator(client, cache_dir=tmp_path)
+    await first.generate_step_definitions(steps, "http://localhost", [])
+    await first.generate_step_definitions(steps, "http://localhost", [])
+    second = generator_module.TestGenerator(client, cache_dir=tmp_path)
+    code = await second.generate_step_definitions(steps, "http://localhost", [])
+
+    assert_that(client.calls).is_equal_to(1)
+    assert_that(code).is_equal_to("from pytest_bdd import given")
+
+
+async def test_high_temperature_requests_are_not_cached():
+    """Test creative (high temperature) generation always reaches the LLM."""
+    client = _FlowLLMClient()
+    generator = generator_module.TestGenerator(client)
+
+    await generator.generate_feature_file("App", "http://localhost", "Login", [])
+    await generator.generate_feature_file("App", "http://localhost", "Login", [])
+
+    assert_that(client.calls).is_equal_to(2)
+
+
+def test_clean_code_response_strips_fences_and_preamble():
+    """Test markdown fences and chatty lead-ins are removed from code responses."""
+    generator = generator_module.TestGenerator(None)
+    response = "Here is the feature file:\n\n```gherkin\nFeature: Login\n  Scenario: Ok\n```"
+
+    assert_that(generator._clean_code_response(response)).is_equal_to(
+        "Feature: Login\n  Scenario: Ok"
+    )
+
+
+async def test_failed_stream_closes_response_and_leaves_no_file(tmp_path, monkeypatch):
+    """Test a failed write frees the client's request slot and removes the partial file."""
+    client = LLMClient(LLMConfig(provider="openai", model="gpt-4", max_concurrent_requests=1))
+    closed = []
+
+    async def fake_stream():
+        try:
+            for content in ["Feature: ", 5, "never reached"]:  # 5 can't be written as text
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=content))]
+                )
+        finally:
+            closed.append(True)
+
+    async def fake_acompletion(**kwargs):
+        return fake_stream()
+
+    monkeypatch.setattr(client_module, "acompletion", fake_acompletion)
+    generator = generator_module.TestGenerator(client)
+
+    with pytest.raises(TypeError):
+        await generator._stream_response("sys", "user", 0.7, 100, tmp_path / "login.feature")
+
+    assert_that(client._request_slots.locked()).is_false()
+    assert_that(closed).is_equal_to([True])
+    assert_that(list(tmp_path.iterdir())).is_empty()
+
+
+async def test_generate_feature_file_streams_to_output_path(tmp_path):
+    """Test the streamed file ends up holding the cleaned feature."""
+    generator = generator_module.TestGenerator(_FlowLLMClient(fence=True))
+    output_path = tmp_path / "login.feature"
+
+    feature = await generator.generate_feature_file(
+        "App", "http://localhost", "Login", [], output_path=output_path
+    )
+
+    assert_that(feature).starts_with("Feature: Login")
+    assert_that(output_path.read_text()).is_equal_to(feature)
+
+
+def _fixed_feature(feature):
+    """Build a generate_feature_file replacement returning the same feature."""
+
+    async def generate_feature_file(app_name, url, flow_name, elements, output_path=None):
+        output_path.write_text(feature)
+        return feature
+
+    return generate_feature_file
+
+
+async def test_flows_with_same_steps_share_step_definitions(tmp_path):
+    """Test flows yielding the same step set make one step definition request."""
+    client = _FlowLLMClient()
+    generator = generator_module.TestGenerator(client)
+    analysis = {
+        "ai_analysis": {"user_flows": [{"name": "Checkout"}, {"name": "Checkout again"}]},
+        "basic_elements": {},
+    }
+    feature = FEATURE_TEMPLATE.format(name="Checkout")
+    generator.generate_feature_file = _fixed_feature(feature)
+
+    files = await generator.generate_complete_test_suite(
+        "App", "http://localhost", analysis, tmp_path
+    )
+
+    assert_that(client.calls).is_equal_to(1)
+    assert_that(files["steps_checkout_again"].read_text()).is_equal_to(
+        files["steps_checkout"].read_text()
+    )
+
+
+
+def test_extract_steps_from_feature_keeps_first_appearance_order():
+    """Test steps are deduplicated in the order they first appear."""
+    generator = generator_module.TestGenerator(None)
+    feature = FEATURE_TEMPLATE.format(name="Login") + "\n    And I am on the home page"
+
+    assert_that(generator._extract_steps_from_feature(feature)).is_equal_to(
+        [
+            "Given I am on the home page",
+            "When I start Login",
+            "Then I should see the result",
+            "And I am on the home page",
+        ]
+    )
+
+
+async def test_save_feature_file_creates_parent_directories(tmp_path):
+    """Test saving a feature creates missing directories."""
+    generator = generator_module.TestGenerator(None)
+    output_path = tmp_path / "features" / "nested" / "login.feature"
+
+    await generator.save_feature_file("Feature: Login", output_path)
+
+    assert_that(output_path.read_text()).is_equal_to("Feature: Login")
+
+
+def test_sanitize_filename():
+    """Test flow names become lowercase filenames of letters, digits and underscores."""
+    generator = generator_module.TestGenerator(None)
+
+    assert_that(generator._sanitize_filename("User Login (v2)!")).is_equal_to("user_login_v2")
+    assert_that(generator._sanitize_filename("Přihlášení — krok 1")).is_equal_to(
+        "přihlášení__krok_1"
+    )
+
+
+def test_minify_elements_drops_empty_attributes_and_keeps_priority():
+    """Test elements are compacted and low-priority categories go first when over budget."""
+    button = analyzer_module.ElementInfo(
+        tag="button", id="save", name=None, class_=[], type="submit", text="Save",
+        placeholder=None, aria_label=None, data_testid=None, href=None, value=None,
+    )
+    link = {"tag": "a", "id": None, "text": "Docs", "href": "/docs"}
+    elements = {"links": [link] * 50, "buttons": [button]}
+
+    minified = generator_module._minify_elements(elements, budget_tokens=50)
+
+    assert_that(list(minified)).is_equal_to(["buttons", "links"])
+    assert_that(minified["buttons"]).is_equal_to(
+        [{"tag": "button", "id": "save", "type": "submit", "text": "Save"}]
+    )
+    assert_that(len(minified["links"])).is_between(1, 49)
+    assert_that(minified["links"][0]).is_equal_to({"tag": "a", "text": "Docs", "href": "/docs"})
+
+
+def test_minify_analysis_keeps_generation_inputs():
+    """Test raw LLM replies and errors are left out of generation prompts."""
+    analysis = {
+        "url": "http://localhost",
+        "title": "Home",
+        "basic_elements": {},
+        "ai_analysis": {"user_flows": [{"name": "Login"}], "raw_response": "x" * 1000},
+    }
+
+    assert_that(generator_module._minify_analysis(analysis)).is_equal_to(
+        {
+            "url": "http://localhost",
+            "title": "Home",
+            "basic_elements": {},
+            "ai_analysis": {"user_flows": [{"name": "Login"}]},
+        }
+    )
+
+
+async def test_generate_complete_test_suite_without_flows(tmp_path):
+    """Test pages without flows get one cleaned feature and its step definitions."""
+    generator = generator_module.TestGenerator(_FlowLLMClient(fence=True))
+    analysis = {"title": "Home", "ai_analysis": {}, "basic_elements": {}}
+
+    files = await generator.generate_complete_test_suite(
+        "App", "http://localhost/shop/cart", analysis, tmp_path
+    )
+
+    assert_that(files["feature"].name).is_equal_to("shop_cart.feature")
+    assert_that(files["feature"].read_text()).starts_with("Feature:")
+    assert_that(files["steps"].read_text()).is_equal_to("from pytest_bdd import given")
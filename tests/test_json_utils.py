@@ -0,0 +1,46 @@
+"""Tests for JSON helpers."""
+
+import json
+
+import pytest
+from assertpy import assert_that
+
+from frontend_tester.ai.analyzer import ElementInfo, json_default
+from frontend_tester.core import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson" and json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+def test_dumps_indent_matches_stdlib(backend):
+    """Test indented output matches json.dumps(indent=2)."""
+    data = {"url": "http://localhost/čeština", "items": [1, {"a": None}], "empty": []}
+
+    assert_that(json_utils.dumps(data, indent=True).decode()).is_equal_to(
+        json.dumps(data, indent=2, ensure_ascii=False)
+    )
+
+
+def test_dumps_uses_default_for_dataclasses(backend):
+    """Test dataclasses are serialized through the default hook."""
+    info = ElementInfo(
+        tag="a", id="", name="", class_=["nav"], type="", text="Home",
+        placeholder="", aria_label="", data_testid="", href="/", value="",
+    )
+
+    data = json_utils.loads(json_utils.dumps({"links": [info]}, default=json_default))
+
+    assert_that(data["links"][0]).contains_entry({"class": ["nav"]})
+    assert_that(data["links"][0]).does_not_contain_key("class_", "options")
+
+
+def test_loads_invalid_json_raises_decode_error(backend):
+    """Test invalid JSON raises json.JSONDecodeError with either backend."""
+    assert_that(json_utils.loads).raises(json.JSONDecodeError).when_called_with("not json")
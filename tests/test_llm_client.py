@@ -1,9 +1,15 @@
 """Tests for LLM client."""
 
+import asyncio
 import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
 from assertpy import assert_that
 
+from frontend_tester.ai import client as client_module
 from frontend_tester.ai.client import LLMClient
 from frontend_tester.core.config import LLMConfig
 
@@ -58,6 +64,51 @@ def test_llm_client_anthropic_model_name():
     assert_that(model_name).is_equal_to("anthropic/claude-3-opus-20240229")
 
 
+def test_llm_client_max_output_tokens(monkeypatch):
+    """Test the output limit comes from LiteLLM's model map, with a default when unmapped."""
+    limits = {"gpt-4": {"max_output_tokens": 8192}}
+
+    def fake_get_model_info(model):
+        if model not in limits:
+            raise ValueError(model)
+        return limits[model]
+
+    monkeypatch.setattr(client_module.litellm, "get_model_info", fake_get_model_info)
+
+    mapped = LLMClient(LLMConfig(provider="openai", model="gpt-4"))
+    unmapped = LLMClient(LLMConfig(provider="openai", model="in-house-model"))
+
+    assert_that(mapped.get_max_output_tokens()).is_equal_to(8192)
+    assert_that(unmapped.get_max_output_tokens()).is_equal_to(
+        client_module._DEFAULT_MAX_OUTPUT_TOKENS
+    )
+
+
+def test_llm_client_anthropic_cache_hints():
+    """Test Anthropic system prompts are marked as cacheable prefixes."""
+    client = LLMClient(LLMConfig(provider="anthropic", model="claude-3-opus-20240229"))
+    messages = [
+        {"role": "system", "content": "You are a tester."},
+        {"role": "user", "content": "Analyze this page."},
+    ]
+
+    hinted = client._with_cache_hints(messages)
+
+    assert_that(hinted[0]["content"]).is_equal_to(
+        [{"type": "text", "text": "You are a tester.", "cache_control": {"type": "ephemeral"}}]
+    )
+    assert_that(hinted[1]).is_equal_to(messages[1])
+
+
+def test_llm_client_openai_messages_unchanged():
+    """Test OpenAI messages are sent without cache hints."""
+    client = LLMClient(LLMConfig(provider="openai", model="gpt-4"))
+    messages = [{"role": "system", "content": "You are a tester."}]
+
+    assert_that(client._with_cache_hints(messages)).is_equal_to(messages)
+
+
+@pytest.mark.integration
 @pytest.mark.asyncio
 async def test_llm_client_chat(llm_client):
     """Test async chat completion."""
@@ -74,6 +125,7 @@ async def test_llm_client_chat(llm_client):
     assert_that(response.lower()).contains("hello")
 
 
+@pytest.mark.integration
 def test_llm_client_chat_sync(llm_client):
     """Test synchronous chat completion."""
     messages = [
@@ -89,6 +141,7 @@ def test_llm_client_chat_sync(llm_client):
     assert_that(response.lower()).contains("hello")
 
 
+@pytest.mark.integration
 @pytest.mark.asyncio
 async def test_llm_client_generate_with_system_prompt(llm_client):
     """Test generation with system and user prompts."""
@@ -106,6 +159,7 @@ async def test_llm_client_generate_with_system_prompt(llm_client):
     assert_that(response.strip()).contains("4")
 
 
+@pytest.mark.integration
 def test_llm_client_generate_with_system_prompt_sync(llm_client):
     """Test synchronous generation with system and user prompts."""
     system_prompt = "You are a helpful assistant that responds with single words."
@@ -122,6 +176,7 @@ def test_llm_client_generate_with_system_prompt_sync(llm_client):
     assert_that(response.strip()).contains("4")
 
 
+@pytest.mark.integration
 @pytest.mark.asyncio
 async def test_llm_client_with_custom_params(llm_client):
     """Test chat with custom temperature and max_tokens."""
@@ -140,3 +195,143 @@ async def test_llm_client_with_custom_params(llm_client):
     assert_that(response).is_instance_of(str)
     # Response should be short due to max_tokens limit
     assert_that(len(response)).is_less_than(100)
+
+
+def _fake_response(content):
+    """Build a minimal LiteLLM-style completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.mark.asyncio
+async def test_llm_client_chat_mocked(monkeypatch):
+    """Test chat sends the model name and falls back to configured parameters."""
+    client = LLMClient(LLMConfig(provider="anthropic", model="claude-3-opus-20240229"))
+    calls = []
+
+    async def fake_acompletion(**kwargs):
+        calls.append(kwargs)
+        return _fake_response("hello")
+
+    monkeypatch.setattr(client_module, "acompletion", fake_acompletion)
+
+    response = await client.chat([{"role": "user", "content": "Hi"}], temperature=0.1)
+
+    assert_that(response).is_equal_to("hello")
+    assert_that(calls[0]["model"]).is_equal_to("anthropic/claude-3-opus-20240229")
+    assert_that(calls[0]["temperature"]).is_equal_to(0.1)
+    assert_that(calls[0]["max_tokens"]).is_equal_to(client.config.max_tokens)
+
+
+def test_llm_client_chat_sync_mocked(monkeypatch):
+    """Test chat_sync returns the completion content."""
+    client = LLMClient(LLMConfig(provider="openai", model="gpt-4"))
+    calls = []
+
+    def fake_completion(**kwargs):
+        calls.append(kwargs)
+        return _fake_response("hello")
+
+    monkeypatch.setattr(client_module, "completion", fake_completion)
+
+    response = client.chat_sync([{"role": "user", "content": "Hi"}], max_tokens=10)
+
+    assert_that(response).is_equal_to("hello")
+    assert_that(calls[0]["model"]).is_equal_to("gpt-4")
+    assert_that(calls[0]["max_tokens"]).is_equal_to(10)
+
+
+@pytest.mark.asyncio
+async def test_llm_client_generate_with_system_prompt_mocked(monkeypatch):
+    """Test system and user prompts are sent as one two-message chat."""
+    client = LLMClient(LLMConfig(provider="openai", model="gpt-4"))
+    chat = AsyncMock(return_value="4")
+    monkeypatch.setattr(client, "chat", chat)
+
+    response = await client.generate_with_system_prompt("Be brief.", "What is 2+2?")
+
+    assert_that(response).is_equal_to("4")
+    assert_that(chat.await_args.args[0]).is_equal_to(
+        [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "What is 2+2?"},
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_llm_client_limits_concurrent_requests(monkeypatch):
+    """Test no more than max_concurrent_requests completions are in flight."""
+    client = LLMClient(LLMConfig(provider="openai", model="gpt-4", max_concurrent_requests=2))
+    in_flight = []
+    peak = []
+
+    async def fake_acompletion(**kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))]
+        )
+
+    monkeypatch.setattr(client_module, "acompletion", fake_acompletion)
+
+    responses = await asyncio.gather(
+        *(client.generate_with_system_prompt("sys", prompt) for prompt in "abcde")
+    )
+
+    assert_that(responses).is_equal_to(["ok"] * 5)
+    assert_that(max(peak)).is_equal_to(2)
+
+
+class _FakeStreamResponse:
+    """Streaming completion stand-in that records whether it was closed."""
+
+    def __init__(self, fragments):
+        self.fragments = list(fragments)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.fragments:
+            raise StopAsyncIteration
+        content = self.fragments.pop(0)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_llm_client_stream_closed_early_releases_slot(monkeypatch):
+    """Test closing a stream early frees its request slot and closes the response."""
+    client = LLMClient(LLMConfig(provider="openai", model="gpt-4", max_concurrent_requests=1))
+    response = _FakeStreamResponse(["Sure", "! Here", " is"])
+
+    async def fake_acompletion(**kwargs):
+        return response
+
+    monkeypatch.setattr(client_module, "acompletion", fake_acompletion)
+
+    stream = client.stream_with_system_prompt("sys", "user")
+    assert_that(await anext(stream)).is_equal_to("Sure")
+    assert_that(client._request_slots.locked()).is_true()
+
+    await stream.aclose()
+
+    assert_that(client._request_slots.locked()).is_false()
+    assert_that(response.closed).is_true()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests_beyond_the_burst():
+    """Test requests past the bucket size wait for it to refill."""
+    limiter = client_module._RateLimiter(2, period=0.2)
+
+    started = time.monotonic()
+    throttled = [await limiter.acquire() for _ in range(3)]
+
+    assert_that(throttled).is_equal_to([False, False, True])
+    assert_that(time.monotonic() - started).is_greater_than_or_equal_to(0.09)
@@ -1,67 +1,94 @@
 """Tests for project management."""
 
-import tempfile
-from pathlib import Path
+import os
 from assertpy import assert_that
 
-from frontend_tester.core.project import create_project_structure, find_project_root
+from frontend_tester.core.project import clear_project_root_cache, find_project_root
+from frontend_tester.core.project_scaffold import create_project_config, create_project_structure
 from frontend_tester.core.config import ProjectConfig
 
 
-def test_create_project_structure():
+def _tree(root):
+    """Collect the relative paths of all directories and files under root."""
+    paths = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = os.path.relpath(dirpath, root)
+        for name in dirnames + filenames:
+            paths.add(name if rel == "." else f"{rel}/{name}")
+    return paths
+
+
+def test_create_project_structure(tmp_path):
     """Test creating project structure."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-        config = ProjectConfig(name="test-project")
-
-        create_project_structure(project_path, config)
-
-        # Check .frontend-tester directories exist (for generated content)
-        frontend_tester_dir = project_path / ".frontend-tester"
-        assert_that(frontend_tester_dir.exists()).is_true()
-        assert_that((frontend_tester_dir / "features").exists()).is_true()
-        assert_that((frontend_tester_dir / "steps").exists()).is_true()
-        assert_that((frontend_tester_dir / "support").exists()).is_true()
-        assert_that((frontend_tester_dir / "baselines").exists()).is_true()
-        assert_that((frontend_tester_dir / "reports").exists()).is_true()
-
-        # Check .frontend-tester files exist
-        assert_that((frontend_tester_dir / "config.yaml").exists()).is_true()
-        assert_that((frontend_tester_dir / "README.md").exists()).is_true()
-
-        # Check TEST_DIR directories exist (for examples)
-        test_dir = project_path / "TEST_DIR"
-        assert_that(test_dir.exists()).is_true()
-        assert_that((test_dir / "features").exists()).is_true()
-        assert_that((test_dir / "steps").exists()).is_true()
-        assert_that((test_dir / "support").exists()).is_true()
-
-        # Check TEST_DIR files exist
-        assert_that((test_dir / "features" / "example.feature").exists()).is_true()
-        assert_that((test_dir / "features" / "test_features.py").exists()).is_true()
-        assert_that((test_dir / "steps" / "test_common_steps.py").exists()).is_true()
-        assert_that((test_dir / "support" / "browser.py").exists()).is_true()
-        assert_that((test_dir / "conftest.py").exists()).is_true()
-        assert_that((test_dir / "README.md").exists()).is_true()
-
-
-def test_find_project_root():
+    project_path = tmp_path
+    config = ProjectConfig(name="test-project")
+
+    create_project_structure(project_path, config)
+
+    # Check .frontend-tester directories and files exist (for generated content)
+    assert_that(_tree(project_path / ".frontend-tester")).contains(
+        "features", "steps", "support", "baselines", "reports", "config.yaml", "README.md"
+    )
+
+    # Check TEST_DIR directories and files exist (for examples)
+    assert_that(_tree(project_path / "TEST_DIR")).contains(
+        "features",
+        "steps",
+        "support",
+        "features/example.feature",
+        "features/test_features.py",
+        "steps/test_common_steps.py",
+        "support/browser.py",
+        "conftest.py",
+        "README.md",
+    )
+
+
+def test_find_project_root(tmp_path, tmp_path_factory):
     """Test finding project root."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_path = Path(tmpdir)
-        config = ProjectConfig(name="test")
+    project_path = tmp_path
+    config = ProjectConfig(name="test")
+
+    # Create project
+    create_project_structure(project_path, config)
+
+    # Should find from project root
+    assert_that(find_project_root(project_path)).is_equal_to(project_path)
+
+    # Should find from subdirectory
+    subdir = project_path / "subdir"
+    subdir.mkdir()
+    assert_that(find_project_root(subdir)).is_equal_to(project_path)
+
+    # Should return None if not in project
+    other_dir = tmp_path_factory.mktemp("other")
+    assert_that(find_project_root(other_dir)).is_none()
+
+
+def test_find_project_root_cache(tmp_path):
+    """Test remembered roots are re-checked and misses aren't remembered."""
+    subdir = tmp_path / "a" / "b"
+    subdir.mkdir(parents=True)
+    clear_project_root_cache()
+
+    # A miss is retried, so a project created afterwards is found
+    assert_that(find_project_root(subdir)).is_none()
+    (tmp_path / ".frontend-tester").mkdir()
+    assert_that(find_project_root(subdir)).is_equal_to(tmp_path)
+    assert_that(find_project_root(subdir)).is_equal_to(tmp_path)
+
+    # A remembered root that stopped being a project is looked up again
+    (tmp_path / ".frontend-tester").rmdir()
+    assert_that(find_project_root(subdir)).is_none()
 
-        # Create project
-        create_project_structure(project_path, config)
 
-        # Should find from project root
-        assert_that(find_project_root(project_path)).is_equal_to(project_path)
+def test_create_project_config_forgets_outer_roots(tmp_path):
+    """Test a project created inside a remembered project is found afterwards."""
+    inner = tmp_path / "inner"
+    inner.mkdir()
+    (tmp_path / ".frontend-tester").mkdir()
+    assert_that(find_project_root(inner)).is_equal_to(tmp_path)
 
-        # Should find from subdirectory
-        subdir = project_path / "subdir"
-        subdir.mkdir()
-        assert_that(find_project_root(subdir)).is_equal_to(project_path)
+    create_project_config(inner, ProjectConfig(name="inner"))
 
-        # Should return None if not in project
-        other_dir = Path(tempfile.mkdtemp())
-        assert_that(find_project_root(other_dir)).is_none()
+    assert_that(find_project_root(inner)).is_equal_to(inner)
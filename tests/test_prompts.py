@@ -0,0 +1,49 @@
+"""Tests for prompt template compilation."""
+
+import pytest
+from assertpy import assert_that
+
+from frontend_tester.ai.prompts import compile_prompt
+from frontend_tester.ai.prompts.test_generation import (
+    GENERATE_FEATURE_FILE_USER_PROMPT,
+    render_generate_feature_file_user_prompt,
+)
+from frontend_tester.ai.prompts.ui_analysis import (
+    ANALYZE_UI_USER_PROMPT,
+    render_analyze_ui_user_prompt,
+)
+
+
+def test_compile_prompt_matches_format():
+    """Test compiled templates render exactly like str.format."""
+    template = '{{"key": "{value}"}} at {url}{title}'
+    render = compile_prompt(template)
+
+    assert_that(render(value="v", url="http://localhost", title="!")).is_equal_to(
+        template.format(value="v", url="http://localhost", title="!")
+    )
+
+
+def test_render_analyze_ui_user_prompt():
+    """Test the precompiled UI analysis prompt matches the template."""
+    values = {"url": "http://localhost:3000", "title": "Home", "html": "<p>{braces}</p>"}
+
+    assert_that(render_analyze_ui_user_prompt(**values)).is_equal_to(
+        ANALYZE_UI_USER_PROMPT.format(**values)
+    )
+
+
+def test_generation_prompts_end_with_request_data():
+    """Test request-specific fields come after the static, cacheable instructions."""
+    values = {"app_name": "App", "url": "http://localhost:3000", "flow_name": "Login"}
+    prompt = render_generate_feature_file_user_prompt(**values)
+
+    assert_that(prompt).is_equal_to(GENERATE_FEATURE_FILE_USER_PROMPT.format(**values))
+    assert_that(prompt).ends_with("User Flow: Login")
+    assert_that(prompt.index("Include:")).is_less_than(prompt.index("App"))
+
+
+@pytest.mark.parametrize("template", ["{0}", "{}", "{name!r}", "{name:>10}"])
+def test_compile_prompt_rejects_unsupported_placeholders(template):
+    """Test placeholders beyond plain named fields are rejected."""
+    assert_that(compile_prompt).raises(ValueError).when_called_with(template)